@@ -4,9 +4,10 @@ Damage System Components
 Implements multi-layered damage types and damage calculation mechanics.
 """
 
+import random
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from core.ecs.component import BaseComponent
 
 
@@ -28,6 +29,57 @@ class DamageResult:
     target_unit_id: Optional[int] = None
 
 
+def resolve_damage(base_damage: int, target_defense: int, penetration: int,
+                   crit_roll: float, critical_chance: float) -> Tuple[int, bool]:
+    """
+    Core damage arithmetic on plain numbers.
+    
+    Kept free of component and enum access so the per-attack math is a
+    single flat function call.
+    
+    Args:
+        base_damage: Attack power for the attack type
+        target_defense: Target's defense value for the attack type
+        penetration: Attacker's armor penetration
+        crit_roll: Random roll in [0, 1) compared against critical_chance
+        critical_chance: Chance for critical hits (0.0-1.0)
+        
+    Returns:
+        Tuple of (final damage, critical hit flag)
+    """
+    # Apply penetration to reduce effective defense
+    effective_defense = max(0, target_defense - penetration)
+    
+    # Use hybrid damage formula to prevent zero damage
+    if base_damage >= effective_defense:
+        final_damage = base_damage * 2 - effective_defense
+    elif effective_defense > 0:
+        final_damage = (base_damage * base_damage) / effective_defense
+    else:
+        final_damage = base_damage
+    
+    # Apply additional penetration scaling
+    if effective_defense > 0:
+        penetration_factor = final_damage / (final_damage + effective_defense)
+        final_damage = final_damage * penetration_factor
+    
+    # Check for critical hit
+    is_critical = crit_roll < critical_chance
+    if is_critical:
+        final_damage *= 2.0
+    
+    # Ensure minimum damage of 1
+    return max(1, int(final_damage)), is_critical
+
+
+# Attribute holding the attack power for each attack type
+_POWER_ATTRIBUTES = {
+    AttackType.PHYSICAL: 'physical_power',
+    AttackType.MAGICAL: 'magical_power',
+    AttackType.SPIRITUAL: 'spiritual_power'
+}
+
+
 class DamageComponent(BaseComponent):
     """
     Component for units that can deal damage.
@@ -60,12 +112,7 @@ class DamageComponent(BaseComponent):
     
     def get_attack_power(self, attack_type: AttackType) -> int:
         """Get attack power for specified attack type"""
-        power_map = {
-            AttackType.PHYSICAL: self.physical_power,
-            AttackType.MAGICAL: self.magical_power,
-            AttackType.SPIRITUAL: self.spiritual_power
-        }
-        return power_map[attack_type]
+        return getattr(self, _POWER_ATTRIBUTES[attack_type])
     
     def calculate_damage(self, attack_type: AttackType, target_defense: int) -> DamageResult:
         """
@@ -83,34 +130,10 @@ class DamageComponent(BaseComponent):
         Returns:
             DamageResult with calculated damage
         """
-        import random
-        
-        base_damage = self.get_attack_power(attack_type)
-        
-        # Apply penetration to reduce effective defense
-        effective_defense = max(0, target_defense - self.penetration)
-        
-        # Use hybrid damage formula to prevent zero damage
-        if base_damage >= effective_defense:
-            final_damage = base_damage * 2 - effective_defense
-        else:
-            if effective_defense > 0:
-                final_damage = (base_damage * base_damage) / effective_defense
-            else:
-                final_damage = base_damage
-        
-        # Apply additional penetration scaling
-        if effective_defense > 0:
-            penetration_factor = final_damage / (final_damage + effective_defense)
-            final_damage = final_damage * penetration_factor
-        
-        # Check for critical hit
-        is_critical = random.random() < self.critical_chance
-        if is_critical:
-            final_damage *= 2.0
-        
-        # Ensure minimum damage of 1
-        final_damage = max(1, int(final_damage))
+        final_damage, is_critical = resolve_damage(
+            self.get_attack_power(attack_type), target_defense, self.penetration,
+            random.random(), self.critical_chance
+        )
         
         return DamageResult(
             damage=final_damage,
@@ -58,12 +58,14 @@ class DefenseComponent(BaseComponent):
         Returns:
             Total defense value including base defense and bonuses
         """
-        defense_map = {
-            AttackType.PHYSICAL: self.physical_defense + self.armor_rating,
-            AttackType.MAGICAL: self.magical_defense + self.magic_resistance,
-            AttackType.SPIRITUAL: self.spiritual_defense + self.spiritual_ward
-        }
-        return max(0, defense_map[attack_type])
+        # Only the requested layer is summed; no per-call lookup table
+        if attack_type is AttackType.PHYSICAL:
+            total = self.physical_defense + self.armor_rating
+        elif attack_type is AttackType.MAGICAL:
+            total = self.magical_defense + self.magic_resistance
+        else:
+            total = self.spiritual_defense + self.spiritual_ward
+        return max(0, total)
     
     def add_armor_bonus(self, physical: int = 0, magical: int = 0, spiritual: int = 0):
         """Add armor bonuses from equipment or modifiers"""
@@ -4,11 +4,20 @@ Equipment Manager Component
 Manages equipped items and applies their bonuses to units.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 from core.ecs.component import BaseComponent
 from .equipment import EquipmentComponent, EquipmentType, EquipmentStats
 
 
+@dataclass(slots=True)
+class EquipmentSummaryView:
+    """Reusable equipment summary filled in place by EquipmentManager"""
+    total_value: int = 0
+    special_abilities: List[str] = field(default_factory=list)
+    equipped_items: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
 class EquipmentManager(BaseComponent):
     """
     Component for managing a unit's equipped items.
@@ -26,6 +35,9 @@ class EquipmentManager(BaseComponent):
         # Cached total bonuses (recalculated when equipment changes)
         self._cached_bonuses: Optional[EquipmentStats] = None
         self._bonuses_dirty = True
+        
+        # Summary view reused by get_summary_view
+        self._summary_view = EquipmentSummaryView()
     
     def equip_item(self, equipment: EquipmentComponent) -> bool:
         """
@@ -222,6 +234,32 @@ class EquipmentManager(BaseComponent):
             }
         }
     
+    def get_summary_view(self, view: Optional[EquipmentSummaryView] = None) -> EquipmentSummaryView:
+        """
+        Fill a lightweight equipment summary in place.
+        
+        Covers the display fields of get_equipment_summary (value, abilities,
+        equipped item info) without the bonus and condition breakdowns.
+        
+        Args:
+            view: View to fill; defaults to this manager's own reusable view
+            
+        Returns:
+            The filled view
+        """
+        if view is None:
+            view = self._summary_view
+        
+        view.total_value = self.calculate_equipment_value()
+        view.special_abilities[:] = self.get_all_special_abilities()
+        
+        equipped = view.equipped_items
+        equipped.clear()
+        for eq_type, equipment in self.equipped_items.items():
+            equipped[eq_type.value] = equipment.get_equipment_info()
+        
+        return view
+    
     def to_dict(self):
         """Serialize component to dictionary"""
         base_dict = super().to_dict()
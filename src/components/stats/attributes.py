@@ -13,6 +13,42 @@ from dataclasses import dataclass
 
 from core.ecs.component import BaseComponent
 
+
+class DerivedStats(dict):
+    """
+    Read-only mapping of derived stat values.
+    
+    AttributeStats hands out the same instance until it recalculates, so
+    reads are not copied; writes raise TypeError instead of corrupting the
+    cache. Values are also available as attributes (derived.hp).
+    """
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name: str) -> int:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    
+    def __reduce__(self):
+        return (DerivedStats, (dict(self),))
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("derived stats are read-only; change the attributes instead")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+# Base attributes the derived stats are calculated from
+ATTRIBUTE_NAMES = frozenset((
+    'strength', 'fortitude', 'finesse',
+    'wisdom', 'wonder', 'worthy',
+    'faith', 'spirit', 'speed'
+))
+
+
 @dataclass
 class AttributeStats(BaseComponent):
     """
@@ -44,7 +80,7 @@ class AttributeStats(BaseComponent):
         self.speed = speed            # Movement, action speed
         
         # Cache for derived stats (performance optimization)
-        self._derived_cache: Dict[str, int] = {}
+        self._derived_cache = DerivedStats()
         self._cache_timestamp = 0.0
         self._cache_valid = False
         
@@ -52,25 +88,32 @@ class AttributeStats(BaseComponent):
         self._current_hp = None
         self._current_mp = None
     
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        
+        # Any base attribute assignment, direct or through modify_attribute,
+        # invalidates the derived stat cache
+        if name in ATTRIBUTE_NAMES:
+            object.__setattr__(self, '_cache_valid', False)
+    
     @property
-    def derived_stats(self) -> Dict[str, int]:
+    def derived_stats(self) -> DerivedStats:
         """
         Calculate all derived stats with caching for performance.
         
         Target: <1ms for complex character sheets
         
         Returns:
-            Dictionary of derived stat values
+            Read-only mapping of derived stat values, shared between reads
+            until the stats are recalculated
         """
-        current_time = time.time()
-        
-        # Use cache if valid and recent (within 100ms)
-        if (self._cache_valid and 
-            current_time - self._cache_timestamp < 0.1):
-            return self._derived_cache.copy()
+        # Attribute assignments invalidate the cache, so it never goes stale
+        if self._cache_valid:
+            return self._derived_cache
         
-        # Recalculate derived stats
-        self._derived_cache = {
+        # Recalculate derived stats into a new mapping so holders of the
+        # previous one can detect the change by identity
+        self._derived_cache = DerivedStats({
             # Health and mana pools
             'hp': self.fortitude * 10 + self.strength * 2,
             'mp': self.wisdom * 8 + self.wonder * 3,
@@ -103,12 +146,12 @@ class AttributeStats(BaseComponent):
             'spell_slots': int(self.wisdom / 3) + int(self.wonder / 4) + 1,
             'critical_chance': int(self.finesse * 0.8 + self.worthy * 0.5),
             'mental_resistance': int(self.wisdom * 0.7 + self.worthy * 0.9 + self.spirit * 0.6)
-        }
+        })
         
-        self._cache_timestamp = current_time
+        self._cache_timestamp = time.time()
         self._cache_valid = True
         
-        return self._derived_cache.copy()
+        return self._derived_cache
     
     @property
     def max_hp(self) -> int:
@@ -194,6 +237,31 @@ class AttributeStats(BaseComponent):
         """Mark derived stat cache as invalid"""
         self._cache_valid = False
     
+    def reset(self, 
+              strength: int = 10, fortitude: int = 10, finesse: int = 10,
+              wisdom: int = 10, wonder: int = 10, worthy: int = 10,
+              faith: int = 10, spirit: int = 10, speed: int = 10):
+        """Reinitialize attributes in place for reuse from a pool"""
+        BaseComponent.__init__(self)
+        
+        self.strength = strength
+        self.fortitude = fortitude
+        self.finesse = finesse
+        self.wisdom = wisdom
+        self.wonder = wonder
+        self.worthy = worthy
+        self.faith = faith
+        self.spirit = spirit
+        self.speed = speed
+        
+        # The old mapping may still be held by the previous owner's readers
+        self._derived_cache = DerivedStats()
+        self._cache_timestamp = 0.0
+        self._cache_valid = False
+        
+        self._current_hp = None
+        self._current_mp = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize component to dictionary"""
         base_dict = super().to_dict()
@@ -210,7 +278,7 @@ class AttributeStats(BaseComponent):
             'speed': self.speed,
             
             # Include derived stats for completeness
-            'derived_stats': self.derived_stats,
+            'derived_stats': dict(self.derived_stats),
             
             # Current health and mana
             'current_hp': self.current_hp,
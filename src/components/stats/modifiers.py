@@ -5,7 +5,8 @@ Implements advanced buff/debuff mechanics with sophisticated stacking rules
 from Advanced-Implementation-Guide.md
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
+import sys
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -58,7 +59,9 @@ class Modifier:
                  modifier_id: str = None):
         
         self.modifier_id = modifier_id or str(uuid.uuid4())
-        self.stat_name = stat_name
+        # Interned so names built at runtime or loaded from saves share one
+        # object and index lookups compare by identity
+        self.stat_name = sys.intern(stat_name)
         self.modifier_type = modifier_type
         self.value = value
         self.source = source
@@ -72,6 +75,12 @@ class Modifier:
         self.expires_at = self.created_at + duration if duration > 0 else 0.0
         self.active = True
     
+    def restart(self):
+        """Reactivate modifier and restart its duration from now, keeping its ID"""
+        self.created_at = time.time()
+        self.expires_at = self.created_at + self.duration if self.duration > 0 else 0.0
+        self.active = True
+    
     @property
     def is_expired(self) -> bool:
         """Check if modifier has expired"""
@@ -166,10 +175,16 @@ class ModifierManager(BaseComponent):
         super().__init__()
         
         self.modifiers: List[Modifier] = []
-        self.modifier_cache: Dict[str, float] = {}  # stat_name -> final_modifier
+        # stat_name -> modifiers in self.modifiers for that stat, in insertion order
+        self._by_stat: Dict[str, List[Modifier]] = {}
+        # stat_name -> (specialized apply function, time it stays valid until)
+        self.modifier_cache: Dict[str, Tuple[Callable[[int], int], float]] = {}
         self.cache_timestamp = 0.0
         self.cache_valid = False
         
+        # Bumped whenever the set of active modifiers changes
+        self.version = 0
+        
         # Performance tracking
         self.calculation_count = 0
         self.last_calculation_time = 0.0
@@ -184,9 +199,37 @@ class ModifierManager(BaseComponent):
         Returns:
             True if modifier was added successfully
         """
+        if not self._insert_modifier(modifier):
+            return False
+        self._invalidate_cache()
+        return True
+    
+    def add_modifiers_bulk(self, modifiers: Iterable[Modifier]) -> int:
+        """
+        Add several modifiers, invalidating the stat cache once at the end.
+        
+        Stacking rules apply to each modifier in order, exactly as if
+        add_modifier had been called for each.
+        
+        Args:
+            modifiers: Modifiers to add
+            
+        Returns:
+            Number of modifiers added
+        """
+        added = 0
+        for modifier in modifiers:
+            if self._insert_modifier(modifier):
+                added += 1
+        if added:
+            self._invalidate_cache()
+        return added
+    
+    def _insert_modifier(self, modifier: Modifier) -> bool:
+        """Apply stacking rules and append modifier without touching the cache"""
         # Check for stacking conflicts
-        existing_modifiers = [m for m in self.modifiers 
-                            if m.stat_name == modifier.stat_name and m.active]
+        existing_modifiers = [m for m in self._by_stat.get(modifier.stat_name, ())
+                              if m.active]
         
         # Handle stacking rules
         if modifier.stacking_rule == StackingRule.NONE:
@@ -225,10 +268,18 @@ class ModifierManager(BaseComponent):
                     return False  # Don't add higher value modifier
         
         # Add the modifier
-        self.modifiers.append(modifier)
-        self._invalidate_cache()
+        self._append_modifier(modifier)
         return True
     
+    def _append_modifier(self, modifier: Modifier):
+        """Add modifier to the list and the per-stat index"""
+        self.modifiers.append(modifier)
+        stat_modifiers = self._by_stat.get(modifier.stat_name)
+        if stat_modifiers is None:
+            self._by_stat[modifier.stat_name] = [modifier]
+        else:
+            stat_modifiers.append(modifier)
+    
     def remove_modifier(self, modifier_id: str) -> bool:
         """
         Remove modifier by ID.
@@ -267,6 +318,19 @@ class ModifierManager(BaseComponent):
         
         return removed_count
     
+    def clear_all_modifiers(self) -> int:
+        """
+        Remove every modifier.
+        
+        Returns:
+            Number of active modifiers that were removed
+        """
+        removed_count = sum(1 for modifier in self.modifiers if modifier.active)
+        self.modifiers.clear()
+        self._by_stat.clear()
+        self._invalidate_cache()
+        return removed_count
+    
     def update(self, delta_time: float):
         """
         Update modifiers and remove expired ones.
@@ -300,66 +364,104 @@ class ModifierManager(BaseComponent):
         Returns:
             Final stat value with modifiers
         """
+        # Use the cached apply function until an included modifier expires
+        cached = self.modifier_cache.get(stat_name)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0](base_stat)
+        
         calculation_start = time.perf_counter()
         
-        # Use cache if valid
-        if self.cache_valid and stat_name in self.modifier_cache:
-            cached_modifier = self.modifier_cache[stat_name]
-            result = int(base_stat + cached_modifier)
-            return max(0, result)  # Ensure non-negative
+        apply, valid_until = self._compile_stat(stat_name)
+        self.modifier_cache[stat_name] = (apply, valid_until)
+        self.cache_valid = True
         
-        # Get active modifiers for this stat
-        active_modifiers = [m for m in self.modifiers 
-                          if m.stat_name == stat_name and m.active and not m.is_expired]
+        # Performance tracking
+        self.calculation_count += 1
+        self.last_calculation_time = time.perf_counter()
+        calculation_time = self.last_calculation_time - calculation_start
         
-        # Sort by priority (higher priority first)
-        active_modifiers.sort(key=lambda m: m.priority, reverse=True)
+        # Warn if calculation is slow
+        if calculation_time > 0.001:  # 1ms target
+            from core.utils.logging import Logger
+            Logger.warning(f"Slow modifier calculation: {calculation_time*1000:.2f}ms for {stat_name}")
         
-        # Apply modifiers in order
-        final_value = float(base_stat)
+        return apply(base_stat)
+    
+    def _compile_stat(self, stat_name: str) -> Tuple[Callable[[int], int], float]:
+        """
+        Build an apply function specialized to the active modifiers of one stat.
         
-        # Apply flat modifiers first
-        flat_total = sum(m.value for m in active_modifiers 
-                        if m.modifier_type == ModifierType.FLAT)
-        final_value += flat_total
+        Modifier totals are folded into constants and the function only
+        contains the steps those modifiers need, so repeated calculations
+        skip the per-modifier loop and type checks.
         
-        # Apply percentage modifiers
-        percentage_total = sum(m.value for m in active_modifiers 
-                             if m.modifier_type == ModifierType.PERCENTAGE)
-        final_value *= (1.0 + percentage_total)
+        Args:
+            stat_name: Name of stat to compile
+            
+        Returns:
+            Tuple of (apply function taking the base stat, time until which
+            it is valid because no included modifier has expired)
+        """
+        # Get active modifiers for this stat
+        active_modifiers = self.get_modifiers_for_stat(stat_name)
         
-        # Apply multiplicative modifiers
-        for modifier in active_modifiers:
-            if modifier.modifier_type == ModifierType.MULTIPLICATIVE:
-                final_value *= modifier.value
+        # Sort by priority (higher priority first)
+        active_modifiers.sort(key=lambda m: m.priority, reverse=True)
+        
+        valid_until = min((m.expires_at for m in active_modifiers if m.duration > 0),
+                          default=float('inf'))
         
         # Handle set value modifiers (highest priority wins)
         set_value_modifiers = [m for m in active_modifiers 
                              if m.modifier_type == ModifierType.SET_VALUE]
         if set_value_modifiers:
             highest_priority = max(set_value_modifiers, key=lambda m: m.priority)
-            final_value = highest_priority.value
-        
-        # Cache the result
-        total_modifier = final_value - base_stat
-        self.modifier_cache[stat_name] = total_modifier
+            set_result = max(0, int(highest_priority.value))
+            return (lambda base_stat: set_result), valid_until
         
-        # Performance tracking
-        self.calculation_count += 1
-        self.last_calculation_time = time.perf_counter()
-        calculation_time = self.last_calculation_time - calculation_start
+        # Flat modifiers apply first, then percentage, then multiplicative
+        flat_total = sum(m.value for m in active_modifiers 
+                        if m.modifier_type == ModifierType.FLAT)
+        percentage_total = sum(m.value for m in active_modifiers 
+                             if m.modifier_type == ModifierType.PERCENTAGE)
+        multipliers = tuple(m.value for m in active_modifiers 
+                            if m.modifier_type == ModifierType.MULTIPLICATIVE)
         
-        # Warn if calculation is slow
-        if calculation_time > 0.001:  # 1ms target
-            from core.utils.logging import Logger
-            Logger.warning(f"Slow modifier calculation: {calculation_time*1000:.2f}ms for {stat_name}")
+        if multipliers:
+            percentage_factor = 1.0 + percentage_total
+            
+            def apply(base_stat: int) -> int:
+                final_value = (float(base_stat) + flat_total) * percentage_factor
+                for multiplier in multipliers:
+                    final_value *= multiplier
+                return max(0, int(final_value))
+        elif percentage_total:
+            percentage_factor = 1.0 + percentage_total
+            
+            def apply(base_stat: int) -> int:
+                return max(0, int((float(base_stat) + flat_total) * percentage_factor))
+        else:
+            def apply(base_stat: int) -> int:
+                return max(0, int(float(base_stat) + flat_total))
         
-        return max(0, int(final_value))  # Ensure non-negative integer
+        return apply, valid_until
     
     def get_modifiers_for_stat(self, stat_name: str) -> List[Modifier]:
         """Get all active modifiers affecting a specific stat"""
-        return [m for m in self.modifiers 
-                if m.stat_name == stat_name and m.active and not m.is_expired]
+        return [m for m in self._by_stat.get(stat_name, ())
+                if m.active and not m.is_expired]
+    
+    def get_modifiers_for_stats(self, stat_names: Iterable[str]) -> List[Modifier]:
+        """Get all active modifiers affecting any of the given stats, grouped by stat"""
+        by_stat = self._by_stat
+        return [m for stat_name in frozenset(stat_names) for m in by_stat.get(stat_name, ())
+                if m.active and not m.is_expired]
+    
+    def count_modifiers_for_stats(self, stat_names: Iterable[str]) -> int:
+        """Count active modifiers affecting any of the given stats without building a list"""
+        by_stat = self._by_stat
+        return sum(1 for stat_name in frozenset(stat_names) for m in by_stat.get(stat_name, ())
+                   if m.active and not m.is_expired)
     
     def get_modifier_summary(self) -> Dict[str, Any]:
         """Get summary of all active modifiers"""
@@ -378,10 +480,23 @@ class ModifierManager(BaseComponent):
             'cache_valid': self.cache_valid
         }
     
+    def reset(self):
+        """Reinitialize modifier manager in place for reuse from a pool"""
+        BaseComponent.__init__(self)
+        
+        self.modifiers.clear()
+        self._by_stat.clear()
+        self._invalidate_cache()  # Keeps version moving so stale stat rows never match
+        self.cache_timestamp = 0.0
+        
+        self.calculation_count = 0
+        self.last_calculation_time = 0.0
+    
     def _invalidate_cache(self):
         """Invalidate modifier cache"""
         self.cache_valid = False
         self.modifier_cache.clear()
+        self.version += 1
     
     def _cleanup_inactive_modifiers(self):
         """Remove old inactive modifiers to free memory"""
@@ -390,6 +505,11 @@ class ModifierManager(BaseComponent):
         
         self.modifiers = [m for m in self.modifiers 
                          if m.active or (current_time - m.created_at) < cleanup_threshold]
+        
+        by_stat: Dict[str, List[Modifier]] = {}
+        for modifier in self.modifiers:
+            by_stat.setdefault(modifier.stat_name, []).append(modifier)
+        self._by_stat = by_stat
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize component to dictionary"""
@@ -408,7 +528,7 @@ class ModifierManager(BaseComponent):
         # Restore modifiers
         for modifier_data in data.get('modifiers', []):
             modifier = Modifier.from_dict(modifier_data)
-            manager.modifiers.append(modifier)
+            manager._append_modifier(modifier)
         
         # Restore base component data
         manager.entity_id = data.get('entity_id')
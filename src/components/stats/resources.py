@@ -5,7 +5,8 @@ Implements MP (regenerating), Rage (building/decaying), and Kwan (location-based
 resources from Advanced-Implementation-Guide.md
 """
 
-from typing import Dict, Any, List
+from collections import deque
+from typing import Deque, Dict, Any, List, Tuple
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -201,6 +202,17 @@ class RageResource(Resource):
         """Check if enough rage for ability"""
         return self.current_value >= cost
 
+# Kwan modifier by location type
+LOCATION_KWAN_MODIFIERS = {
+    'temple': 0.3,      # +30% in temples
+    'shrine': 0.2,      # +20% at shrines
+    'forest': 0.1,      # +10% in natural areas
+    'battlefield': -0.1, # -10% on battlefields
+    'corruption': -0.3,  # -30% in corrupted areas
+    'void': -0.5,       # -50% in void zones
+    'normal': 0.0       # No modifier for normal areas
+}
+
 class KwanResource(Resource):
     """
     Kwan - location-based spiritual resource.
@@ -226,18 +238,7 @@ class KwanResource(Resource):
             location_type: Type of location (e.g., "temple", "battlefield", "forest")
             location_modifiers: Optional additional modifiers
         """
-        # Location type base modifiers
-        location_base_modifiers = {
-            'temple': 0.3,      # +30% in temples
-            'shrine': 0.2,      # +20% at shrines
-            'forest': 0.1,      # +10% in natural areas
-            'battlefield': -0.1, # -10% on battlefields
-            'corruption': -0.3,  # -30% in corrupted areas
-            'void': -0.5,       # -50% in void zones
-            'normal': 0.0       # No modifier for normal areas
-        }
-        
-        self.location_modifier = location_base_modifiers.get(location_type, 0.0)
+        self.location_modifier = LOCATION_KWAN_MODIFIERS.get(location_type, 0.0)
         
         # Apply additional modifiers
         if location_modifiers:
@@ -297,8 +298,21 @@ class ResourceManager(BaseComponent):
         self.rage = RageResource(max_rage)
         self.kwan = KwanResource(base_kwan)
         
-        # Resource history for analytics
-        self.resource_history: List[Dict[str, Any]] = []
+        # Resource history for analytics, one flat row per update:
+        # (timestamp, mp current, mp max, rage current, rage max, kwan current, kwan max)
+        self.history_max_length = 100
+        self.resource_history: Deque[Tuple[float, int, int, int, int, int, int]] = \
+            deque(maxlen=self.history_max_length)
+    
+    def reset(self, max_mp: int = 100, max_rage: int = 100, base_kwan: int = 50):
+        """Reinitialize resources in place for reuse from a pool"""
+        BaseComponent.__init__(self)
+        
+        self.mp.__init__(max_mp)
+        self.rage.__init__(max_rage)
+        self.kwan.__init__(base_kwan)
+        
+        self.resource_history.clear()
         self.history_max_length = 100
     
     def update(self, delta_time: float, location_type: str = "normal",
@@ -364,18 +378,24 @@ class ResourceManager(BaseComponent):
     
     def _record_resource_state(self):
         """Record current resource state in history"""
-        state = {
-            'timestamp': time.time(),
-            'mp': self.mp.to_dict(),
-            'rage': self.rage.to_dict(), 
-            'kwan': self.kwan.to_dict()
-        }
-        
-        self.resource_history.append(state)
-        
-        # Limit history size
-        if len(self.resource_history) > self.history_max_length:
-            self.resource_history = self.resource_history[-self.history_max_length:]
+        # A flat row per update; the bounded deque drops the oldest in C
+        mp, rage, kwan = self.mp, self.rage, self.kwan
+        self.resource_history.append((time.time(),
+                                      mp.current_value, mp.max_value,
+                                      rage.current_value, rage.max_value,
+                                      kwan.current_value, kwan.max_value))
+    
+    def get_resource_history(self) -> List[Dict[str, Any]]:
+        """Get recorded resource states, oldest first, as dictionaries"""
+        history = []
+        for timestamp, mp, max_mp, rage, max_rage, kwan, max_kwan in self.resource_history:
+            history.append({
+                'timestamp': timestamp,
+                'mp': {'current_value': mp, 'max_value': max_mp},
+                'rage': {'current_value': rage, 'max_value': max_rage},
+                'kwan': {'current_value': kwan, 'max_value': max_kwan}
+            })
+        return history
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize component to dictionary"""
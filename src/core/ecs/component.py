@@ -57,6 +57,15 @@ class BaseComponent(ABC):
         """Create a copy of this component"""
         data = self.to_dict()
         return self.__class__.from_dict(data)
+    
+    def reset(self, *args, **kwargs):
+        """
+        Reinitialize this component in place for reuse from a pool.
+        
+        Takes the same arguments as the constructor. Subclasses override this
+        to reuse their containers instead of allocating new ones.
+        """
+        self.__init__(*args, **kwargs)
 
 class Transform(BaseComponent):
     """
@@ -73,6 +82,20 @@ class Transform(BaseComponent):
         self.position = position or Vector3(0.0, 0.0, 0.0)
         self.rotation = rotation or Vector3(0.0, 0.0, 0.0)  # Euler angles for simplicity
         self.scale = scale or Vector3(1.0, 1.0, 1.0)
+        
+        # (position, cell size, grid cell) from TacticalGrid.transform_to_grid;
+        # Vector3 is immutable, so the cell is valid while position is the same object
+        self._grid_cache = None
+    
+    def reset(self, position=None, rotation=None, scale=None):
+        """Reinitialize transform in place for reuse from a pool"""
+        from core.math.vector import Vector3
+        
+        BaseComponent.__init__(self)
+        self.position = position or Vector3(0.0, 0.0, 0.0)
+        self.rotation = rotation or Vector3(0.0, 0.0, 0.0)
+        self.scale = scale or Vector3(1.0, 1.0, 1.0)
+        self._grid_cache = None
     
     def to_dict(self) -> Dict[str, Any]:
         base_dict = super().to_dict()
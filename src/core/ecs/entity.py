@@ -7,7 +7,7 @@ Entities are containers for components with unique identifiers.
 
 import uuid
 import time
-from typing import Dict, List, Optional, Type, TypeVar, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Type, TypeVar, Set
 from .component import BaseComponent, ComponentRegistry
 
 T = TypeVar('T', bound=BaseComponent)
@@ -24,8 +24,14 @@ class Entity:
         self.id: str = entity_id or str(uuid.uuid4())
         self.created_at: float = time.time()
         self.active: bool = True
+        # Keyed by component class. Classes hash by identity, so get_component
+        # is a single dict probe; a list indexed by per-class ids measured no
+        # faster, as the id lookup on the class costs as much as the hash.
         self._components: Dict[Type[BaseComponent], BaseComponent] = {}
         self._component_types: Set[Type[BaseComponent]] = set()
+        
+        # Manager this entity is registered with, told about component changes
+        self._manager: Optional['EntityManager'] = None
     
     def add_component(self, component: BaseComponent) -> 'Entity':
         """
@@ -52,6 +58,9 @@ class Entity:
         self._components[component_type] = component
         self._component_types.add(component_type)
         
+        if self._manager is not None:
+            self._manager._on_component_added(self, component_type)
+        
         return self
     
     def remove_component(self, component_type: Type[T]) -> Optional[T]:
@@ -73,6 +82,9 @@ class Entity:
         # Clear entity reference
         component.entity_id = None
         
+        if self._manager is not None:
+            self._manager._on_component_removed(self, component_type)
+        
         return component
     
     def get_component(self, component_type: Type[T]) -> Optional[T]:
@@ -134,6 +146,9 @@ class Entity:
         
         self._components.clear()
         self._component_types.clear()
+        
+        if self._manager is not None:
+            self._manager._on_entity_destroyed(self)
     
     def to_dict(self) -> Dict[str, any]:
         """Serialize entity to dictionary"""
@@ -184,10 +199,24 @@ class EntityManager:
         self._entities_by_components: Dict[Type[BaseComponent], Set[str]] = {}
         self._destroyed_entities: Set[str] = set()
         
+        # Active entities, maintained on register/destroy so counting is O(1)
+        self._active_entity_count = 0
+        
         # Performance optimization: Cache filtered entity query results
         self._entity_query_cache: Dict[tuple, List[Entity]] = {}
+        
+        # Active entities per component signature, in creation order
+        self._signature_index: Dict[FrozenSet[Type[BaseComponent]], List[Entity]] = {}
         self._cache_invalidation_counter = 0
         self._max_cache_size = 50  # Limit cache size to prevent memory bloat
+        
+        # Per-type free lists of components callers have released, reused by
+        # acquire_component. Pooling is opt-in: only release_component and
+        # release_entity add to them, and entities themselves are never reused
+        # since callers may still hold their handles.
+        self._component_pools: Dict[Type[BaseComponent], List[BaseComponent]] = {}
+        self._released_components: List[BaseComponent] = []  # Pooled at cleanup
+        self._max_pool_size = 64  # Per component type
     
     def create_entity(self, *components: BaseComponent) -> Entity:
         """
@@ -210,12 +239,99 @@ class EntityManager:
         
         return entity
     
-    def destroy_entity(self, entity_id: str) -> bool:
+    def create_entities(self, specs: Iterable[Sequence[BaseComponent]]) -> List[Entity]:
+        """
+        Create several entities, invalidating the query cache once.
+        
+        Args:
+            specs: One sequence of initial components per entity
+            
+        Returns:
+            Created entities, in the order of specs
+        """
+        entities = []
+        has_components = False
+        
+        for components in specs:
+            entity = Entity()
+            for component in components:
+                entity.add_component(component)
+            
+            has_components |= self._index_entity(entity)
+            entities.append(entity)
+        
+        if has_components:
+            self._invalidate_query_cache()
+        
+        return entities
+    
+    def acquire_component(self, component_type: Type[T], *args, **kwargs) -> T:
+        """
+        Get a component, reusing a released one of the same type if possible.
+        
+        Pooled instances are reinitialized with their reset method, which
+        takes the same arguments as the constructor.
+        
+        Args:
+            component_type: Component type to get
+            args: Constructor arguments
+            kwargs: Constructor keyword arguments
+            
+        Returns:
+            Component ready to be added to an entity
+        """
+        pool = self._component_pools.get(component_type)
+        if pool:
+            component = pool.pop()
+            component.reset(*args, **kwargs)
+            return component
+        return component_type(*args, **kwargs)
+    
+    def release_component(self, component: BaseComponent):
+        """
+        Hand a component back for reuse by acquire_component.
+        
+        The caller must not use the component afterwards: a later
+        acquire_component resets it in place.
+        
+        Args:
+            component: Component no longer attached to any entity
+            
+        Raises:
+            ValueError: If the component is still attached to an entity
+        """
+        if component.entity_id is not None:
+            raise ValueError(f"Component {type(component).__name__} is still attached "
+                             f"to entity {component.entity_id}")
+        
+        pool = self._component_pools.setdefault(type(component), [])
+        if len(pool) < self._max_pool_size:
+            pool.append(component)
+    
+    def release_entity(self, entity_id: str) -> bool:
+        """
+        Destroy an entity and release its components for reuse.
+        
+        Like destroy_entity, but the components become available to
+        acquire_component once cleanup_destroyed_entities has run. The caller
+        must not use them afterwards.
+        
+        Args:
+            entity_id: ID of entity to destroy
+            
+        Returns:
+            True if entity was found and marked for destruction
+        """
+        return self.destroy_entity(entity_id, release_components=True)
+    
+    def destroy_entity(self, entity_id: str, release_components: bool = False) -> bool:
         """
         Mark entity for destruction.
         
         Args:
             entity_id: ID of entity to destroy
+            release_components: Pool the entity's components at cleanup,
+                as release_entity does
             
         Returns:
             True if entity was found and marked for destruction
@@ -224,6 +340,11 @@ class EntityManager:
             return False
         
         entity = self._entities[entity_id]
+        if entity.active:
+            self._active_entity_count -= 1
+        
+        if release_components:
+            self._released_components.extend(entity._components.values())
         entity.destroy()
         self._destroyed_entities.add(entity_id)
         
@@ -293,9 +414,49 @@ class EntityManager:
         
         return result_entities
     
+    def query(self, *component_types: Type[BaseComponent]) -> List[Entity]:
+        """
+        Get active entities that have ALL specified component types.
+        
+        Results are kept per component signature until entities or their
+        components change, so repeated queries are a dict lookup. The
+        returned list is shared and must not be modified.
+        
+        Args:
+            component_types: Component types that must all be present
+            
+        Returns:
+            Matching entities in creation order
+        """
+        signature = frozenset(component_types)
+        entities = self._signature_index.get(signature)
+        if entities is None:
+            entities = [entity for entity in self._entities.values()
+                        if entity.active and signature <= entity._component_types]
+            self._signature_index[signature] = entities
+        return entities
+    
+    def _on_entity_destroyed(self, entity: Entity):
+        """Drop signature query results that may still list a destroyed entity"""
+        self._signature_index.clear()
+    
+    def _on_component_added(self, entity: Entity, component_type: Type[BaseComponent]):
+        """Index a component added to an already registered entity"""
+        if component_type not in self._entities_by_components:
+            self._entities_by_components[component_type] = set()
+        self._entities_by_components[component_type].add(entity.id)
+        self._invalidate_query_cache()
+    
+    def _on_component_removed(self, entity: Entity, component_type: Type[BaseComponent]):
+        """Drop a component removed from an already registered entity from the indices"""
+        if component_type in self._entities_by_components:
+            self._entities_by_components[component_type].discard(entity.id)
+        self._invalidate_query_cache()
+    
     def _invalidate_query_cache(self):
         """Invalidate entity query cache when components change"""
         self._entity_query_cache.clear()
+        self._signature_index.clear()
         self._cache_invalidation_counter += 1
     
     def _get_cache_key(self, *component_types: Type[BaseComponent]) -> tuple:
@@ -327,6 +488,12 @@ class EntityManager:
                 
                 # Remove from entities dict
                 del self._entities[entity_id]
+                entity._manager = None
+        
+        # Released components are pooled only now, once their entities are gone
+        for component in self._released_components:
+            self.release_component(component)
+        self._released_components.clear()
         
         # Invalidate query cache when entities are destroyed
         if self._destroyed_entities:
@@ -336,21 +503,35 @@ class EntityManager:
     
     def _register_entity(self, entity: Entity):
         """Register entity and update component indices"""
+        # Invalidate query cache when new entities are registered
+        if self._index_entity(entity):
+            self._invalidate_query_cache()
+    
+    def _index_entity(self, entity: Entity) -> bool:
+        """Add entity to the lookup and component indices; True if it has components"""
         self._entities[entity.id] = entity
+        entity._manager = self
+        self._signature_index.clear()  # Empty-signature queries list every entity
+        if entity.active:
+            self._active_entity_count += 1
         
         # Update component indices
-        for component_type in entity.get_component_types():
+        component_types = entity.get_component_types()
+        for component_type in component_types:
             if component_type not in self._entities_by_components:
                 self._entities_by_components[component_type] = set()
             self._entities_by_components[component_type].add(entity.id)
         
-        # Invalidate query cache when new entities are registered
-        if entity.get_component_types():
-            self._invalidate_query_cache()
+        return bool(component_types)
     
     def get_entity_count(self) -> int:
         """Get total number of active entities"""
-        return len([e for e in self._entities.values() if e.active])
+        return self._active_entity_count
+    
+    @property
+    def entity_count(self) -> int:
+        """Get total number of active entities"""
+        return self._active_entity_count
     
     def get_statistics(self) -> Dict[str, any]:
         """Get manager statistics for debugging"""
@@ -363,5 +544,6 @@ class EntityManager:
             'total_entities': len(self._entities),
             'active_entities': self.get_entity_count(),
             'destroyed_pending': len(self._destroyed_entities),
-            'component_counts': component_counts
+            'component_counts': component_counts,
+            'pooled_components': sum(len(pool) for pool in self._component_pools.values())
         }
\ No newline at end of file
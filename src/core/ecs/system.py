@@ -6,7 +6,8 @@ Systems contain all game logic and operate on entities with specific components.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Type, Set, Dict, Any
+from concurrent.futures import Executor
+from typing import List, Type, Set, Dict, Any, Tuple, Optional, Callable
 import time
 
 from .entity import Entity
@@ -27,6 +28,17 @@ class BaseSystem(ABC):
         self.priority = 0  # Lower numbers = higher priority
         self.performance_stats = SystemPerformanceStats()
         
+        # Update cadence: run once every N world frames with the summed delta time
+        self.update_every_n_frames = 1
+        self._frames_since_update = 0
+        self._accumulated_time = 0.0
+        
+        # Sleep requested by the last update: skipped until _slept_time reaches
+        # _sleep_duration or the processed entities differ from _sleep_entities
+        self._sleep_duration = 0.0
+        self._slept_time = 0.0
+        self._sleep_entities: Optional[List[Entity]] = None
+        
     @abstractmethod
     def get_required_components(self) -> Set[Type[BaseComponent]]:
         """
@@ -40,16 +52,28 @@ class BaseSystem(ABC):
         pass
     
     @abstractmethod
-    def update(self, delta_time: float, entities: List[Entity]):
+    def update(self, delta_time: float, entities: List[Entity]) -> Optional[float]:
         """
         Update system logic for all matching entities.
         
+        A system with nothing to do until some later time may return the
+        number of seconds until it next needs to run. It is then skipped
+        until that time has passed or its matching entities change, and the
+        next update receives all the time skipped.
+        
         Args:
             delta_time: Time elapsed since last update in seconds
             entities: List of entities with required components
+            
+        Returns:
+            Seconds until the next required update, or None to run every frame
         """
         pass
     
+    def wake(self):
+        """End any requested sleep so the system runs on the next frame"""
+        self._sleep_duration = 0.0
+    
     def on_entity_added(self, entity: Entity):
         """
         Called when entity with required components is added to world.
@@ -100,6 +124,45 @@ class BaseSystem(ABC):
         """
         return set()
     
+    def get_read_components(self) -> Optional[Set[Type[BaseComponent]]]:
+        """
+        Return set of component types this system reads during update.
+        
+        Used with get_write_components to decide which systems may run
+        concurrently. None means undeclared, and such a system is never run
+        alongside another.
+        
+        Returns:
+            Set of read component types, or None if undeclared
+        """
+        return None
+    
+    def get_write_components(self) -> Optional[Set[Type[BaseComponent]]]:
+        """
+        Return set of component types this system modifies during update.
+        
+        Returns:
+            Set of written component types, or None if undeclared
+        """
+        return None
+    
+    def conflicts_with(self, other: 'BaseSystem') -> bool:
+        """
+        Check whether this system and another touch the same components.
+        
+        Args:
+            other: System to compare against
+            
+        Returns:
+            True unless both declare their components and neither writes
+            what the other reads or writes
+        """
+        reads, writes = self.get_read_components(), self.get_write_components()
+        other_reads, other_writes = other.get_read_components(), other.get_write_components()
+        if reads is None or writes is None or other_reads is None or other_writes is None:
+            return True
+        return bool(writes & (other_reads | other_writes) or other_writes & reads)
+    
     def should_process_entity(self, entity: Entity) -> bool:
         """
         Check if entity should be processed by this system.
@@ -127,6 +190,8 @@ class BaseSystem(ABC):
 class SystemPerformanceStats:
     """Performance tracking for systems"""
     
+    EMA_ALPHA = 0.1  # Weight of the newest frame in ema_frame_time
+    
     def __init__(self):
         self.frame_start_time = 0.0
         self.total_time = 0.0
@@ -134,6 +199,7 @@ class SystemPerformanceStats:
         self.total_entities_processed = 0
         self.max_frame_time = 0.0
         self.min_frame_time = float('inf')
+        self.ema_frame_time = 0.0
         
     def add_frame_time(self, frame_time: float, entity_count: int):
         """Add frame timing data"""
@@ -142,6 +208,12 @@ class SystemPerformanceStats:
         self.total_entities_processed += entity_count
         self.max_frame_time = max(self.max_frame_time, frame_time)
         self.min_frame_time = min(self.min_frame_time, frame_time)
+        
+        # Exponential moving average tracks recent cost without a history buffer
+        if self.frame_count == 1:
+            self.ema_frame_time = frame_time
+        else:
+            self.ema_frame_time += self.EMA_ALPHA * (frame_time - self.ema_frame_time)
     
     @property
     def average_frame_time(self) -> float:
@@ -161,6 +233,7 @@ class SystemPerformanceStats:
             'total_entities_processed': self.total_entities_processed,
             'average_frame_time': self.average_frame_time,
             'average_entities_per_frame': self.average_entities_per_frame,
+            'ema_frame_time': self.ema_frame_time,
             'max_frame_time': self.max_frame_time,
             'min_frame_time': self.min_frame_time if self.min_frame_time != float('inf') else 0.0
         }
@@ -176,7 +249,13 @@ class SystemManager:
         self.event_bus = event_bus
         self._systems: List[BaseSystem] = []
         self._systems_by_name: Dict[str, BaseSystem] = {}
+        self._systems_view: Tuple[BaseSystem, ...] = ()  # Rebuilt on add/remove
+        self._batches: Tuple[Tuple[BaseSystem, ...], ...] = ()  # Rebuilt on add/remove
         self._initialized = False
+        
+        # Optional concurrent.futures executor; when set, systems in the same
+        # batch are updated concurrently
+        self.executor: Optional[Executor] = None
     
     def add_system(self, system: BaseSystem):
         """
@@ -196,6 +275,8 @@ class SystemManager:
         
         # Sort systems by priority
         self._systems.sort(key=lambda s: s.priority)
+        self._systems_view = tuple(self._systems)
+        self._batches = self._build_batches()
         
         # Initialize if manager is already initialized
         if self._initialized:
@@ -219,6 +300,8 @@ class SystemManager:
         
         self._systems.remove(system)
         del self._systems_by_name[system_name]
+        self._systems_view = tuple(self._systems)
+        self._batches = self._build_batches()
         
         return True
     
@@ -240,33 +323,105 @@ class SystemManager:
             system.initialize()
         self._initialized = True
     
-    def update(self, delta_time: float, entities: List[Entity]):
+    def update(self, delta_time: float, entities: List[Entity],
+               query: Optional[Callable[..., List[Entity]]] = None):
         """
         Update all enabled systems.
         
         Args:
             delta_time: Time elapsed since last update
             entities: All entities in the world
+            query: Optional indexed lookup of active entities by required
+                components, used for systems with the default entity filter
         """
-        for system in self._systems:
-            if not system.enabled:
-                continue
-            
-            # Filter entities for this system
+        executor = self.executor
+        if executor is None:
+            for system in self._systems:
+                self._update_system(system, delta_time, entities, query)
+            return
+        
+        for batch in self._batches:
+            if len(batch) == 1:
+                self._update_system(batch[0], delta_time, entities, query)
+            else:
+                futures = [executor.submit(self._update_system, system, delta_time, entities, query)
+                           for system in batch]
+                for future in futures:
+                    future.result()
+    
+    def _update_system(self, system: BaseSystem, delta_time: float, entities: List[Entity],
+                       query: Optional[Callable[..., List[Entity]]]):
+        """Update one system if enabled and due this frame"""
+        if not system.enabled:
+            return
+        
+        # Reduced-rate systems accumulate time and skip until their turn
+        system_delta = delta_time
+        if system.update_every_n_frames > 1:
+            system._frames_since_update += 1
+            system._accumulated_time += delta_time
+            if system._frames_since_update < system.update_every_n_frames:
+                return
+            system_delta = system._accumulated_time
+            system._frames_since_update = 0
+            system._accumulated_time = 0.0
+        
+        # Filter entities for this system; custom filters still see every entity
+        if query is not None and type(system).should_process_entity is BaseSystem.should_process_entity:
+            matching_entities = query(*system.get_required_components())
+        else:
             matching_entities = [
                 entity for entity in entities 
                 if system.should_process_entity(entity)
             ]
-            
-            # Update system with performance tracking
-            system._start_frame()
-            try:
-                system.update(delta_time, matching_entities)
-            except Exception as e:
-                # Log error but continue with other systems
-                print(f"Error in system {system.name}: {e}")
-            finally:
-                system._end_frame(len(matching_entities))
+        
+        # Sleeping systems skip frames until their deadline or until the
+        # entities they process change, then get all the skipped time
+        sleep_entities = system._sleep_entities
+        if sleep_entities is not None:
+            system._slept_time += system_delta
+            if (system._slept_time < system._sleep_duration and
+                    (matching_entities is sleep_entities or matching_entities == sleep_entities)):
+                return
+            system_delta = system._slept_time
+            system._sleep_entities = None
+        
+        # Update system with performance tracking
+        system._start_frame()
+        try:
+            sleep_time = system.update(system_delta, matching_entities)
+            if sleep_time is not None and sleep_time > 0.0:
+                system._sleep_duration = sleep_time
+                system._slept_time = 0.0
+                system._sleep_entities = matching_entities
+        except Exception as e:
+            # Log error but continue with other systems
+            print(f"Error in system {system.name}: {e}")
+        finally:
+            system._end_frame(len(matching_entities))
+    
+    def _build_batches(self) -> Tuple[Tuple[BaseSystem, ...], ...]:
+        """
+        Group systems, in priority order, into runs of mutually non-conflicting systems.
+        
+        A new batch starts at the first system that conflicts with any member
+        of the current one, so priority order between conflicting systems is kept.
+        """
+        batches = []
+        current: List[BaseSystem] = []
+        for system in self._systems:
+            if any(system.conflicts_with(member) for member in current):
+                batches.append(tuple(current))
+                current = []
+            current.append(system)
+        if current:
+            batches.append(tuple(current))
+        return tuple(batches)
+    
+    @property
+    def batches(self) -> Tuple[Tuple[BaseSystem, ...], ...]:
+        """Systems grouped into batches that may be updated concurrently"""
+        return self._batches
     
     def shutdown(self):
         """Shutdown all systems"""
@@ -293,6 +448,11 @@ class SystemManager:
         if system:
             system.enabled = False
     
+    @property
+    def systems(self) -> Tuple[BaseSystem, ...]:
+        """Registered systems in update order, as a tuple cached between changes"""
+        return self._systems_view
+    
     def get_system_count(self) -> int:
         """Get total number of registered systems"""
         return len(self._systems)
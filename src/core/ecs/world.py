@@ -5,7 +5,7 @@ The World class coordinates entities, components, and systems.
 It serves as the main container and coordinator for the ECS architecture.
 """
 
-from typing import List, Type, Optional, Dict, Any
+from typing import List, Type, Optional, Dict, Any, Iterable, Sequence
 import time
 
 from .entity import Entity, EntityManager
@@ -103,12 +103,82 @@ class World:
         
         return entity
     
-    def destroy_entity(self, entity_id: str) -> bool:
+    def create_entities(self, specs: Iterable[Sequence[BaseComponent]]) -> List[Entity]:
+        """
+        Create several entities in one batch.
+        
+        The query cache is invalidated once for the whole batch and the
+        creation events are published together afterwards.
+        
+        Args:
+            specs: One sequence of initial components per entity
+            
+        Returns:
+            Created entities, in the order of specs
+        """
+        entities = self.entity_manager.create_entities(specs)
+        
+        events = []
+        for entity in entities:
+            events.append(EntityCreatedEvent(entity.id))
+            for component in entity.get_all_components():
+                events.append(ComponentAddedEvent(
+                    entity.id, component.__class__.__name__
+                ))
+        self.event_bus.publish_batch(events)
+        
+        return entities
+    
+    def acquire_component(self, component_type: Type[BaseComponent], *args, **kwargs) -> BaseComponent:
+        """
+        Get a component for a new entity, reusing pooled instances.
+        
+        Components handed back through release_component or release_entity
+        are recycled in place instead of allocating new ones. Arguments are
+        those of the component constructor.
+        
+        Args:
+            component_type: Component type to get
+            args: Constructor arguments
+            kwargs: Constructor keyword arguments
+            
+        Returns:
+            Component ready to pass to create_entity
+        """
+        return self.entity_manager.acquire_component(component_type, *args, **kwargs)
+    
+    def release_component(self, component: BaseComponent):
+        """
+        Hand a detached component back for reuse by acquire_component.
+        
+        Args:
+            component: Component no longer attached to any entity
+        """
+        self.entity_manager.release_component(component)
+    
+    def release_entity(self, entity_id: str) -> bool:
+        """
+        Destroy entity by ID and release its components for reuse.
+        
+        The components are pooled once destroyed entities are cleaned up and
+        must not be used by the caller afterwards.
+        
+        Args:
+            entity_id: ID of entity to destroy
+            
+        Returns:
+            True if entity was found and destroyed
+        """
+        return self.destroy_entity(entity_id, release_components=True)
+    
+    def destroy_entity(self, entity_id: str, release_components: bool = False) -> bool:
         """
         Destroy entity by ID.
         
         Args:
             entity_id: ID of entity to destroy
+            release_components: Pool the entity's components at cleanup,
+                as release_entity does
             
         Returns:
             True if entity was found and destroyed
@@ -124,7 +194,7 @@ class World:
             ))
         
         # Destroy entity
-        success = self.entity_manager.destroy_entity(entity_id)
+        success = self.entity_manager.destroy_entity(entity_id, release_components)
         
         if success:
             # Publish entity destruction event
@@ -168,6 +238,21 @@ class World:
         """
         return self.entity_manager.get_entities_with_components(*component_types)
     
+    def query(self, *component_types: Type[BaseComponent]) -> List[Entity]:
+        """
+        Get active entities that have all specified components.
+        
+        Served from the entity manager's signature index; the returned list
+        is shared and must not be modified.
+        
+        Args:
+            component_types: Component types that must all be present
+            
+        Returns:
+            Matching entities in creation order
+        """
+        return self.entity_manager.query(*component_types)
+    
     def get_all_entities(self) -> List[Entity]:
         """Get all active entities in the world"""
         return self.entity_manager.get_all_entities()
@@ -193,11 +278,11 @@ class World:
         # Clean up destroyed entities
         self.entity_manager.cleanup_destroyed_entities()
         
-        # Get all entities for systems
-        all_entities = self.get_all_entities()
+        # Systems read their entities from the manager's signature index
+        entity_query = self.entity_manager.query
         
         # Update all systems
-        self.system_manager.update(delta_time, all_entities)
+        self.system_manager.update(delta_time, entity_query(), entity_query)
         
         # Process events
         self.event_bus.process_events()
@@ -19,4 +19,8 @@ class BattleGrid:
             unit.current_move_points -= distance
             self.units[(x, y)] = unit
             return True
-        return False
\ No newline at end of file
+        return False
+        
+    def get_units_in_range(self, x, y, range_distance):
+        return [unit for (unit_x, unit_y), unit in self.units.items()
+                if abs(unit_x - x) + abs(unit_y - y) <= range_distance]
@@ -457,22 +457,10 @@ class TacticalRPG:
     
     def get_units_in_effect_area(self, target_x, target_y):
         """Get all units within the attack effect area"""
-        affected_units = []
-        effect_radius = self.selected_unit.attack_effect_area
-        
-        for x in range(self.grid.width):
-            for y in range(self.grid.height):
-                # Calculate distance from target tile
-                distance = abs(x - target_x) + abs(y - target_y)
-                
-                # Check if tile is within effect area and has a unit
-                if distance <= effect_radius and (x, y) in self.grid.units:
-                    unit = self.grid.units[(x, y)]
-                    # Don't include the attacking unit itself
-                    if unit != self.selected_unit:
-                        affected_units.append(unit)
-        
-        return affected_units
+        # Don't include the attacking unit itself
+        units_in_area = self.grid.get_units_in_range(target_x, target_y,
+                                                     self.selected_unit.attack_effect_area)
+        return [unit for unit in units_in_area if unit != self.selected_unit]
             
     def show_movement_confirmation(self):
         """Show modal to confirm unit movement"""
@@ -6,11 +6,20 @@ Optimized for <2ms pathfinding queries on 10x10 grids per performance targets.
 """
 
 import math
-from typing import Dict, List, Optional, Tuple, Set, Callable
+import random
+from typing import Dict, Iterable, List, Optional, Tuple, Set, Callable
 from enum import Enum
 
 from .vector import Vector3, Vector2Int
 
+# Cost multiplier applied to diagonal steps
+DIAGONAL_COST_MULTIPLIER = 1.414
+
+# Neighbour offsets: cardinal (north, east, south, west), then diagonal
+# (northeast, southeast, southwest, northwest)
+_CARDINAL_OFFSETS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_DIAGONAL_OFFSETS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
 class TerrainType(Enum):
     """Terrain type enumeration for movement and tactical calculations"""
     NORMAL = "normal"
@@ -35,16 +44,16 @@ class GridCell:
         self.passable = terrain_type != TerrainType.WALL
         self.occupied = False
         self.occupant_id: Optional[str] = None
-        
-        # Movement costs for different terrain types
-        self._movement_costs = {
-            TerrainType.NORMAL: 1.0,
-            TerrainType.DIFFICULT: 2.0,
-            TerrainType.WATER: 1.5,
-            TerrainType.WALL: float('inf'),
-            TerrainType.PIT: 3.0,
-            TerrainType.ELEVATED: 1.2
-        }
+    
+    # Movement costs for different terrain types, shared by all cells
+    _movement_costs = {
+        TerrainType.NORMAL: 1.0,
+        TerrainType.DIFFICULT: 2.0,
+        TerrainType.WATER: 1.5,
+        TerrainType.WALL: float('inf'),
+        TerrainType.PIT: 3.0,
+        TerrainType.ELEVATED: 1.2
+    }
     
     @property
     def movement_cost(self) -> float:
@@ -134,10 +143,25 @@ class TacticalGrid:
         self._pathfinding_cache: Dict[Tuple[Vector2Int, Vector2Int], List[Vector2Int]] = {}
         self._cache_max_size = 1000
         
+        # Flat-index views for the pathfinding kernel (index = x * height + y).
+        # version is bumped on every mutation so derived data can be revalidated.
+        self.version = 0
+        self._cells_by_index: List[GridCell] = list(self.cells.values())
+        self._positions_by_index: List[Vector2Int] = [cell.grid_pos for cell in self._cells_by_index]
+        self._edge_table: List[Optional[Tuple[Tuple[int, float], ...]]] = [None] * (width * height)
+        self._uniform_step_cost: Optional[float] = None
+        self._uniform_step_cost_version = -1
+        
+        # Free cells with a one-cell blocked border, index (x + 1) * (height + 2) + y + 1.
+        # Single-cell changes update their byte in place.
+        self._walkable = bytearray((width + 2) * (height + 2))
+        
         # Pre-compute neighbor relationships for performance
         self._neighbor_cache: Dict[Vector2Int, List[Vector2Int]] = {}
         self._diagonal_neighbor_cache: Dict[Vector2Int, List[Vector2Int]] = {}
+        self._neighbor_indices: List[Tuple[int, ...]] = []  # Diagonal neighbours by flat index
         self._precompute_neighbors()
+        self._rebuild_walkable()
     
     def get_cell(self, grid_pos: Vector2Int) -> Optional[GridCell]:
         """
@@ -151,6 +175,21 @@ class TacticalGrid:
         """
         return self.cells.get(grid_pos)
     
+    def get_cell_xy(self, x: int, y: int) -> Optional[GridCell]:
+        """
+        Get cell at integer coordinates without building a Vector2Int.
+        
+        Args:
+            x: Grid x coordinate
+            y: Grid y coordinate
+            
+        Returns:
+            GridCell or None if position is invalid
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._cells_by_index[x * self.height + y]
+        return None
+    
     def set_cell_height(self, grid_pos: Vector2Int, height: float):
         """
         Set height of cell at position.
@@ -162,7 +201,7 @@ class TacticalGrid:
         cell = self.get_cell(grid_pos)
         if cell:
             cell.height = height
-            self._invalidate_pathfinding_cache()
+            self._invalidate_cells((grid_pos,))
     
     def set_cell_terrain(self, grid_pos: Vector2Int, terrain_type: TerrainType):
         """
@@ -176,7 +215,55 @@ class TacticalGrid:
         if cell:
             cell.terrain_type = terrain_type
             cell.passable = terrain_type != TerrainType.WALL
-            self._invalidate_pathfinding_cache()
+            self._invalidate_cells((grid_pos,))
+    
+    def set_cells_height(self, positions: Iterable[Vector2Int], height: float) -> int:
+        """
+        Set height of several cells with a single cache invalidation.
+        
+        Args:
+            positions: Grid coordinates; invalid positions are skipped
+            height: New height value
+            
+        Returns:
+            Number of cells changed
+        """
+        changed = []
+        for grid_pos in positions:
+            cell = self.cells.get(grid_pos)
+            if cell:
+                cell.height = height
+                changed.append(grid_pos)
+        if changed:
+            self._invalidate_cells(changed)
+        return len(changed)
+    
+    def set_cells_terrain(self, positions: Iterable[Vector2Int], terrain_type: TerrainType,
+                          height: Optional[float] = None) -> int:
+        """
+        Set terrain type of several cells with a single cache invalidation.
+        
+        Args:
+            positions: Grid coordinates; invalid positions are skipped
+            terrain_type: New terrain type
+            height: Optional new height applied to the same cells
+            
+        Returns:
+            Number of cells changed
+        """
+        passable = terrain_type != TerrainType.WALL
+        changed = []
+        for grid_pos in positions:
+            cell = self.cells.get(grid_pos)
+            if cell:
+                cell.terrain_type = terrain_type
+                cell.passable = passable
+                if height is not None:
+                    cell.height = height
+                changed.append(grid_pos)
+        if changed:
+            self._invalidate_cells(changed)
+        return len(changed)
     
     def occupy_cell(self, grid_pos: Vector2Int, occupant_id: str) -> bool:
         """
@@ -193,6 +280,7 @@ class TacticalGrid:
         if cell and not cell.occupied and cell.passable:
             cell.occupied = True
             cell.occupant_id = occupant_id
+            self._invalidate_cells((grid_pos,))
             return True
         return False
     
@@ -210,6 +298,7 @@ class TacticalGrid:
         if cell and cell.occupied:
             cell.occupied = False
             cell.occupant_id = None
+            self._invalidate_cells((grid_pos,))
             return True
         return False
     
@@ -227,6 +316,28 @@ class TacticalGrid:
         grid_y = int(world_pos.z / self.cell_size)
         return Vector2Int(grid_x, grid_y)
     
+    def transform_to_grid(self, transform) -> Vector2Int:
+        """
+        Convert a Transform's position to grid coordinates.
+        
+        The result is cached on the transform and reused until its position
+        is replaced, so entities that stay put skip the conversion.
+        
+        Args:
+            transform: Transform component
+            
+        Returns:
+            Grid coordinates
+        """
+        position = transform.position
+        cached = transform._grid_cache
+        if cached is not None and cached[0] is position and cached[1] == self.cell_size:
+            return cached[2]
+        
+        grid_pos = self.world_to_grid(position)
+        transform._grid_cache = (position, self.cell_size, grid_pos)
+        return grid_pos
+    
     def grid_to_world(self, grid_pos: Vector2Int) -> Vector3:
         """
         Convert grid coordinates to world position.
@@ -276,6 +387,154 @@ class TacticalGrid:
         else:
             return self._neighbor_cache.get(grid_pos, [])
     
+    def cell_index(self, grid_pos: Vector2Int) -> int:
+        """Get flat index of a grid position (x * height + y)"""
+        return grid_pos.x * self.height + grid_pos.y
+    
+    def get_positions(self) -> List[Vector2Int]:
+        """
+        Get the grid position of every cell by flat index (x * height + y).
+        
+        Callers working on flat indices or raw coordinates can turn them back
+        into positions through these shared instances instead of allocating a
+        new Vector2Int per cell. The list must not be modified.
+        
+        Returns:
+            Grid positions by flat cell index
+        """
+        return self._positions_by_index
+    
+    def get_edges(self, index: int) -> Tuple[Tuple[int, float], ...]:
+        """
+        Get passable outgoing edges of a cell for the pathfinding kernel.
+        
+        Edges are built lazily per cell from get_movement_cost and reused
+        until the grid is mutated.
+        
+        Args:
+            index: Flat cell index
+            
+        Returns:
+            Tuple of (neighbor_index, movement_cost) pairs
+        """
+        edges = self._edge_table[index]
+        if edges is None:
+            cells = self._cells_by_index
+            cell = cells[index]
+            grid_height = self.height
+            x = index // grid_height
+            y = index - x * grid_height
+            edges = []
+            for neighbor_index in self._neighbor_indices[index]:
+                neighbor_x = neighbor_index // grid_height
+                is_diagonal = neighbor_x != x and neighbor_index - neighbor_x * grid_height != y
+                cost = self._step_cost(cell, cells[neighbor_index], is_diagonal)
+                if cost != float('inf'):
+                    edges.append((neighbor_index, cost))
+            edges = tuple(edges)
+            self._edge_table[index] = edges
+        return edges
+    
+    def get_edge_table(self) -> List[Tuple[Tuple[int, float], ...]]:
+        """
+        Get the complete edge table, building any entries not yet cached.
+        
+        Callers may index the returned list directly instead of calling
+        get_edges per cell. Mutations clear the affected entries in place,
+        so the table must be fetched again after any change.
+        
+        Returns:
+            List of edge tuples indexed by flat cell index
+        """
+        edge_table = self._edge_table
+        if None in edge_table:
+            get_edges = self.get_edges
+            for index, edges in enumerate(edge_table):
+                if edges is None:
+                    get_edges(index)
+        return edge_table
+    
+    def get_walkable(self) -> bytearray:
+        """
+        Get free cells as a flat array for the Jump Point Search kernel.
+        
+        A byte is 1 for passable, unoccupied cells and 0 otherwise, with a
+        one-cell blocked border: cell (x, y) is at (x + 1) * (height + 2) + y + 1.
+        The array is updated in place when cells change and must not be
+        modified by callers.
+        
+        Returns:
+            Padded walkability array
+        """
+        return self._walkable
+    
+    def get_uniform_step_cost(self) -> Optional[float]:
+        """
+        Get the single straight step cost if movement costs are uniform.
+        
+        The grid is uniform when, from every passable cell, each free
+        neighbour can be entered and every straight step costs the same with
+        diagonals costing that times DIAGONAL_COST_MULTIPLIER. Such grids can
+        be searched on walkability alone (Jump Point Search). The result is
+        cached until the grid is mutated.
+        
+        Returns:
+            Straight step cost, or None if costs vary across the grid
+        """
+        if self._uniform_step_cost_version != self.version:
+            self._uniform_step_cost = self._compute_uniform_step_cost()
+            self._uniform_step_cost_version = self.version
+        return self._uniform_step_cost
+    
+    def _compute_uniform_step_cost(self) -> Optional[float]:
+        """Scan the edge table for a single straight/diagonal cost pair"""
+        edge_table = self.get_edge_table()
+        cells = self._cells_by_index
+        grid_height = self.height
+        step_cost = None
+        diagonal_cost = None
+        
+        for index, edges in enumerate(edge_table):
+            cell = cells[index]
+            if not cell.passable:
+                continue
+            
+            # Every free neighbour must be reachable, whatever the height
+            free_neighbors = 0
+            for neighbor_pos in self._diagonal_neighbor_cache[cell.grid_pos]:
+                neighbor = cells[neighbor_pos.x * grid_height + neighbor_pos.y]
+                if neighbor.passable and not neighbor.occupied:
+                    free_neighbors += 1
+            if len(edges) != free_neighbors:
+                return None
+            
+            x, y = divmod(index, grid_height)
+            for neighbor_index, cost in edges:
+                neighbor_x, neighbor_y = divmod(neighbor_index, grid_height)
+                if neighbor_x != x and neighbor_y != y:
+                    if diagonal_cost is None:
+                        diagonal_cost = cost
+                    elif cost != diagonal_cost:
+                        return None
+                elif step_cost is None:
+                    step_cost = cost
+                elif cost != step_cost:
+                    return None
+        
+        if step_cost is None:
+            return None
+        if diagonal_cost is not None and diagonal_cost != step_cost * DIAGONAL_COST_MULTIPLIER:
+            return None
+        return step_cost
+    
+    def mark_dirty(self):
+        """
+        Signal that cell data was modified directly on GridCell objects.
+        
+        Invalidates pathfinding data derived from the grid.
+        """
+        self._invalidate_pathfinding_cache()
+    
     def get_movement_cost(self, from_pos: Vector2Int, to_pos: Vector2Int) -> float:
         """
         Calculate movement cost between adjacent cells.
@@ -293,6 +552,11 @@ class TacticalGrid:
         if not from_cell or not to_cell:
             return float('inf')
         
+        return self._step_cost(from_cell, to_cell, from_pos.manhattan_distance_to(to_pos) > 1)
+    
+    @staticmethod
+    def _step_cost(from_cell: GridCell, to_cell: GridCell, is_diagonal: bool) -> float:
+        """Movement cost of one step between two adjacent cells"""
         if not from_cell.can_move_to(to_cell):
             return float('inf')
         
@@ -303,8 +567,7 @@ class TacticalGrid:
         height_cost = from_cell.get_height_difference_cost(to_cell)
         
         # Diagonal movement costs more
-        distance = from_pos.manhattan_distance_to(to_pos)
-        diagonal_multiplier = 1.414 if distance > 1 else 1.0
+        diagonal_multiplier = DIAGONAL_COST_MULTIPLIER if is_diagonal else 1.0
         
         return (base_cost + height_cost) * diagonal_multiplier
     
@@ -393,101 +656,129 @@ class TacticalGrid:
         Returns:
             List of positions within range
         """
-        cells_in_range = []
+        positions = self._positions_by_index
+        height = self.height
+        center_x, center_y = center.x, center.y
         
-        for x in range(max(0, center.x - range_distance),
-                      min(self.width, center.x + range_distance + 1)):
-            for y in range(max(0, center.y - range_distance),
-                          min(self.height, center.y + range_distance + 1)):
-                pos = Vector2Int(x, y)
-                
-                if pos.manhattan_distance_to(center) <= range_distance:
-                    cells_in_range.append(pos)
+        # Walk the diamond column by column, clipping each span to the grid:
+        # the distance bound becomes slice limits rather than a test per tile
+        cells_in_range = []
+        for x in range(max(0, center_x - range_distance),
+                       min(self.width, center_x + range_distance + 1)):
+            span = range_distance - abs(x - center_x)
+            column = x * height
+            cells_in_range.extend(positions[column + max(0, center_y - span):
+                                            column + min(height, center_y + span + 1)])
         
         return cells_in_range
     
     def _invalidate_pathfinding_cache(self):
         """Clear pathfinding cache when grid changes"""
         self._pathfinding_cache.clear()
+        self._edge_table = [None] * (self.width * self.height)
+        self._rebuild_walkable()
+        self.version += 1
+    
+    def _invalidate_cells(self, positions: Iterable[Vector2Int]):
+        """
+        Refresh pathfinding data for changed cells only.
+        
+        A cell's edges depend on itself and its neighbours, so only those
+        edge table entries are cleared; everything else is kept.
+        """
+        self._pathfinding_cache.clear()
+        edge_table = self._edge_table
+        walkable = self._walkable
+        grid_height = self.height
+        padded_height = grid_height + 2
+        
+        for grid_pos in positions:
+            cell = self._cells_by_index[grid_pos.x * grid_height + grid_pos.y]
+            walkable[(grid_pos.x + 1) * padded_height + grid_pos.y + 1] = (
+                cell.passable and not cell.occupied)
+            
+            index = grid_pos.x * grid_height + grid_pos.y
+            edge_table[index] = None
+            for neighbor_index in self._neighbor_indices[index]:
+                edge_table[neighbor_index] = None
+        
+        self.version += 1
+    
+    def _rebuild_walkable(self):
+        """Recompute the padded walkability array from every cell"""
+        walkable = self._walkable
+        grid_height = self.height
+        padded_height = grid_height + 2
+        for index, cell in enumerate(self._cells_by_index):
+            x, y = divmod(index, grid_height)
+            walkable[(x + 1) * padded_height + y + 1] = cell.passable and not cell.occupied
     
     def _precompute_neighbors(self):
         """Pre-compute neighbor relationships for all grid positions"""
-        for x in range(self.width):
-            for y in range(self.height):
-                grid_pos = Vector2Int(x, y)
-                
-                # Compute neighbors without diagonals
-                neighbors = []
-                diagonal_neighbors = []
-                
-                # Cardinal directions
-                directions = [
-                    Vector2Int(0, 1),   # North
-                    Vector2Int(1, 0),   # East  
-                    Vector2Int(0, -1),  # South
-                    Vector2Int(-1, 0)   # West
-                ]
-                
-                for direction in directions:
-                    neighbor_pos = grid_pos + direction
-                    if (0 <= neighbor_pos.x < self.width and 
-                        0 <= neighbor_pos.y < self.height):
-                        neighbors.append(neighbor_pos)
-                        diagonal_neighbors.append(neighbor_pos)
-                
-                # Diagonal directions
-                diagonal_dirs = [
-                    Vector2Int(1, 1),   # Northeast
-                    Vector2Int(1, -1),  # Southeast
-                    Vector2Int(-1, -1), # Southwest
-                    Vector2Int(-1, 1)   # Northwest
-                ]
-                
-                for direction in diagonal_dirs:
-                    neighbor_pos = grid_pos + direction
-                    if (0 <= neighbor_pos.x < self.width and 
-                        0 <= neighbor_pos.y < self.height):
-                        diagonal_neighbors.append(neighbor_pos)
-                
-                self._neighbor_cache[grid_pos] = neighbors
-                self._diagonal_neighbor_cache[grid_pos] = diagonal_neighbors
-    
-    def generate_height_map(self, seed: int = 42, roughness: float = 0.5):
+        width = self.width
+        height = self.height
+        positions = self._positions_by_index
+        
+        # Work on flat indices and hand out the shared cell positions, so no
+        # Vector2Int is allocated per direction or per neighbour
+        for index, grid_pos in enumerate(positions):
+            x, y = divmod(index, height)
+            cardinal_indices = [(x + dx) * height + y + dy for dx, dy in _CARDINAL_OFFSETS
+                                if 0 <= x + dx < width and 0 <= y + dy < height]
+            neighbor_indices = cardinal_indices + [
+                (x + dx) * height + y + dy for dx, dy in _DIAGONAL_OFFSETS
+                if 0 <= x + dx < width and 0 <= y + dy < height]
+            
+            self._neighbor_cache[grid_pos] = [positions[i] for i in cardinal_indices]
+            self._diagonal_neighbor_cache[grid_pos] = [positions[i] for i in neighbor_indices]
+            self._neighbor_indices.append(tuple(neighbor_indices))
+    
+    def generate_height_map(self, seed: int = 42, roughness: float = 0.5,
+                            rng: Optional[random.Random] = None):
         """
         Generate height variations using simple noise.
         
         Args:
             seed: Random seed for reproducible generation
             roughness: Amount of height variation (0.0 to 1.0)
+            rng: Optional random generator to draw from instead of seeding one
         """
-        import random
-        random.seed(seed)
-        
-        # Simple height generation with smoothing
-        for grid_pos, cell in self.cells.items():
+        # A private generator keeps results reproducible without reseeding
+        # the global random module
+        if rng is None:
+            rng = random.Random(seed)
+        rand = rng.random
+        
+        grid_height = self.height
+        heights = [0.0] * len(self._cells_by_index)
+        
+        # Simple height generation with smoothing. Cells are visited in flat
+        # index order, so the already generated cardinal neighbors are the
+        # south (index - 1) and west (index - height) cells
+        for index, cell in enumerate(self._cells_by_index):
             # Generate base height with some randomness
-            noise_value = random.random() * 2 - 1  # -1 to 1
+            noise_value = rand() * 2 - 1  # -1 to 1
             base_height = noise_value * roughness * 3.0
             
             # Smooth based on neighbors
-            neighbor_heights = []
-            for neighbor_pos in self.get_neighbors(grid_pos, False):
-                neighbor_cell = self.get_cell(neighbor_pos)
-                if neighbor_cell and hasattr(neighbor_cell, '_temp_height'):
-                    neighbor_heights.append(neighbor_cell._temp_height)
+            has_south = index % grid_height > 0
+            has_west = index >= grid_height
+            if has_south and has_west:
+                avg_neighbor_height = (heights[index - 1] + heights[index - grid_height]) / 2
+            elif has_south:
+                avg_neighbor_height = heights[index - 1]
+            elif has_west:
+                avg_neighbor_height = heights[index - grid_height]
+            else:
+                avg_neighbor_height = None
             
-            if neighbor_heights:
-                avg_neighbor_height = sum(neighbor_heights) / len(neighbor_heights)
+            if avg_neighbor_height is not None:
                 final_height = (base_height + avg_neighbor_height * 0.5) / 1.5
             else:
                 final_height = base_height
             
-            cell._temp_height = final_height
-        
-        # Apply the heights
-        for cell in self.cells.values():
-            cell.height = cell._temp_height
-            delattr(cell, '_temp_height')
+            heights[index] = final_height
+            cell.height = final_height
         
         self._invalidate_pathfinding_cache()
     
@@ -0,0 +1,184 @@
+"""
+Jump Point Search Kernel
+
+Flat-index Jump Point Search for uniform-cost 8-connected grids. Only
+walkability is consulted: every straight step costs the same and every
+diagonal step costs the same. Diagonal moves may cut corners, matching
+TacticalGrid's movement rules.
+
+The walkability array is padded with a one-cell unwalkable border, so cell
+(x, y) lives at index (x + 1) * padded_height + (y + 1) and the scans never
+need bounds checks - a step in any direction is a fixed index offset.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+_INF = float('inf')
+
+
+def jps_search(walkable: bytearray, padded_height: int,
+               start: int, goal: int, straight_cost: float, diagonal_cost: float,
+               max_nodes: int, max_cost: float = _INF
+               ) -> Tuple[Dict[int, int], Optional[float], int]:
+    """
+    Run Jump Point Search between two padded cell indices.
+
+    Args:
+        walkable: Non-zero for cells that can be entered, by padded index
+        padded_height: Grid height plus the two border cells
+        start: Start cell index
+        goal: Goal cell index
+        straight_cost: Cost of one orthogonal step
+        diagonal_cost: Cost of one diagonal step
+        max_nodes: Maximum number of jump points to expand
+        max_cost: Maximum allowed path cost
+
+    Returns:
+        Tuple of (parent jump point per jump point, goal cost or None if
+        unreachable, jump points expanded)
+    """
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    goal_x, goal_y = divmod(goal, padded_height)
+    diagonal_extra = diagonal_cost - straight_cost
+
+    def jump_straight(index: int, step: int, side: int) -> int:
+        """Scan along step until a jump point, or -1; side is the perpendicular offset"""
+        while True:
+            index += step
+            if not walkable[index]:
+                return -1
+            if index == goal:
+                return index
+            # Forced neighbour: a blocked side cell with an open cell beyond it
+            if ((not walkable[index + side] and walkable[index + side + step]) or
+                    (not walkable[index - side] and walkable[index - side + step])):
+                return index
+
+    def jump_diagonal(index: int, step_x: int, step_y: int) -> int:
+        """Scan diagonally until a jump point, or -1"""
+        step = step_x + step_y
+        while True:
+            index += step
+            if not walkable[index]:
+                return -1
+            if index == goal:
+                return index
+            if ((not walkable[index - step_x] and walkable[index - step_x + step_y]) or
+                    (not walkable[index - step_y] and walkable[index + step_x - step_y])):
+                return index
+            # A jump point reachable straight from here makes this one too
+            if (jump_straight(index, step_x, 1) != -1 or
+                    jump_straight(index, step_y, padded_height) != -1):
+                return index
+
+    def heuristic(x: int, y: int) -> float:
+        dx = abs(x - goal_x)
+        dy = abs(y - goal_y)
+        if dx < dy:
+            return straight_cost * dy + diagonal_extra * dx
+        return straight_cost * dx + diagonal_extra * dy
+
+    g_scores: Dict[int, float] = {start: 0.0}
+    parents: Dict[int, int] = {start: -1}
+    closed = bytearray(len(walkable))
+
+    start_x, start_y = divmod(start, padded_height)
+    open_heap = [(heuristic(start_x, start_y), start)]
+    nodes_explored = 0
+
+    while open_heap and nodes_explored < max_nodes:
+        current = heappop(open_heap)[1]
+
+        if current == goal:
+            return parents, g_scores[goal], nodes_explored
+
+        # Skip stale heap entries superseded by a cheaper push
+        if closed[current]:
+            continue
+        closed[current] = 1
+        nodes_explored += 1
+
+        x, y = divmod(current, padded_height)
+        current_g = g_scores[current]
+
+        # Prune successor directions by the direction we arrived from
+        parent = parents[current]
+        if parent == -1:
+            directions = ((1, 0), (-1, 0), (0, 1), (0, -1),
+                          (1, 1), (1, -1), (-1, 1), (-1, -1))
+        else:
+            parent_x, parent_y = divmod(parent, padded_height)
+            dx = (x > parent_x) - (x < parent_x)
+            dy = (y > parent_y) - (y < parent_y)
+            if dx and dy:
+                directions = [(dx, 0), (0, dy), (dx, dy)]
+                if not walkable[current - dx * padded_height]:
+                    directions.append((-dx, dy))
+                if not walkable[current - dy]:
+                    directions.append((dx, -dy))
+            elif dx:
+                directions = [(dx, 0)]
+                if not walkable[current + 1]:
+                    directions.append((dx, 1))
+                if not walkable[current - 1]:
+                    directions.append((dx, -1))
+            else:
+                directions = [(0, dy)]
+                if not walkable[current + padded_height]:
+                    directions.append((1, dy))
+                if not walkable[current - padded_height]:
+                    directions.append((-1, dy))
+
+        for dx, dy in directions:
+            if dx and dy:
+                successor = jump_diagonal(current, dx * padded_height, dy)
+                step_cost = diagonal_cost
+            elif dx:
+                successor = jump_straight(current, dx * padded_height, 1)
+                step_cost = straight_cost
+            else:
+                successor = jump_straight(current, dy, padded_height)
+                step_cost = straight_cost
+
+            if successor == -1 or closed[successor]:
+                continue
+
+            successor_x, successor_y = divmod(successor, padded_height)
+            steps = max(abs(successor_x - x), abs(successor_y - y))
+            tentative_g = current_g + steps * step_cost
+            if tentative_g > max_cost or tentative_g >= g_scores.get(successor, _INF):
+                continue
+
+            g_scores[successor] = tentative_g
+            parents[successor] = current
+            heappush(open_heap, (tentative_g + heuristic(successor_x, successor_y), successor))
+
+    return parents, None, nodes_explored
+
+
+def expand_jump_points(parents: Dict[int, int], goal: int, padded_height: int) -> List[int]:
+    """
+    Walk jump point links back from goal and return every padded cell index
+    on the path in start-to-goal order, filling in the straight or diagonal
+    runs between consecutive jump points.
+    """
+    jump_points = []
+    current = goal
+    while current != -1:
+        jump_points.append(current)
+        current = parents[current]
+    jump_points.reverse()
+
+    indices = [jump_points[0]]
+    for previous, current in zip(jump_points, jump_points[1:]):
+        x, y = divmod(previous, padded_height)
+        end_x, end_y = divmod(current, padded_height)
+        step = ((end_x > x) - (end_x < x)) * padded_height + (end_y > y) - (end_y < y)
+        index = previous
+        while index != current:
+            index += step
+            indices.append(index)
+    return indices
@@ -5,15 +5,34 @@ Implements A* pathfinding optimized for <2ms queries on 10x10 grids.
 Supports height variations and movement costs.
 """
 
-import heapq
 import time
-from typing import List, Dict, Optional, Callable, Set, Tuple
+from typing import List, Dict, Optional, Callable, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 
 from .vector import Vector2Int
-from .grid import TacticalGrid
+from .grid import TacticalGrid, DIAGONAL_COST_MULTIPLIER
+from .pathfinding_kernel import astar_search, greedy_search, reconstruct_indices, SearchBuffers
+from .jps_kernel import jps_search, expand_jump_points
 from core.utils.object_pool import get_pathnode_pool
 
+# Grids at or below this many cells get an eagerly filled heuristic table
+SMALL_GRID_CELLS = 256
+
+# Filled heuristic tables kept per pathfinder, one per recent goal
+MAX_HEURISTIC_TABLES = 32
+
+# Extra cost of a diagonal step over a straight one (TacticalGrid uses 1.414)
+DIAGONAL_EXTRA_COST = 0.414
+
+
+def octile_distance(dx: int, dy: int) -> float:
+    """Minimum step cost between cells dx, dy apart on an 8-connected grid"""
+    dx = abs(dx)
+    dy = abs(dy)
+    if dx < dy:
+        return dy + DIAGONAL_EXTRA_COST * dx
+    return dx + DIAGONAL_EXTRA_COST * dy
+
 @dataclass
 class PathNode:
     """Node for pathfinding algorithms"""
@@ -57,7 +76,9 @@ class AStarPathfinder:
     """
     A* pathfinding implementation optimized for tactical grids.
     
-    Optimized for performance with caching and early termination.
+    Optimized for performance with caching and early termination. The search
+    itself runs in the flat-index kernel over the grid's cached edge table,
+    or in Jump Point Search when the grid's movement costs are uniform.
     Target: <2ms per query on 10x10 grids with height variations.
     """
     
@@ -66,12 +87,34 @@ class AStarPathfinder:
         # Use LRU cache for better cache performance
         from core.utils.lru_cache import LRUCache
         self.path_cache = LRUCache(max_size=1000)
+        self._cache_version = grid.version  # Grid version the cached paths belong to
         self.max_search_nodes = 500  # Limit for performance
         self.node_pool = get_pathnode_pool()  # Object pool for PathNode instances
+        
+        # Per-goal heuristic memo, keyed by (goal index, grid version)
+        self._heuristic_cache: List[float] = []
+        self._heuristic_key: Optional[Tuple[int, int]] = None
+        
+        # Small grids: filled heuristic tables by goal index for one grid version
+        self._heuristic_tables: Dict[int, List[float]] = {}
+        self._heuristic_tables_version = grid.version
+        
+        # Small grids: octile distance by [abs dx][abs dy], independent of the goal
+        if grid.width * grid.height <= SMALL_GRID_CELLS:
+            self._octile_rows = [[octile_distance(dx, dy) for dy in range(grid.height)]
+                                 for dx in range(grid.width)]
+            self._search_buffers: Optional[SearchBuffers] = None
+        else:
+            self._octile_rows = []
+            # Large grids: reuse the kernel's per-cell lists across searches
+            self._search_buffers = SearchBuffers(grid.width * grid.height)
+        
+        # Created on first query against a uniform-cost grid
+        self._jump_point_search: Optional['JumpPointSearch'] = None
     
     def find_path(self, start: Vector2Int, goal: Vector2Int,
                   movement_cost_func: Optional[Callable[[Vector2Int, Vector2Int], float]] = None,
-                  max_cost: float = float('inf')) -> PathfindingResult:
+                  max_cost: float = float('inf'), optimal: bool = True) -> PathfindingResult:
         """
         Find path from start to goal using A* algorithm.
         
@@ -80,19 +123,33 @@ class AStarPathfinder:
             goal: Goal position
             movement_cost_func: Optional custom movement cost function
             max_cost: Maximum allowed path cost
+            optimal: False accepts the first feasible path found by greedy
+                best-first search instead of the cheapest one
             
         Returns:
             PathfindingResult with path and performance data
         """
         search_start_time = time.perf_counter()
         
-        # Check cache first
-        cache_key = (start, goal)
-        cached_result = self.path_cache.get(cache_key)
-        if cached_result is not None:
-            # Update search time for cached result
-            cached_result.search_time = time.perf_counter() - search_start_time
-            return cached_result
+        # Cached paths are only valid for the grid version they were found on
+        if self._cache_version != self.grid.version:
+            self.path_cache.clear()
+            self._cache_version = self.grid.version
+        
+        # Check cache first; custom costs and cost limits bypass it
+        if movement_cost_func is None and max_cost == float('inf'):
+            # Greedy paths are cached apart so they never answer optimal queries
+            if optimal:
+                cache_key = (start.x, start.y, goal.x, goal.y)
+            else:
+                cache_key = (start.x, start.y, goal.x, goal.y, False)
+            cached_result = self.path_cache.get(cache_key)
+            if cached_result is not None:
+                # Update search time for cached result
+                cached_result.search_time = time.perf_counter() - search_start_time
+                return cached_result
+        else:
+            cache_key = None
         
         # Validate start and goal
         if not self._is_valid_position(start) or not self._is_valid_position(goal):
@@ -104,86 +161,178 @@ class AStarPathfinder:
             self._cache_result(cache_key, result)
             return result
         
-        # Use custom cost function or default grid costs
-        cost_func = movement_cost_func or self.grid.get_movement_cost
-        
-        # A* algorithm
-        open_set = []
-        closed_set: Set[Vector2Int] = set()
-        nodes: Dict[Vector2Int, PathNode] = {}
-        used_nodes: List[PathNode] = []  # Track nodes for cleanup
-        
-        # Initialize start node using object pool
-        start_node = self.node_pool.get_node(start, 0.0, self._heuristic(start, goal))
-        nodes[start] = start_node
-        used_nodes.append(start_node)
-        heapq.heappush(open_set, start_node)
+        grid = self.grid
         
-        nodes_explored = 0
-        
-        while open_set and nodes_explored < self.max_search_nodes:
-            current_node = heapq.heappop(open_set)
-            current_pos = current_node.position
+        # Uniform costs only depend on walkability, so Jump Point Search can
+        # skip the straight and diagonal runs A* would expand cell by cell
+        if optimal and movement_cost_func is None:
+            step_cost = grid.get_uniform_step_cost()
+        else:
+            step_cost = None
+        if step_cost is not None:
+            if self._jump_point_search is None:
+                self._jump_point_search = JumpPointSearch(grid)
+            path, goal_cost, nodes_explored = self._jump_point_search.search(
+                start, goal, step_cost, self.max_search_nodes, max_cost
+            )
+        else:
+            grid_height = grid.height
+            start_index = start.x * grid_height + start.y
+            goal_index = goal.x * grid_height + goal.y
             
-            # Check if we reached the goal
-            if current_pos == goal:
-                path = self._reconstruct_path(current_node)
-                search_time = time.perf_counter() - search_start_time
-                result = PathfindingResult(path, current_node.g_cost, search_time, nodes_explored)
-                self._cache_result(cache_key, result)
-                
-                # Return used nodes to pool for reuse
-                self.node_pool.return_nodes(used_nodes)
-                
-                return result
+            # Custom cost functions are adapted to the kernel's edge format;
+            # default costs come from the grid's cached edge table
+            if movement_cost_func is None:
+                if grid.width * grid_height <= SMALL_GRID_CELLS:
+                    # Small grids: build every edge once and let the kernel index
+                    # the table through the list's C-level __getitem__
+                    edges_for = grid.get_edge_table().__getitem__
+                else:
+                    edges_for = grid.get_edges
+            else:
+                edges_for = self._custom_edges(movement_cost_func)
             
-            closed_set.add(current_pos)
-            nodes_explored += 1
+            if optimal:
+                parents, goal_cost, nodes_explored = astar_search(
+                    edges_for, self._index_heuristic(goal),
+                    start_index, goal_index, grid.width * grid_height,
+                    self.max_search_nodes, max_cost, self._search_buffers
+                )
+            else:
+                parents, goal_cost, nodes_explored = greedy_search(
+                    edges_for, self._index_heuristic(goal),
+                    start_index, goal_index, grid.width * grid_height,
+                    self.max_search_nodes, max_cost
+                )
             
-            # Explore neighbors
-            for neighbor_pos in self.grid.get_neighbors(current_pos):
-                if neighbor_pos in closed_set:
-                    continue
-                
-                # Calculate movement cost
-                movement_cost = cost_func(current_pos, neighbor_pos)
-                if movement_cost == float('inf'):
-                    continue  # Impassable
-                
-                tentative_g_cost = current_node.g_cost + movement_cost
-                
-                # Skip if cost exceeds maximum
-                if tentative_g_cost > max_cost:
-                    continue
-                
-                # Check if this is a better path to the neighbor
-                if neighbor_pos not in nodes:
-                    neighbor_node = self.node_pool.get_node(
-                        neighbor_pos,
-                        tentative_g_cost,
-                        self._heuristic(neighbor_pos, goal),
-                        current_node
-                    )
-                    nodes[neighbor_pos] = neighbor_node
-                    used_nodes.append(neighbor_node)
-                    heapq.heappush(open_set, neighbor_node)
-                    
-                elif tentative_g_cost < nodes[neighbor_pos].g_cost:
-                    neighbor_node = nodes[neighbor_pos]
-                    neighbor_node.g_cost = tentative_g_cost
-                    neighbor_node.parent = current_node
-                    # Re-add to open set (heapq doesn't support decrease-key)
-                    heapq.heappush(open_set, neighbor_node)
-        
-        # No path found
+            if goal_cost is None:
+                # No path found
+                path = []
+                goal_cost = 0.0
+            else:
+                positions = grid.get_positions()
+                path = [positions[index] for index in reconstruct_indices(parents, goal_index)]
+        
         search_time = time.perf_counter() - search_start_time
-        result = PathfindingResult([], 0.0, search_time, nodes_explored)
+        result = PathfindingResult(path, goal_cost, search_time, nodes_explored)
         self._cache_result(cache_key, result)
+        return result
+    
+    def find_any_path(self, start: Vector2Int, goal: Vector2Int) -> PathfindingResult:
+        """
+        Find a feasible path from start to goal, not necessarily the cheapest.
         
-        # Return used nodes to pool for reuse
-        self.node_pool.return_nodes(used_nodes)
+        For callers that only need reachability or a plausible route; greedy
+        best-first search expands far fewer nodes than A* on open grids.
+        """
+        return self.find_path(start, goal, optimal=False)
+    
+    def find_paths(self, pairs: Sequence[Tuple[Vector2Int, Vector2Int]]) -> List[PathfindingResult]:
+        """
+        Find paths for several (start, goal) pairs on this grid.
         
-        return result
+        Queries share the path cache, edge table and per-goal heuristic
+        tables, so pairs with a common goal only fill its table once. Each
+        result's search_time covers its own query.
+        
+        Args:
+            pairs: (start, goal) positions to query
+            
+        Returns:
+            One PathfindingResult per pair, in the same order
+        """
+        find_path = self.find_path
+        return [find_path(start, goal) for start, goal in pairs]
+    
+    def _custom_edges(self, cost_func: Callable[[Vector2Int, Vector2Int], float]
+                      ) -> Callable[[int], List[Tuple[int, float]]]:
+        """Adapt a position-based movement cost function to kernel edges"""
+        grid = self.grid
+        grid_height = grid.height
+        positions = grid.get_positions()
+        
+        def edges_for(index: int) -> List[Tuple[int, float]]:
+            pos = positions[index]
+            edges = []
+            for neighbor_pos in grid.get_neighbors(pos):
+                cost = cost_func(pos, neighbor_pos)
+                if cost != float('inf'):
+                    edges.append((neighbor_pos.x * grid_height + neighbor_pos.y, cost))
+            return edges
+        
+        return edges_for
+    
+    def _index_heuristic(self, goal: Vector2Int) -> Callable[[int], float]:
+        """
+        Build heuristic over flat cell indices for the given goal.
+        
+        Values are memoized on first touch and reused across find_path calls
+        while the goal and grid version stay the same.
+        """
+        grid = self.grid
+        grid_width = grid.width
+        grid_height = grid.height
+        goal_x, goal_y = goal.x, goal.y
+        goal_index = goal_x * grid_height + goal_y
+        cells = grid._cells_by_index
+        goal_height = cells[goal_index].height
+        
+        if grid_width * grid_height <= SMALL_GRID_CELLS:
+            # Small grids: fill the whole table once per goal and hand the
+            # kernel the list's C-level __getitem__, avoiding a Python call
+            # per lookup. Tables for recent goals are kept, since callers
+            # typically cycle between a handful of targets
+            if self._heuristic_tables_version != grid.version:
+                self._heuristic_tables.clear()
+                self._heuristic_tables_version = grid.version
+            
+            h_table = self._heuristic_tables.get(goal_index)
+            if h_table is None:
+                h_table = self._fill_heuristic_table(cells, goal_x, goal_y, goal_height)
+                if len(self._heuristic_tables) >= MAX_HEURISTIC_TABLES:
+                    self._heuristic_tables.clear()
+                self._heuristic_tables[goal_index] = h_table
+            return h_table.__getitem__
+        
+        heuristic_key = (goal_index, grid.version)
+        if heuristic_key != self._heuristic_key:
+            self._heuristic_cache = [-1.0] * (grid_width * grid_height)
+            self._heuristic_key = heuristic_key
+        h_cache = self._heuristic_cache
+        
+        def heuristic(index: int) -> float:
+            h = h_cache[index]
+            if h < 0.0:
+                # Octile distance with conservative height cost estimate
+                x, y = divmod(index, grid_height)
+                h = (octile_distance(x - goal_x, y - goal_y) +
+                     abs(cells[index].height - goal_height) * 0.5)
+                h_cache[index] = h
+            return h
+        
+        return heuristic
+    
+    def _fill_heuristic_table(self, cells: list, goal_x: int, goal_y: int,
+                              goal_height: float) -> List[float]:
+        """
+        Heuristic for every cell index of a small grid.
+        
+        Each grid column's octile distances are two slices of the precomputed
+        row for its dx (mirrored above goal_y, straight from it), so only the
+        height term is computed per cell.
+        """
+        grid_height = self.grid.height
+        octile_rows = self._octile_rows
+        
+        octile = []
+        extend = octile.extend
+        for x in range(self.grid.width):
+            row = octile_rows[abs(x - goal_x)]
+            extend(row[goal_y:0:-1])
+            extend(row[:grid_height - goal_y])
+        
+        return [h + abs(cell.height - goal_height) * 0.5
+                for h, cell in zip(octile, cells)]
     
     def find_reachable_positions(self, start: Vector2Int, max_movement: float) -> List[Vector2Int]:
         """
@@ -229,7 +378,7 @@ class AStarPathfinder:
     
     def _heuristic(self, pos: Vector2Int, goal: Vector2Int) -> float:
         """
-        Heuristic function for A* (Manhattan distance with height consideration).
+        Heuristic function for A* (octile distance with height consideration).
         
         Args:
             pos: Current position
@@ -238,8 +387,8 @@ class AStarPathfinder:
         Returns:
             Estimated cost to goal
         """
-        # Manhattan distance as base
-        manhattan_dist = pos.manhattan_distance_to(goal)
+        # Octile distance as base; diagonal moves make Manhattan overestimate
+        octile_dist = octile_distance(pos.x - goal.x, pos.y - goal.y)
         
         # Add height difference consideration
         pos_cell = self.grid.get_cell(pos)
@@ -248,9 +397,9 @@ class AStarPathfinder:
         if pos_cell and goal_cell:
             height_diff = abs(pos_cell.height - goal_cell.height)
             height_cost = height_diff * 0.5  # Conservative height cost estimate
-            return float(manhattan_dist) + height_cost
+            return octile_dist + height_cost
         
-        return float(manhattan_dist)
+        return octile_dist
     
     def _reconstruct_path(self, goal_node: PathNode) -> List[Vector2Int]:
         """Reconstruct path from goal node back to start"""
@@ -269,10 +418,11 @@ class AStarPathfinder:
         cell = self.grid.get_cell(pos)
         return cell is not None and cell.passable
     
-    def _cache_result(self, cache_key: Tuple[Vector2Int, Vector2Int], 
+    def _cache_result(self, cache_key: Optional[Tuple[int, ...]],
                      result: PathfindingResult):
         """Cache pathfinding result using LRU cache"""
-        self.path_cache.put(cache_key, result)
+        if cache_key is not None:
+            self.path_cache.put(cache_key, result)
     
     def clear_cache(self):
         """Clear pathfinding cache"""
@@ -292,21 +442,74 @@ class AStarPathfinder:
 
 class JumpPointSearch:
     """
-    Jump Point Search pathfinding (JPS) for improved performance.
+    Jump Point Search pathfinding (JPS) for uniform-cost grids.
     
-    More advanced pathfinding algorithm that can be 10-40x faster than A*
-    on uniform grids. Planned for future optimization.
+    Prunes the symmetric paths A* would expand and only stops at jump
+    points, which makes it several times faster than A* on open or walled
+    maps. JPS needs every step of a kind to cost the same, so grids with
+    terrain or height costs fall back to A*.
     """
     
     def __init__(self, grid: TacticalGrid):
         self.grid = grid
-        # TODO: Implement JPS for Phase 2 optimization
+        self.max_search_nodes = 500  # Limit on jump points expanded
+        self._fallback: Optional[AStarPathfinder] = None
     
     def find_path(self, start: Vector2Int, goal: Vector2Int) -> PathfindingResult:
-        """Find path using Jump Point Search"""
-        # Placeholder - fall back to A* for now
-        pathfinder = AStarPathfinder(self.grid)
-        return pathfinder.find_path(start, goal)
+        """Find path using Jump Point Search, or A* if costs are not uniform"""
+        step_cost = self.grid.get_uniform_step_cost()
+        if step_cost is None:
+            if self._fallback is None:
+                self._fallback = AStarPathfinder(self.grid)
+            return self._fallback.find_path(start, goal)
+        
+        search_start_time = time.perf_counter()
+        
+        for pos in (start, goal):
+            cell = self.grid.get_cell(pos)
+            if not cell or not cell.passable:
+                return PathfindingResult([], 0.0, time.perf_counter() - search_start_time, 0)
+        
+        if start == goal:
+            return PathfindingResult([start], 0.0, time.perf_counter() - search_start_time, 1)
+        
+        path, cost, nodes_explored = self.search(start, goal, step_cost, self.max_search_nodes)
+        return PathfindingResult(path, cost, time.perf_counter() - search_start_time, nodes_explored)
+    
+    def search(self, start: Vector2Int, goal: Vector2Int, step_cost: float,
+               max_nodes: int, max_cost: float = float('inf')) -> Tuple[List[Vector2Int], float, int]:
+        """
+        Run the JPS kernel between two distinct, validated positions.
+        
+        Args:
+            start: Starting position
+            goal: Goal position
+            step_cost: Uniform straight step cost from get_uniform_step_cost
+            max_nodes: Maximum number of jump points to expand
+            max_cost: Maximum allowed path cost
+            
+        Returns:
+            Tuple of (path, cost, jump points expanded); the path is empty
+            and the cost 0.0 if the goal is unreachable
+        """
+        padded_height = self.grid.height + 2
+        goal_index = (goal.x + 1) * padded_height + goal.y + 1
+        
+        parents, goal_cost, nodes_explored = jps_search(
+            self.grid.get_walkable(), padded_height,
+            (start.x + 1) * padded_height + start.y + 1, goal_index,
+            step_cost, step_cost * DIAGONAL_COST_MULTIPLIER, max_nodes, max_cost
+        )
+        
+        if goal_cost is None:
+            return [], 0.0, nodes_explored
+        
+        # Padded index minus (padded_height + 1) is x * (height + 2) + y, so
+        # also subtracting 2 * x gives the unpadded x * height + y
+        positions = self.grid.get_positions()
+        path = [positions[index - padded_height - 1 - 2 * (index // padded_height - 1)]
+                for index in expand_jump_points(parents, goal_index, padded_height)]
+        return path, goal_cost, nodes_explored
 
 # Utility functions for pathfinding
 
@@ -16,6 +16,8 @@ class Vector3:
     Optimized for frequent calculations in tactical grid system.
     """
     
+    __slots__ = ('_x', '_y', '_z')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self._x = float(x)
         self._y = float(y)
@@ -167,6 +169,8 @@ class Vector2Int:
     Integer-only operations ensure exact grid alignment.
     """
     
+    __slots__ = ('_x', '_y')
+    
     def __init__(self, x: int = 0, y: int = 0):
         self._x = int(x)
         self._y = int(y)
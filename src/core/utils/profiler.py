@@ -6,19 +6,26 @@ Performance monitoring and profiling utilities for the tactical RPG engine.
 
 import time
 import statistics
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from contextlib import contextmanager
-from collections import defaultdict
+from collections import defaultdict, deque
+
+
+_NS_PER_SECOND = 1_000_000_000
 
 
 @dataclass
 class PerformanceMetric:
     """Individual performance measurement"""
     name: str
-    duration: float
+    duration_ns: int
     timestamp: float
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def duration(self) -> float:
+        """Duration in seconds"""
+        return self.duration_ns / _NS_PER_SECOND
 
 
 @dataclass
@@ -41,6 +48,27 @@ class PerformanceStats:
         return 0.0
 
 
+class _MeasureContext:
+    """Context manager returned by PerformanceProfiler.measure"""
+    
+    __slots__ = ('profiler', 'operation_name', 'metadata', 'start_ns')
+    
+    def __init__(self, profiler: 'PerformanceProfiler', operation_name: str,
+                 metadata: Dict[str, Any]):
+        self.profiler = profiler
+        self.operation_name = operation_name
+        self.metadata = metadata
+    
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        self.profiler._record_ns(self.operation_name, duration_ns, self.metadata)
+        return False
+
+
 class PerformanceProfiler:
     """
     Performance profiling system for monitoring engine performance.
@@ -51,8 +79,9 @@ class PerformanceProfiler:
     
     def __init__(self, max_samples: int = 1000):
         self.max_samples = max_samples
-        self.measurements: Dict[str, List[PerformanceMetric]] = defaultdict(list)
-        self.active_timers: Dict[str, float] = {}
+        # Most recent max_samples measurements per operation
+        self.measurements: Dict[str, Deque[PerformanceMetric]] = defaultdict(lambda: deque(maxlen=max_samples))
+        self.active_timers: Dict[str, int] = {}  # perf_counter_ns start times
         
         # Performance targets (from Advanced-Implementation-Guide.md)
         self.performance_targets = {
@@ -72,52 +101,42 @@ class PerformanceProfiler:
         self.history_interval = 1.0  # seconds
         self.last_history_time = time.time()
     
-    @contextmanager
-    def measure(self, operation_name: str, **metadata):
+    def measure(self, operation_name: str, **metadata) -> _MeasureContext:
         """Context manager for measuring operation performance"""
-        start_time = time.perf_counter()
-        
-        try:
-            yield
-        finally:
-            end_time = time.perf_counter()
-            duration = end_time - start_time
-            
-            self.record_measurement(operation_name, duration, **metadata)
+        # A slotted object rather than a generator-based context manager
+        return _MeasureContext(self, operation_name, metadata)
     
     def start_timer(self, operation_name: str):
         """Start a named timer"""
-        self.active_timers[operation_name] = time.perf_counter()
+        self.active_timers[operation_name] = time.perf_counter_ns()
     
     def stop_timer(self, operation_name: str, **metadata) -> float:
         """Stop a named timer and record the measurement"""
         if operation_name not in self.active_timers:
             raise ValueError(f"Timer '{operation_name}' was not started")
         
-        start_time = self.active_timers.pop(operation_name)
-        end_time = time.perf_counter()
-        duration = end_time - start_time
-        
-        self.record_measurement(operation_name, duration, **metadata)
-        return duration
+        duration_ns = time.perf_counter_ns() - self.active_timers.pop(operation_name)
+        self._record_ns(operation_name, duration_ns, metadata)
+        return duration_ns / _NS_PER_SECOND
     
     def record_measurement(self, operation_name: str, duration: float, **metadata):
-        """Record a performance measurement"""
+        """Record a performance measurement given in seconds"""
+        self._record_ns(operation_name, round(duration * _NS_PER_SECOND), metadata)
+    
+    def _record_ns(self, operation_name: str, duration_ns: int, metadata: Dict[str, Any]):
+        """Record a measurement kept as integer nanoseconds"""
         metric = PerformanceMetric(
             name=operation_name,
-            duration=duration,
+            duration_ns=duration_ns,
             timestamp=time.time(),
             metadata=metadata
         )
         
+        # Bounded deque drops the oldest sample, so memory does not grow
         self.measurements[operation_name].append(metric)
         
-        # Limit sample size to prevent memory growth
-        if len(self.measurements[operation_name]) > self.max_samples:
-            self.measurements[operation_name] = self.measurements[operation_name][-self.max_samples:]
-        
         # Check for performance issues
-        self._check_performance_threshold(operation_name, duration)
+        self._check_performance_threshold(operation_name, duration_ns / _NS_PER_SECOND)
         
         # Update performance history
         self._update_performance_history()
@@ -151,8 +170,8 @@ class PerformanceProfiler:
                                 if current_time - m.timestamp <= self.history_interval]
                 
                 if recent_metrics:
-                    avg_duration = statistics.mean(m.duration for m in recent_metrics)
-                    history_entry[operation_name] = avg_duration
+                    total_ns = sum(m.duration_ns for m in recent_metrics)
+                    history_entry[operation_name] = total_ns / len(recent_metrics) / _NS_PER_SECOND
             
             if history_entry:
                 self.performance_history.append(history_entry)
@@ -172,17 +191,19 @@ class PerformanceProfiler:
         if not metrics:
             return None
         
-        durations = [m.duration for m in metrics]
+        # Aggregate in exact integer nanoseconds, converting to seconds once
+        durations_ns = [m.duration_ns for m in metrics]
+        total_ns = sum(durations_ns)
         
         return PerformanceStats(
             name=operation_name,
-            total_calls=len(durations),
-            total_time=sum(durations),
-            min_time=min(durations),
-            max_time=max(durations),
-            average_time=statistics.mean(durations),
-            median_time=statistics.median(durations),
-            last_measurement=durations[-1]
+            total_calls=len(durations_ns),
+            total_time=total_ns / _NS_PER_SECOND,
+            min_time=min(durations_ns) / _NS_PER_SECOND,
+            max_time=max(durations_ns) / _NS_PER_SECOND,
+            average_time=total_ns / len(durations_ns) / _NS_PER_SECOND,
+            median_time=statistics.median(durations_ns) / _NS_PER_SECOND,
+            last_measurement=durations_ns[-1] / _NS_PER_SECOND
         )
     
     def get_all_stats(self) -> Dict[str, PerformanceStats]:
@@ -4,7 +4,9 @@ Turn Manager System
 Manages turn order, initiative, and turn phases in tactical combat.
 """
 
+import random
 from enum import Enum
+from operator import attrgetter
 from typing import List, Dict, Optional, Callable
 from dataclasses import dataclass
 from core.ecs.entity import Entity
@@ -12,6 +14,9 @@ from components.stats.attributes import AttributeStats
 from .action_queue import ActionQueue, BattleAction
 
 
+_D20_FACES = range(1, 21)
+
+
 class TurnPhase(Enum):
     """Phases of a combat turn"""
     INITIATIVE = "initiative"      # Calculate turn order
@@ -74,32 +79,27 @@ class TurnManager:
         Args:
             units: Units to calculate initiative for
         """
-        import random
-        
-        initiative_list = []
-        
+        # One pass over the ECS for each unit's speed, then every 1d20
+        # roll drawn in a single call rather than one randint per unit
+        speeds = []
         for unit in units:
             attributes = unit.get_component(AttributeStats)
-            if not attributes:
-                continue
-            
-            # Base initiative from speed attribute
-            base_initiative = attributes.speed
-            
-            # Add random factor (1d20)
-            random_factor = random.randint(1, 20)
-            
-            # Total initiative
-            total_initiative = base_initiative + random_factor
-            
-            initiative_list.append(InitiativeEntry(
-                unit_id=unit.id,
-                initiative_value=total_initiative,
+            if attributes:
+                speeds.append((unit.id, attributes.speed))
+        rolls = random.choices(_D20_FACES, k=len(speeds))
+        
+        # Total initiative is speed plus the roll
+        initiative_list = [
+            InitiativeEntry(
+                unit_id=unit_id,
+                initiative_value=speed + roll,
                 is_player_controlled=True  # TODO: Implement proper player/AI detection
-            ))
+            )
+            for (unit_id, speed), roll in zip(speeds, rolls)
+        ]
         
-        # Sort by initiative (highest first)
-        initiative_list.sort(key=lambda x: x.initiative_value, reverse=True)
+        # Sort by initiative (highest first); stable, so ties keep unit order
+        initiative_list.sort(key=attrgetter('initiative_value'), reverse=True)
         self.initiative_order = initiative_list
     
     def get_current_unit(self) -> Optional[int]:
@@ -62,6 +62,7 @@ class BattleGrid:
             cell = self.grid.get_cell(grid_pos)
             if cell:
                 cell.occupied = True
+                self.grid.mark_dirty()
         except Exception as e:
             print(f"⚠ Could not update grid cell: {e}")
     
@@ -87,6 +88,7 @@ class BattleGrid:
             old_cell = self.grid.get_cell(old_pos)
             if old_cell:
                 old_cell.occupied = False
+                self.grid.mark_dirty()
         except Exception as e:
             print(f"⚠ Could not clear old grid cell: {e}")
         
@@ -105,6 +107,7 @@ class BattleGrid:
             new_cell = self.grid.get_cell(new_pos)
             if new_cell:
                 new_cell.occupied = True
+                self.grid.mark_dirty()
         except Exception as e:
             print(f"⚠ Could not update new grid cell: {e}")
         
@@ -142,6 +145,7 @@ class BattleGrid:
                 cell = self.grid.get_cell(grid_pos)
                 if cell:
                     cell.occupied = False
+                    self.grid.mark_dirty()
             except Exception as e:
                 print(f"⚠ Could not clear grid cell: {e}")
             
@@ -54,6 +54,7 @@ class Unit:
         
         # Legacy compatibility properties
         self.alive = True
+        self._current_ap = None
         self.action_options = ["Move", "Attack", "Spirit", "Magic", "Inventory"]
     
     # Attribute property accessors (exactly as in original)
@@ -120,12 +121,12 @@ class Unit:
     
     @property
     def ap(self):
-        return self.stats.derived_stats.get('current_ap', self.speed)
+        return self.speed if self._current_ap is None else self._current_ap
     
     @ap.setter
     def ap(self, value):
-        # Store AP in derived cache - this is a bit of a hack for legacy compatibility
-        self.stats.derived_stats['current_ap'] = value
+        # Derived stats are read-only, so current AP lives on the wrapper
+        self._current_ap = value
     
     # Movement properties
     @property
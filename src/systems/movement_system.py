@@ -26,6 +26,14 @@ class MovementSystem(BaseSystem):
         """Movement system requires Transform component"""
         return {Transform}
     
+    def get_read_components(self) -> Set[Type[BaseComponent]]:
+        """Movement reads positions only"""
+        return {Transform}
+    
+    def get_write_components(self) -> Set[Type[BaseComponent]]:
+        """Movement writes positions only"""
+        return {Transform}
+    
     def update(self, delta_time: float, entities: List[Entity]):
         """
         Update movement for all entities.
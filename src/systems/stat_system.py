@@ -5,7 +5,7 @@ Handles stat calculations and derived stat updates for all entities.
 Implements the nine-attribute system from Advanced-Implementation-Guide.md
 """
 
-from typing import Set, Type, List
+from typing import Dict, Optional, Set, Type, List, Tuple
 import time
 from core.ecs.system import BaseSystem
 from core.ecs.entity import Entity
@@ -25,6 +25,10 @@ class StatSystem(BaseSystem):
     Performance target: <1ms for complex character sheets.
     """
     
+    # Longest sleep while idle, bounding how late external resource or
+    # attribute changes are picked up
+    IDLE_SLEEP_TIME = 0.25
+    
     def __init__(self):
         super().__init__("StatSystem")
         self.priority = 10  # High priority for stat calculations
@@ -33,24 +37,67 @@ class StatSystem(BaseSystem):
         # Performance tracking
         self.entities_processed = 0
         self.total_calculation_time = 0.0
+        
+        # Modified derived stats per entity ID, with the modifier version and
+        # base derived stats they were computed from
+        self._modified_stats: Dict[str, Tuple[int, Dict[str, int], Dict[str, int]]] = {}
     
     def get_required_components(self) -> Set[Type[BaseComponent]]:
         """Stats system requires AttributeStats component"""
         return {AttributeStats}
     
-    def update(self, delta_time: float, entities: List[Entity]):
+    def get_read_components(self) -> Set[Type[BaseComponent]]:
+        """Stat components read while updating derived values"""
+        return {AttributeStats, ResourceManager, ModifierManager}
+    
+    def get_write_components(self) -> Set[Type[BaseComponent]]:
+        """Resources are rescaled and regenerated, modifiers expire"""
+        return {ResourceManager, ModifierManager}
+    
+    def update(self, delta_time: float, entities: List[Entity]) -> Optional[float]:
         """
         Update stat calculations for all entities.
         
         Args:
             delta_time: Time elapsed since last update
             entities: Entities with AttributeStats components
+            
+        Returns:
+            Seconds the system may sleep when no entity has regeneration,
+            decay or modifier expiry pending, otherwise None
         """
         with self.performance_monitor.measure("stat_system_update"):
             for entity in entities:
                 self._update_entity_stats(entity, delta_time)
         
+        # Drop rows for entities that are no longer processed
+        if len(self._modified_stats) > len(entities):
+            live_ids = {entity.id for entity in entities}
+            self._modified_stats = {entity_id: row for entity_id, row in self._modified_stats.items()
+                                    if entity_id in live_ids}
+        
         self.entities_processed += len(entities)
+        
+        return self._get_idle_sleep_time(entities)
+    
+    def _get_idle_sleep_time(self, entities: List[Entity]) -> Optional[float]:
+        """Seconds until any entity's stats next change on their own, or None if every frame"""
+        sleep_time = self.IDLE_SLEEP_TIME
+        current_time = time.time()
+        
+        for entity in entities:
+            resources = entity.get_component(ResourceManager)
+            if resources and (not resources.mp.is_full or
+                              resources.rage.current_value > resources.rage.decay_threshold):
+                return None
+            
+            modifiers = entity.get_component(ModifierManager)
+            if modifiers:
+                for modifier in modifiers.modifiers:
+                    if modifier.active and modifier.duration > 0:
+                        sleep_time = min(sleep_time, modifier.expires_at - current_time)
+        
+        return sleep_time if sleep_time > 0.0 else None
     
     def _update_entity_stats(self, entity: Entity, delta_time: float):
         """
@@ -99,7 +146,7 @@ class StatSystem(BaseSystem):
         
         # Apply modifiers to derived stats if modifiers exist
         if modifiers:
-            self._apply_modifiers_to_stats(attributes, modifiers)
+            self._apply_modifiers_to_stats(entity.id, attributes, modifiers)
         
         # Performance tracking
         calculation_time = time.perf_counter() - start_time
@@ -109,27 +156,59 @@ class StatSystem(BaseSystem):
         if calculation_time > 0.001:  # 1ms target
             Logger.warning(f"Slow stat calculation: {calculation_time*1000:.2f}ms for entity {entity.id[:8]}")
     
-    def _apply_modifiers_to_stats(self, attributes: AttributeStats, 
+    def _apply_modifiers_to_stats(self, entity_id: str, attributes: AttributeStats, 
                                  modifiers: ModifierManager):
         """
         Apply modifiers to attribute stats.
         
+        Only recalculates when the entity's modifiers or base derived stats
+        changed since the last frame; otherwise the stored row is kept.
+        
         Args:
+            entity_id: ID of the entity owning the components
             attributes: AttributeStats component
             modifiers: ModifierManager component
         """
         # Get base derived stats
         base_derived = attributes.derived_stats
         
+        row = self._modified_stats.get(entity_id)
+        # Derived stats are shared until recalculated, so identity is the
+        # common case; equality catches a recalculation to the same values
+        if (row is not None and row[0] == modifiers.version and
+                (row[1] is base_derived or row[1] == base_derived)):
+            return
+        
         # Apply modifiers to each stat
-        modified_stats = {}
-        for stat_name, base_value in base_derived.items():
-            final_value = modifiers.calculate_final_stat(base_value, stat_name)
-            modified_stats[stat_name] = final_value
-        
-        # Store modified stats back to attributes component
-        # (This would require extending AttributeStats to store modified values)
-        # For now, modifiers are calculated on-demand
+        calculate_final_stat = modifiers.calculate_final_stat
+        modified_stats = {stat_name: calculate_final_stat(base_value, stat_name)
+                          for stat_name, base_value in base_derived.items()}
+        
+        # Kept on the system rather than the AttributeStats component, which
+        # only holds base values
+        self._modified_stats[entity_id] = (modifiers.version, base_derived, modified_stats)
+    
+    def get_modified_stats(self, entity: Entity) -> Dict[str, int]:
+        """
+        Get derived stats with modifiers applied.
+        
+        Recalculated here if the entity's modifiers or base stats changed
+        since the last update.
+        
+        Args:
+            entity: Entity to get stats for
+            
+        Returns:
+            Modified derived stats, or an empty dict if the entity has not
+            been processed with a ModifierManager
+        """
+        attributes = entity.get_component(AttributeStats)
+        modifiers = entity.get_component(ModifierManager)
+        if attributes and modifiers:
+            self._apply_modifiers_to_stats(entity.id, attributes, modifiers)
+        
+        row = self._modified_stats.get(entity.id)
+        return dict(row[2]) if row is not None else {}
     
     def get_final_stat_value(self, entity: Entity, stat_name: str) -> int:
         """
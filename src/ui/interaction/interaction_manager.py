@@ -232,33 +232,21 @@ class InteractionManager:
     
     def _highlight_movement_range(self, center: Vector2Int, range_distance: int):
         """Highlight tiles within movement range"""
-        for x in range(max(0, center.x - range_distance), 
-                      min(self.grid_system.width, center.x + range_distance + 1)):
-            for y in range(max(0, center.y - range_distance),
-                          min(self.grid_system.height, center.y + range_distance + 1)):
-                pos = Vector2Int(x, y)
-                distance = abs(pos.x - center.x) + abs(pos.y - center.y)
-                
-                if distance <= range_distance and distance > 0:
-                    tile = self.tiles.get(pos)
-                    if tile and self._is_valid_movement_tile(tile):
-                        tile.set_state(TileState.MOVEMENT_RANGE)
+        for pos in self.grid_system.get_cells_in_range(center, range_distance):
+            if pos != center:
+                tile = self.tiles.get(pos)
+                if tile and self._is_valid_movement_tile(tile):
+                    tile.set_state(TileState.MOVEMENT_RANGE)
     
     def _highlight_attack_range(self, center: Vector2Int, range_distance: int):
         """Highlight tiles within attack range"""
-        for x in range(max(0, center.x - range_distance),
-                      min(self.grid_system.width, center.x + range_distance + 1)):
-            for y in range(max(0, center.y - range_distance),
-                          min(self.grid_system.height, center.y + range_distance + 1)):
-                pos = Vector2Int(x, y)
-                distance = abs(pos.x - center.x) + abs(pos.y - center.y)
-                
-                if distance <= range_distance and distance > 0:
-                    tile = self.tiles.get(pos)
-                    if tile:
-                        # Don't override movement range highlighting
-                        if tile.current_state == TileState.NORMAL:
-                            tile.set_state(TileState.ATTACK_RANGE)
+        for pos in self.grid_system.get_cells_in_range(center, range_distance):
+            if pos != center:
+                tile = self.tiles.get(pos)
+                if tile:
+                    # Don't override movement range highlighting
+                    if tile.current_state == TileState.NORMAL:
+                        tile.set_state(TileState.ATTACK_RANGE)
     
     def _clear_all_tile_highlights(self):
         """Clear highlighting from all tiles"""
@@ -4,9 +4,10 @@ Combat Animation Framework
 Visual animation system for combat actions, effects, and unit movements.
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass
+import heapq
 import time
 import math
 
@@ -58,8 +59,11 @@ class CombatAnimator:
         
         self.tile_size = tile_size
         
-        # Animation queue and state
-        self.animation_queue: List[AnimationEvent] = []
+        # Animation queue and state. The queue is a heap of
+        # (start_time, sequence, event), so the next animation due is first
+        # and animations due at the same time start in queueing order
+        self.animation_queue: List[Tuple[float, int, AnimationEvent]] = []
+        self._queue_sequence = 0
         self.active_animations: Dict[str, AnimationEvent] = {}
         self.animation_id_counter = 0
         
@@ -112,15 +116,16 @@ class CombatAnimator:
     
     def _process_animation_queue(self, current_time: float):
         """Process queued animations and start them if ready"""
-        animations_to_start = []
-        
-        for animation in self.animation_queue:
-            if current_time >= animation.start_time:
-                animations_to_start.append(animation)
-        
-        for animation in animations_to_start:
-            self._start_animation(animation)
-            self.animation_queue.remove(animation)
+        # Only due animations are popped; later ones are never visited
+        queue = self.animation_queue
+        while queue and queue[0][0] <= current_time:
+            self._start_animation(heapq.heappop(queue)[2])
+    
+    def _queue_animation(self, animation: AnimationEvent):
+        """Add an animation to the queue, ordered by start time"""
+        self._queue_sequence += 1
+        heapq.heappush(self.animation_queue,
+                       (animation.start_time, self._queue_sequence, animation))
     
     def _start_animation(self, animation_event: AnimationEvent):
         """Start a specific animation"""
@@ -669,7 +674,7 @@ class CombatAnimator:
             callback=callback
         )
         
-        self.animation_queue.append(animation)
+        self._queue_animation(animation)
     
     def queue_attack_animation(self, attacker: GameEntity, target: Optional[GameEntity] = None,
                               attack_type: str = 'melee', duration: Optional[float] = None,
@@ -692,7 +697,7 @@ class CombatAnimator:
             callback=callback
         )
         
-        self.animation_queue.append(animation)
+        self._queue_animation(animation)
     
     def queue_damage_animation(self, target: GameEntity, damage_amount: int, 
                               damage_type: str = 'physical', duration: Optional[float] = None,
@@ -715,7 +720,7 @@ class CombatAnimator:
             callback=callback
         )
         
-        self.animation_queue.append(animation)
+        self._queue_animation(animation)
     
     def queue_heal_animation(self, target: GameEntity, heal_amount: int,
                             duration: Optional[float] = None, delay: float = 0.0,
@@ -735,7 +740,7 @@ class CombatAnimator:
             callback=callback
         )
         
-        self.animation_queue.append(animation)
+        self._queue_animation(animation)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get animation system statistics"""
@@ -4,11 +4,12 @@ Grid Visualization System
 Real-time tile highlighting and tactical overlay system for battlefield visualization.
 """
 
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Sequence, Set, Optional, Tuple, Any
 from enum import Enum
 from dataclasses import dataclass
 import time
 
+from core.ecs.component import Transform
 from core.ecs.entity import Entity
 from core.math.vector import Vector3, Vector2Int
 from core.math.grid import TacticalGrid
@@ -27,6 +28,30 @@ class HighlightType(Enum):
     INVALID = "invalid"
 
 
+# Highlight shown when a tile has several, highest priority first
+HIGHLIGHT_PRIORITY = (
+    HighlightType.SELECTION,
+    HighlightType.MOVEMENT_PATH,
+    HighlightType.DANGER_ZONE,
+    HighlightType.ATTACK_RANGE,
+    HighlightType.EFFECT_AREA,
+    HighlightType.HEAL_AREA,
+    HighlightType.MOVEMENT,
+    HighlightType.INVALID
+)
+
+# One bit per highlight type in a tile's highlight mask
+HIGHLIGHT_BITS = {highlight_type: 1 << index for index, highlight_type in enumerate(HighlightType)}
+
+# Highlight types and highest priority highlight for every possible mask
+_TYPES_BY_MASK = [tuple(highlight_type for highlight_type in HighlightType
+                        if mask & HIGHLIGHT_BITS[highlight_type])
+                  for mask in range(1 << len(HighlightType))]
+_PRIMARY_BY_MASK = [next((highlight_type for highlight_type in HIGHLIGHT_PRIORITY
+                          if mask & HIGHLIGHT_BITS[highlight_type]), None)
+                    for mask in range(1 << len(HighlightType))]
+
+
 @dataclass
 class HighlightStyle:
     """Visual style configuration for tile highlights"""
@@ -52,13 +77,15 @@ class GridVisualizer:
         # Visual style configuration
         self.highlight_styles = self._create_default_styles()
         
-        # Active highlights tracking
-        self.active_highlights: Dict[Vector2Int, Set[HighlightType]] = {}
+        # Active highlights tracking: HIGHLIGHT_BITS mask per highlighted tile,
+        # an int rather than a set per tile
+        self.active_highlights: Dict[Vector2Int, int] = {}
         self.highlight_entities: Dict[Tuple[Vector2Int, HighlightType], Any] = {}
         
         # Animation state
         self.animation_time = 0.0
         self.pulse_animations: Dict[HighlightType, float] = {}
+        self._pulse_speeds = self._get_pulse_speeds()
         
         # Performance optimization
         self.dirty_tiles: Set[Vector2Int] = set()
@@ -69,6 +96,12 @@ class GridVisualizer:
         self.selected_unit: Optional[Entity] = None
         self.hovered_tile: Optional[Vector2Int] = None
         
+        # Key the selected unit's overlays were built for, and the single
+        # (key, (movement, attack, danger) tiles) entry last computed, so an
+        # unchanged or reselected unit does not recompute its ranges
+        self._selection_key: Optional[Tuple] = None
+        self._overlay_cache: Optional[Tuple[Tuple, Tuple[Set[Vector2Int], ...]]] = None
+        
     def _create_default_styles(self) -> Dict[HighlightType, HighlightStyle]:
         """Create default visual styles for different highlight types"""
         return {
@@ -115,6 +148,12 @@ class GridVisualizer:
             )
         }
     
+    def _get_pulse_speeds(self) -> Tuple[Tuple[HighlightType, float], ...]:
+        """(highlight type, pulse speed) for every style that pulses"""
+        return tuple((highlight_type, style.pulse_speed)
+                     for highlight_type, style in self.highlight_styles.items()
+                     if style.pulse_speed > 0)
+    
     def update(self, delta_time: float):
         """Update visual animations and effects"""
         current_time = time.time()
@@ -126,12 +165,25 @@ class GridVisualizer:
         self.animation_time += delta_time
         self.last_update_time = current_time
         
+        # Nothing shown, selected or waiting to be redrawn: no pulse to
+        # advance and no overlay to rebuild
+        if not self.active_highlights and self.selected_unit is None and not self.dirty_tiles:
+            return
+        
         # Update pulse animations
-        for highlight_type, style in self.highlight_styles.items():
-            if style.pulse_speed > 0:
-                self.pulse_animations[highlight_type] = (
-                    0.5 + 0.5 * abs(1.0 - ((self.animation_time * style.pulse_speed) % 2.0))
-                )
+        animation_time = self.animation_time
+        for highlight_type, pulse_speed in self._pulse_speeds:
+            self.pulse_animations[highlight_type] = (
+                0.5 + 0.5 * abs(1.0 - ((animation_time * pulse_speed) % 2.0))
+            )
+        
+        # Rebuild overlays only if the selected unit moved or its ranges changed
+        unit = self.selected_unit
+        if unit is not None and self._get_selection_key(unit) != self._selection_key:
+            for highlight_type in (HighlightType.MOVEMENT, HighlightType.ATTACK_RANGE,
+                                   HighlightType.DANGER_ZONE):
+                self.clear_highlights_of_type(highlight_type)
+            self._update_tactical_overlays(unit)
         
         # Update dirty tiles
         if self.dirty_tiles:
@@ -147,6 +199,7 @@ class GridVisualizer:
             self.clear_all_highlights()
         
         self.selected_unit = unit
+        self._selection_key = None
         
         if unit:
             self._update_tactical_overlays(unit)
@@ -166,31 +219,54 @@ class GridVisualizer:
         if tile_pos and self.grid_system.is_valid_position(tile_pos):
             self.add_tile_highlight(tile_pos, HighlightType.SELECTION)
     
-    def _update_tactical_overlays(self, unit: Entity):
-        """Update all tactical overlays for the selected unit"""
+    def _get_selection_key(self, unit: Entity) -> Optional[Tuple]:
+        """
+        Everything a unit's tactical overlays depend on, or None without a Transform.
+        
+        The grid version is bumped whenever a cell is occupied or vacated, so
+        it also covers the enemy positions danger zones are built from.
+        """
         from components.movement.movement import MovementComponent
         from components.combat.attack import AttackComponent
         
-        unit_transform = unit.get_component('Transform')
+        unit_transform = unit.get_component(Transform)
         if not unit_transform:
-            return
-        
-        unit_pos = self.grid_system.world_to_grid(unit_transform.position)
+            return None
         
-        # Show movement options
         movement_comp = unit.get_component(MovementComponent)
-        if movement_comp:
-            movement_tiles = self._get_movement_tiles(unit, unit_pos)
-            self.highlight_tiles(movement_tiles, HighlightType.MOVEMENT)
-        
-        # Show attack ranges
         attack_comp = unit.get_component(AttackComponent)
-        if attack_comp:
-            attack_tiles = self._get_attack_tiles(unit, unit_pos)
-            self.highlight_tiles(attack_tiles, HighlightType.ATTACK_RANGE)
+        return (unit.id,
+                self.grid_system.transform_to_grid(unit_transform),
+                movement_comp.movement_range if movement_comp else None,
+                attack_comp.attack_range if attack_comp else None,
+                self.grid_system.version)
+    
+    def _update_tactical_overlays(self, unit: Entity):
+        """Update all tactical overlays for the selected unit"""
+        selection_key = self._get_selection_key(unit)
+        self._selection_key = selection_key
+        if selection_key is None:
+            return
         
-        # Show danger zones (enemy attack ranges)
-        danger_tiles = self._get_danger_tiles(unit, unit_pos)
+        cached = self._overlay_cache
+        if cached is not None and cached[0] == selection_key:
+            movement_tiles, attack_tiles, danger_tiles = cached[1]
+        else:
+            _, unit_pos, movement_range, attack_range, _ = selection_key
+            
+            # Movement options and attack ranges
+            movement_tiles = (self._get_movement_tiles(unit, unit_pos)
+                              if movement_range is not None else set())
+            attack_tiles = (self._get_attack_tiles(unit, unit_pos)
+                            if attack_range is not None else set())
+            
+            # Danger zones (enemy attack ranges)
+            danger_tiles = self._get_danger_tiles(unit, unit_pos)
+            
+            self._overlay_cache = (selection_key, (movement_tiles, attack_tiles, danger_tiles))
+        
+        self.highlight_tiles(movement_tiles, HighlightType.MOVEMENT)
+        self.highlight_tiles(attack_tiles, HighlightType.ATTACK_RANGE)
         self.highlight_tiles(danger_tiles, HighlightType.DANGER_ZONE)
     
     def _get_movement_tiles(self, unit: Entity, unit_pos: Vector2Int) -> Set[Vector2Int]:
@@ -256,20 +332,9 @@ class GridVisualizer:
         if not attack_comp:
             return set()
         
-        attack_range = attack_comp.attack_range
-        attack_tiles = set()
-        
-        # Calculate tiles within attack range
-        for x in range(unit_pos.x - attack_range, unit_pos.x + attack_range + 1):
-            for y in range(unit_pos.y - attack_range, unit_pos.y + attack_range + 1):
-                target_pos = Vector2Int(x, y)
-                
-                if not self.grid_system.is_valid_position(target_pos):
-                    continue
-                
-                distance = abs(target_pos.x - unit_pos.x) + abs(target_pos.y - unit_pos.y)
-                if distance <= attack_range and distance > 0:
-                    attack_tiles.add(target_pos)
+        # Tiles within attack range, excluding the unit's own tile
+        attack_tiles = set(self.grid_system.get_cells_in_range(unit_pos, attack_comp.attack_range))
+        attack_tiles.discard(unit_pos)
         
         return attack_tiles
     
@@ -279,10 +344,47 @@ class GridVisualizer:
         # For now, return empty set as placeholder
         return set()
     
-    def highlight_tiles(self, tiles: Set[Vector2Int], highlight_type: HighlightType):
+    def highlight_tiles(self, tiles: Iterable[Vector2Int], highlight_type: HighlightType):
         """Add highlight to multiple tiles"""
+        width = self.grid_system.width
+        height = self.grid_system.height
+        
+        # Same bounds check as TacticalGrid.is_valid_position, inlined
+        self._set_highlight_bit([tile_pos for tile_pos in tiles
+                                 if 0 <= tile_pos.x < width and 0 <= tile_pos.y < height],
+                                HIGHLIGHT_BITS[highlight_type])
+    
+    def add_tile_highlights_bulk(self, xs: Sequence[int], ys: Sequence[int],
+                                 highlight_type: HighlightType):
+        """
+        Add a highlight to the tiles at parallel x and y coordinate sequences.
+        
+        Out-of-bounds coordinates are skipped, and in-bounds ones use the
+        grid's shared positions, so no Vector2Int is built per tile.
+        
+        Args:
+            xs: Tile x coordinates
+            ys: Tile y coordinates, same length as xs
+            highlight_type: Highlight to add
+        """
+        width = self.grid_system.width
+        height = self.grid_system.height
+        positions = self.grid_system.get_positions()
+        
+        self._set_highlight_bit([positions[x * height + y] for x, y in zip(xs, ys)
+                                 if 0 <= x < width and 0 <= y < height],
+                                HIGHLIGHT_BITS[highlight_type])
+    
+    def _set_highlight_bit(self, tiles: List[Vector2Int], bit: int):
+        """Set a highlight bit on in-bounds tiles, marking changed tiles dirty"""
+        active_highlights = self.active_highlights
+        dirty_tiles = self.dirty_tiles
+        
         for tile_pos in tiles:
-            self.add_tile_highlight(tile_pos, highlight_type)
+            mask = active_highlights.get(tile_pos, 0)
+            if not mask & bit:
+                active_highlights[tile_pos] = mask | bit
+                dirty_tiles.add(tile_pos)
     
     def add_tile_highlight(self, tile_pos: Vector2Int, highlight_type: HighlightType):
         """Add a highlight to a specific tile"""
@@ -290,34 +392,38 @@ class GridVisualizer:
             return
         
         # Add to active highlights
-        if tile_pos not in self.active_highlights:
-            self.active_highlights[tile_pos] = set()
-        
-        if highlight_type not in self.active_highlights[tile_pos]:
-            self.active_highlights[tile_pos].add(highlight_type)
+        mask = self.active_highlights.get(tile_pos, 0)
+        bit = HIGHLIGHT_BITS[highlight_type]
+        if not mask & bit:
+            self.active_highlights[tile_pos] = mask | bit
             self.dirty_tiles.add(tile_pos)
     
     def remove_tile_highlight(self, tile_pos: Vector2Int, highlight_type: HighlightType):
         """Remove a specific highlight from a tile"""
-        if tile_pos in self.active_highlights:
-            self.active_highlights[tile_pos].discard(highlight_type)
+        mask = self.active_highlights.get(tile_pos)
+        if mask is not None:
+            mask &= ~HIGHLIGHT_BITS[highlight_type]
             
-            if not self.active_highlights[tile_pos]:
+            if mask:
+                self.active_highlights[tile_pos] = mask
+            else:
                 del self.active_highlights[tile_pos]
             
             self.dirty_tiles.add(tile_pos)
     
     def clear_highlights_of_type(self, highlight_type: HighlightType):
         """Clear all highlights of a specific type"""
+        bit = HIGHLIGHT_BITS[highlight_type]
         tiles_to_update = set()
         
-        for tile_pos, highlights in list(self.active_highlights.items()):
-            if highlight_type in highlights:
-                highlights.discard(highlight_type)
+        for tile_pos, mask in list(self.active_highlights.items()):
+            if mask & bit:
                 tiles_to_update.add(tile_pos)
                 
-                if not highlights:
+                if mask == bit:
                     del self.active_highlights[tile_pos]
+                else:
+                    self.active_highlights[tile_pos] = mask & ~bit
         
         self.dirty_tiles.update(tiles_to_update)
     
@@ -329,26 +435,13 @@ class GridVisualizer:
     def show_movement_path(self, path: List[Vector2Int]):
         """Highlight a specific movement path"""
         self.clear_highlights_of_type(HighlightType.MOVEMENT_PATH)
-        
-        for tile_pos in path:
-            self.add_tile_highlight(tile_pos, HighlightType.MOVEMENT_PATH)
+        self.highlight_tiles(path, HighlightType.MOVEMENT_PATH)
     
     def show_effect_area(self, center: Vector2Int, radius: int, effect_type: HighlightType = HighlightType.EFFECT_AREA):
         """Show area effect highlight"""
-        effect_tiles = set()
-        
-        for x in range(center.x - radius, center.x + radius + 1):
-            for y in range(center.y - radius, center.y + radius + 1):
-                tile_pos = Vector2Int(x, y)
-                
-                if not self.grid_system.is_valid_position(tile_pos):
-                    continue
-                
-                distance = abs(tile_pos.x - center.x) + abs(tile_pos.y - center.y)
-                if distance <= radius:
-                    effect_tiles.add(tile_pos)
-        
-        self.highlight_tiles(effect_tiles, effect_type)
+        # Already clipped to the grid, so skip highlight_tiles' bounds check
+        tiles = self.grid_system.get_cells_in_range(center, radius)
+        self._set_highlight_bit(tiles, HIGHLIGHT_BITS[effect_type])
     
     def _refresh_dirty_tiles(self):
         """Update visual representation of dirty tiles"""
@@ -361,85 +454,84 @@ class GridVisualizer:
         if highlight_type is None:
             return set(self.active_highlights.keys())
         
-        highlighted_tiles = set()
-        for tile_pos, highlights in self.active_highlights.items():
-            if highlight_type in highlights:
-                highlighted_tiles.add(tile_pos)
-        
-        return highlighted_tiles
+        bit = HIGHLIGHT_BITS[highlight_type]
+        return {tile_pos for tile_pos, mask in self.active_highlights.items() if mask & bit}
     
     def get_tile_highlights(self, tile_pos: Vector2Int) -> Set[HighlightType]:
         """Get all highlight types for a specific tile"""
-        return self.active_highlights.get(tile_pos, set()).copy()
+        return set(_TYPES_BY_MASK[self.active_highlights.get(tile_pos, 0)])
     
     def is_tile_highlighted(self, tile_pos: Vector2Int, highlight_type: HighlightType) -> bool:
         """Check if a tile has a specific highlight"""
-        return (tile_pos in self.active_highlights and 
-                highlight_type in self.active_highlights[tile_pos])
+        return bool(self.active_highlights.get(tile_pos, 0) & HIGHLIGHT_BITS[highlight_type])
     
     def get_visual_data_for_tile(self, tile_pos: Vector2Int) -> Optional[Dict[str, Any]]:
         """Get visual data for rendering a highlighted tile"""
-        if tile_pos not in self.active_highlights:
+        mask = self.active_highlights.get(tile_pos)
+        if not mask:
             return None
         
-        highlights = self.active_highlights[tile_pos]
-        
-        # Use highest priority highlight for visual
-        priority_order = [
-            HighlightType.SELECTION,
-            HighlightType.MOVEMENT_PATH,
-            HighlightType.DANGER_ZONE,
-            HighlightType.ATTACK_RANGE,
-            HighlightType.EFFECT_AREA,
-            HighlightType.HEAL_AREA,
-            HighlightType.MOVEMENT,
-            HighlightType.INVALID
-        ]
-        
-        primary_highlight = None
-        for highlight_type in priority_order:
-            if highlight_type in highlights:
-                primary_highlight = highlight_type
-                break
-        
-        if not primary_highlight:
-            return None
-        
-        style = self.highlight_styles[primary_highlight]
-        world_pos = self.grid_system.grid_to_world(tile_pos)
-        
-        # Apply pulse animation if configured
-        intensity = style.intensity
-        if style.pulse_speed > 0 and primary_highlight in self.pulse_animations:
-            intensity *= self.pulse_animations[primary_highlight]
-        
-        return {
-            'position': world_pos,
-            'color': style.color,
-            'intensity': intensity,
-            'border_width': style.border_width,
-            'z_offset': style.z_offset,
-            'highlight_types': list(highlights)
-        }
+        return self._build_tile_visual_data(tile_pos, mask, self._get_layer_styles())
     
     def get_all_visual_data(self) -> List[Dict[str, Any]]:
         """Get visual data for all highlighted tiles"""
-        visual_data = []
+        # Style and pulsed intensity depend only on the highlight type, so
+        # resolve them once per frame rather than once per tile
+        layer_styles = self._get_layer_styles()
+        build_tile_visual_data = self._build_tile_visual_data
         
-        for tile_pos in self.active_highlights:
-            tile_data = self.get_visual_data_for_tile(tile_pos)
+        visual_data = []
+        for tile_pos, mask in self.active_highlights.items():
+            tile_data = build_tile_visual_data(tile_pos, mask, layer_styles)
             if tile_data:
                 visual_data.append(tile_data)
         
         return visual_data
     
+    def _get_layer_styles(self) -> Dict[HighlightType, Tuple[Tuple[float, float, float, float],
+                                                          float, float, float]]:
+        """
+        Current (color, intensity, border_width, z_offset) per highlight type,
+        with pulse animation applied to the intensity
+        """
+        layer_styles = {}
+        pulse_animations = self.pulse_animations
+        for highlight_type, style in self.highlight_styles.items():
+            intensity = style.intensity
+            if style.pulse_speed > 0 and highlight_type in pulse_animations:
+                intensity *= pulse_animations[highlight_type]
+            layer_styles[highlight_type] = (style.color, intensity,
+                                            style.border_width, style.z_offset)
+        return layer_styles
+    
+    def _build_tile_visual_data(self, tile_pos: Vector2Int, mask: int,
+                                layer_styles: Dict[HighlightType, Tuple]) -> Optional[Dict[str, Any]]:
+        """Visual data for a tile's highest priority highlight"""
+        # Only the highest priority highlight is drawn, so only its style is read
+        primary_highlight = _PRIMARY_BY_MASK[mask]
+        if primary_highlight is None:
+            return None
+        
+        color, intensity, border_width, z_offset = layer_styles[primary_highlight]
+        
+        return {
+            'position': self.grid_system.grid_to_world(tile_pos),
+            'color': color,
+            'intensity': intensity,
+            'border_width': border_width,
+            'z_offset': z_offset,
+            'highlight_types': _TYPES_BY_MASK[mask]  # Shared, immutable per mask
+        }
+    
     def set_highlight_style(self, highlight_type: HighlightType, style: HighlightStyle):
         """Customize the visual style for a highlight type"""
         self.highlight_styles[highlight_type] = style
+        self._pulse_speeds = self._get_pulse_speeds()
         
         # Mark all tiles with this highlight type as dirty
-        for tile_pos, highlights in self.active_highlights.items():
-            if highlight_type in highlights:
+        bit = HIGHLIGHT_BITS[highlight_type]
+        for tile_pos, mask in self.active_highlights.items():
+            if mask & bit:
                 self.dirty_tiles.add(tile_pos)
     
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -447,7 +539,7 @@ class GridVisualizer:
         return {
             'active_highlights': len(self.active_highlights),
             'dirty_tiles': len(self.dirty_tiles),
-            'total_highlight_instances': sum(len(highlights) for highlights in self.active_highlights.values()),
+            'total_highlight_instances': sum(mask.bit_count() for mask in self.active_highlights.values()),
             'animation_time': self.animation_time,
             'last_update_time': self.last_update_time
         }
\ No newline at end of file
@@ -9,42 +9,88 @@ import sys
 import os
 import time
 import traceback
+import importlib.util
 from typing import List, Tuple, Optional
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-try:
-    from ursina import *
-    URSINA_AVAILABLE = True
-except ImportError:
+# Ursina (and Panda3D behind it) is only imported once visual mode starts
+URSINA_AVAILABLE = importlib.util.find_spec('ursina') is not None
+if not URSINA_AVAILABLE:
     print("Ursina not available. Running in console mode.")
-    URSINA_AVAILABLE = False
 
 from demo_utils import (
     create_demo_world, create_tactical_grid, create_character_archetypes,
-    apply_demonstration_modifiers, demonstrate_pathfinding,
+    apply_demonstration_modifiers, demonstrate_pathfinding, clear_pathfinding_results,
     get_performance_metrics, create_demo_scenario_description,
     format_character_stats, get_grid_cell_description
 )
 
 from core.math.vector import Vector2Int, Vector3
+from core.math.grid import TerrainType
 from core.math.pathfinding import AStarPathfinder
 from core.ecs.component import Transform
-from ui.camera_controller import CameraController
+from components.stats.resources import ResourceManager
+from components.stats.modifiers import ModifierManager
 
 # Global reference to demo instance for input handling
 demo_instance = None
 
+# Unit cube corners and the triangles of its six faces, used to build the grid mesh
+_CUBE_CORNERS = (
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+)
+_CUBE_FACES = ((0, 1, 2, 3), (5, 4, 7, 6), (4, 0, 3, 7),
+               (1, 5, 6, 2), (4, 5, 1, 0), (3, 2, 6, 7))
+_CUBE_TRIANGLES = tuple(index for a, b, c, d in _CUBE_FACES
+                        for index in (a, b, c, a, c, d))
+
+# Terrain colors keyed by enum so cells need one dict lookup, not name
+# comparisons; filled in by _load_ursina
+_TERRAIN_COLORS = {}
+
+
+def _load_ursina():
+    """
+    Import the Ursina names this module uses and bind them as module globals.
+    
+    Deferred until visual mode starts so console runs never load Ursina or
+    Panda3D. Raises ImportError if Ursina is installed but cannot be loaded.
+    """
+    global Ursina, Entity, Mesh, Text, application, camera, color, held_keys, mouse
+    from ursina import (Ursina, Entity, Mesh, Text, application, camera, color,
+                        held_keys, mouse)
+    
+    _TERRAIN_COLORS.update({
+        TerrainType.WALL: color.gray,
+        TerrainType.DIFFICULT: color.brown,
+        TerrainType.ELEVATED: color.yellow,
+    })
+
 
 class Phase1Demo:
     """Main demonstration class for Phase 1 systems"""
     
+    _CONTROLS_STR = (
+        "\nCamera: Arrow keys=Rotate | Mouse drag=Rotate | Scroll=Zoom"
+        "\nDemo: SPACE=Pause | R=Reset | P=Path | 1-4=Character | ESC=Exit"
+    )
+    UI_UPDATE_INTERVAL = 0.25  # Seconds between status text refreshes
+    
     def __init__(self, use_visual: bool = True):
         self.use_visual = use_visual and URSINA_AVAILABLE
         self.world = None
         self.grid = None
-        self.characters = []
+        self.characters = ()
+        # Per-character columns resolved once, parallel to self.characters
+        self._archetype_names = []
+        self._character_objs = []
+        self._char_transforms = []
+        self._resource_mgrs = []
+        self._modifier_mgrs = []
+        self._modifier_pool = {}  # Demo modifiers per entity, reused across resets
         self.pathfinder = None
         self.running = True
         self.paused = False
@@ -52,8 +98,9 @@ class Phase1Demo:
         self.show_pathfinding = False
         self.performance_stats = {}
         self.frame_count = 0
-        self.last_stats_update = 0
-        self.demo_start_time = time.time()
+        self.last_stats_update = float('-inf')
+        self.last_ui_update = float('-inf')
+        self.demo_start_time = time.perf_counter()
         
         # Visual components (if using Ursina)
         self.grid_entities = []
@@ -84,7 +131,12 @@ class Phase1Demo:
         
         # Create characters
         self.characters = create_character_archetypes(self.world)
-        apply_demonstration_modifiers(self.characters)
+        apply_demonstration_modifiers(self.characters, self._modifier_pool)
+        self._archetype_names = [c.name for c in self.characters]
+        self._character_objs = [c.entity for c in self.characters]
+        self._char_transforms = [c.get_component(Transform) for c in self._character_objs]
+        self._resource_mgrs = [c.resources for c in self.characters]
+        self._modifier_mgrs = [c.modifiers for c in self.characters]
         print(f"✓ Created {len(self.characters)} character archetypes with modifiers")
         
         # Initialize visual components if available
@@ -96,6 +148,15 @@ class Phase1Demo:
     
     def _initialize_visual(self):
         """Initialize Ursina visual components"""
+        try:
+            _load_ursina()
+            from ui.camera_controller import CameraController
+        except ImportError:
+            # Ursina is installed but broken (e.g. missing Panda3D libraries)
+            print("Ursina not available. Running in console mode.")
+            self.use_visual = False
+            return
+        
         self.app = Ursina()
         
         # Initialize advanced camera controller
@@ -111,36 +172,38 @@ class Phase1Demo:
     
     def _create_grid_visual(self):
         """Create visual representation of the tactical grid"""
-        for x in range(self.grid.width):
-            for y in range(self.grid.height):
-                pos = Vector2Int(x, y)
-                cell = self.grid.get_cell(pos)
-                
-                if cell:
-                    # Choose color based on terrain type
-                    cell_color = color.white
-                    if cell.terrain_type.name == 'WALL':
-                        cell_color = color.gray
-                    elif cell.terrain_type.name == 'DIFFICULT':
-                        cell_color = color.brown
-                    elif cell.terrain_type.name == 'ELEVATED':
-                        cell_color = color.yellow
-                    
-                    # Create cube for cell
-                    cube = Entity(
-                        model='cube',
-                        color=cell_color,
-                        position=(x, cell.height * 0.5, y),
-                        scale=(0.9, cell.height if cell.height > 0 else 0.1, 0.9)
-                    )
-                    self.grid_entities.append(cube)
+        # All cells go into one static mesh: a single scene-graph node and
+        # draw call instead of one cube Entity per cell
+        vertices = []
+        triangles = []
+        colors = []
+        
+        for cell in self.grid.cells.values():
+            x, y = cell.grid_pos.x, cell.grid_pos.y
+            height = cell.height
+            size_y = height if height > 0 else 0.1
+            center_y = height * 0.5
+            cell_color = _TERRAIN_COLORS.get(cell.terrain_type, color.white)
+            
+            base = len(vertices)
+            for corner_x, corner_y, corner_z in _CUBE_CORNERS:
+                vertices.append((x + corner_x * 0.45,
+                                 center_y + corner_y * size_y * 0.5,
+                                 y + corner_z * 0.45))
+                colors.append(cell_color)
+            triangles.extend(base + index for index in _CUBE_TRIANGLES)
+        
+        grid_mesh = Entity(
+            model=Mesh(vertices=vertices, triangles=triangles, colors=colors, mode='triangle'),
+            double_sided=True
+        )
+        self.grid_entities.append(grid_mesh)
     
     def _create_character_visuals(self):
         """Create visual representation of characters"""
         colors = [color.blue, color.red, color.green, color.magenta]
         
-        for i, (archetype_name, character) in enumerate(self.characters):
-            transform = character.get_component(Transform)
+        for i, (archetype_name, transform) in enumerate(zip(self._archetype_names, self._char_transforms)):
             pos = transform.position
             
             # Create character representation
@@ -192,12 +255,12 @@ class Phase1Demo:
         # Orbit camera controls - handle exactly like 1/2/3 keys using same approach
         if key == 'scroll up':
             if self.camera_controller:
-                self.camera_controller.camera_distance = max(self.camera_controller.min_distance, self.camera_controller.camera_distance - self.camera_controller.zoom_speed)
+                self.camera_controller.zoom_in()
                 self.camera_controller.update_camera()  # Update camera position
             return
         elif key == 'scroll down':
             if self.camera_controller:
-                self.camera_controller.camera_distance = min(self.camera_controller.max_distance, self.camera_controller.camera_distance + self.camera_controller.zoom_speed)
+                self.camera_controller.zoom_out()
                 self.camera_controller.update_camera()  # Update camera position
             return
         elif key == 'left arrow':
@@ -236,122 +299,140 @@ class Phase1Demo:
         
         elif key in ['1', '2', '3', '4']:  # Character selection
             self.selected_character = int(key) - 1
-            if self.selected_character < len(self.characters):
-                archetype_name = self.characters[self.selected_character][0]
+            if self.selected_character < len(self._archetype_names):
+                archetype_name = self._archetype_names[self.selected_character]
                 print(f"Selected {archetype_name}")
                 # Focus camera on selected character
                 if self.camera_controller:
-                    transform = self.characters[self.selected_character][1].get_component(Transform)
+                    transform = self._char_transforms[self.selected_character]
                     self.camera_controller.focus_on_position(transform.position.x, transform.position.z)
         
         elif key == 'escape':
             self.running = False
             print("Exiting demonstration...")
     
-    def _handle_camera_mouse_input(self):
-        """Handle mouse input exactly like apex-tactics.py - Orbit mode only"""
-        if not self.camera_controller:
-            return
-        
-        # Mouse drag rotation for orbit mode - exactly like apex-tactics.py
-        if held_keys['left mouse']:
-            self.camera_controller.camera_angle_y += mouse.velocity.x * 50
-            self.camera_controller.camera_angle_x = max(-80, min(80, self.camera_controller.camera_angle_x - mouse.velocity.y * 50))
+    def _handle_camera_mouse_input(self) -> bool:
+        """
+        Handle mouse input exactly like apex-tactics.py - Orbit mode only.
+        
+        Returns:
+            True if the camera angles changed and the camera needs updating
+        """
+        camera_controller = self.camera_controller
+        if not camera_controller or not held_keys['left mouse']:
+            return False
+        
+        velocity = mouse.velocity
+        camera_controller.camera_angle_y += velocity.x * 50
+        camera_controller.camera_angle_x = max(-80, min(80, camera_controller.camera_angle_x - velocity.y * 50))
+        return True
     
     def _reset_demo(self):
         """Reset the demonstration to initial state"""
-        # Reset modifiers and resources
-        for archetype_name, character in self.characters:
-            resources = character.get_component(ResourceManager)
-            modifier_manager = character.get_component(ModifierManager)
-            
-            # Reset resources
-            resources.mp.current_value = resources.mp.max_value
-            resources.rage.current_value = 0
-            resources.kwan.current_value = 50
-            
-            # Clear and reapply modifiers
-            modifier_manager.clear_all_modifiers()
+        # Each character owns its own resources and modifiers, so resets are
+        # independent of one another
+        for resources, modifier_manager in zip(self._resource_mgrs, self._modifier_mgrs):
+            self._reset_character(resources, modifier_manager)
         
-        apply_demonstration_modifiers(self.characters)
+        apply_demonstration_modifiers(self.characters, self._modifier_pool)
+        clear_pathfinding_results()
         
         self.frame_count = 0
-        self.demo_start_time = time.time()
+        self.demo_start_time = time.perf_counter()
+    
+    @staticmethod
+    def _reset_character(resources: ResourceManager, modifier_manager: ModifierManager):
+        """Restore a character's resources and drop its modifiers"""
+        # Reset resources
+        resources.mp.current_value = resources.mp.max_value
+        resources.rage.current_value = 0
+        resources.kwan.current_value = 50
+        
+        # Clear modifiers; they are reapplied by apply_demonstration_modifiers
+        modifier_manager.clear_all_modifiers()
     
     def _update_world(self, delta_time: float):
         """Update the game world"""
         if not self.paused:
             self.world.update(delta_time)
     
-    def _update_performance_stats(self):
+    def _update_performance_stats(self, current_time: Optional[float] = None):
         """Update performance statistics"""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.perf_counter()
         if current_time - self.last_stats_update > 1.0:  # Update every second
             self.performance_stats = get_performance_metrics(self.world)
             self.last_stats_update = current_time
     
     def _demonstrate_pathfinding(self):
         """Demonstrate pathfinding between characters"""
-        if len(self.characters) >= 2:
-            char1_pos = self.characters[0][1].get_component(Transform).position
-            char2_pos = self.characters[1][1].get_component(Transform).position
+        if len(self._char_transforms) >= 2:
+            char1_pos = self._char_transforms[0].position
+            char2_pos = self._char_transforms[1].position
             
             start = self.grid.world_to_grid(char1_pos)
             goal = self.grid.world_to_grid(char2_pos)
             
             path_result = demonstrate_pathfinding(self.grid, start, goal)
             
-            if self.show_pathfinding and path_result['success']:
-                self._visualize_path(path_result['path'])
+            if self.show_pathfinding and path_result.success:
+                self._visualize_path(path_result.path)
             
             return path_result
         return None
     
     def _visualize_path(self, path: List[Vector2Int]):
         """Visualize pathfinding result"""
-        # Clear previous path visualization
-        for entity in self.path_entities:
-            destroy(entity)
-        self.path_entities.clear()
-        
-        # Create path visualization
+        # Path markers are pooled: reposition existing spheres, create new
+        # ones only when the path is longer than any seen so far
         for i, pos in enumerate(path):
             world_pos = self.grid.grid_to_world(pos)
+            marker_pos = (world_pos.x, world_pos.y + 0.2, world_pos.z)
             
-            path_entity = Entity(
-                model='sphere',
-                color=color.orange,
-                position=(world_pos.x, world_pos.y + 0.2, world_pos.z),
-                scale=0.1
-            )
-            self.path_entities.append(path_entity)
+            if i < len(self.path_entities):
+                path_entity = self.path_entities[i]
+                path_entity.position = marker_pos
+                path_entity.enabled = True
+            else:
+                path_entity = Entity(
+                    model='sphere',
+                    color=color.orange,
+                    position=marker_pos,
+                    scale=0.1
+                )
+                self.path_entities.append(path_entity)
+        
+        # Hide markers left over from a longer previous path
+        for path_entity in self.path_entities[len(path):]:
+            path_entity.enabled = False
     
     def _get_status_text(self) -> str:
         """Generate status text for display"""
-        runtime = time.time() - self.demo_start_time
+        runtime = time.perf_counter() - self.demo_start_time
         
-        status = f"Phase 1 Demo - Runtime: {runtime:.1f}s\n"
-        status += f"Frame: {self.frame_count} | Status: {'PAUSED' if self.paused else 'RUNNING'}\n"
-        status += f"Entities: {len(self.world.entity_manager._entities)} | Systems: {self.world.system_count}\n\n"
+        parts = [
+            f"Phase 1 Demo - Runtime: {runtime:.1f}s",
+            f"Frame: {self.frame_count} | Status: {'PAUSED' if self.paused else 'RUNNING'}",
+            f"Entities: {self.world.entity_count} | Systems: {self.world.system_count}",
+            ""
+        ]
         
         # Show selected character stats
         if self.selected_character < len(self.characters):
-            archetype_name, character = self.characters[self.selected_character]
-            status += format_character_stats(archetype_name, character)
+            parts.append(format_character_stats(self.characters[self.selected_character]))
         
         # Show performance stats
         if self.performance_stats:
-            status += f"\nPerformance:\n"
+            parts.append("Performance:")
             for system_name, stats in self.performance_stats.get('systems_performance', {}).items():
                 if 'avg_update_time' in stats:
                     avg_time = stats['avg_update_time'] * 1000  # Convert to ms
-                    status += f"{system_name}: {avg_time:.2f}ms\n"
+                    parts.append(f"{system_name}: {avg_time:.2f}ms")
         
         # Show controls
-        status += f"\nCamera: Arrow keys=Rotate | Mouse drag=Rotate | Scroll=Zoom"
-        status += f"\nDemo: SPACE=Pause | R=Reset | P=Path | 1-4=Character | ESC=Exit"
+        parts.append(self._CONTROLS_STR)
         
-        return status
+        return '\n'.join(parts)
     
     def _console_mode_update(self):
         """Update display for console mode"""
@@ -363,11 +444,11 @@ class Phase1Demo:
             path_result = self._demonstrate_pathfinding()
             if path_result:
                 print(f"\nPathfinding Demo:")
-                print(f"Success: {path_result['success']}")
-                print(f"Path length: {len(path_result['path'])}")
-                print(f"Cost: {path_result['cost']:.2f}")
-                print(f"Time: {path_result['time']*1000:.3f}ms")
-                print(f"Nodes explored: {path_result['nodes_explored']}")
+                print(f"Success: {path_result.success}")
+                print(f"Path length: {len(path_result.path)}")
+                print(f"Cost: {path_result.cost:.2f}")
+                print(f"Time: {path_result.time*1000:.3f}ms")
+                print(f"Nodes explored: {path_result.nodes_explored}")
     
     def run(self):
         """Run the demonstration"""
@@ -384,19 +465,20 @@ class Phase1Demo:
                 return
             
             delta_time = time.dt
+            now = time.perf_counter()  # One clock read shared by this frame's checks
             self.frame_count += 1
             
             self._update_world(delta_time)
-            self._update_performance_stats()
+            self._update_performance_stats(now)
             
-            # Update camera - handle input directly in demo where globals are accessible
-            if self.camera_controller:
-                # Handle mouse input and continuous arrow keys where globals are accessible
-                self._handle_camera_mouse_input()
+            # Update camera only when a mouse drag moved it; key and scroll
+            # input already update the camera in handle_input
+            if self._handle_camera_mouse_input():
                 self.camera_controller.update_camera()
             
-            # Update UI
-            if self.ui_text:
+            # Update UI - rebuilding the status text every frame is wasted work
+            if self.ui_text and now - self.last_ui_update >= self.UI_UPDATE_INTERVAL:
+                self.last_ui_update = now
                 self.ui_text.text = self._get_status_text()
             
             # Demonstrate pathfinding periodically
@@ -417,16 +499,29 @@ class Phase1Demo:
         print("Running in console mode (Ursina not available)")
         print("Press Ctrl+C to exit")
         
+        frame_interval = 0.016  # ~60 FPS
+        
         try:
+            next_tick = time.perf_counter()
+            last_time = next_tick - frame_interval  # First frame gets a nominal step
             while self.running:
-                delta_time = 0.016  # ~60 FPS
+                now = time.perf_counter()
+                delta_time = now - last_time
+                last_time = now
                 self.frame_count += 1
                 
                 self._update_world(delta_time)
-                self._update_performance_stats()
+                self._update_performance_stats(now)
                 self._console_mode_update()
                 
-                time.sleep(delta_time)
+                # Sleep only for what is left of the frame budget
+                next_tick += frame_interval
+                sleep_time = next_tick - time.perf_counter()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                else:
+                    # Fell behind - resync instead of bursting to catch up
+                    next_tick = time.perf_counter()
                 
         except KeyboardInterrupt:
             print("\nDemo interrupted by user")
@@ -6,8 +6,10 @@ Interactive demonstration of combat systems, equipment, and turn-based mechanics
 
 import sys
 import os
+import sched
 import time
 import traceback
+from enum import IntEnum
 from typing import List, Tuple, Optional
 
 # Add src to path
@@ -20,6 +22,9 @@ except ImportError:
     print("Ursina not available. Running in console mode.")
     URSINA_AVAILABLE = False
 
+# Character colors in archetype order
+_ARCHETYPE_COLORS = (color.blue, color.red, color.green, color.yellow) if URSINA_AVAILABLE else ()
+
 from demo_utils import create_demo_world, create_tactical_grid, create_character_archetypes
 from core.math.vector import Vector2Int, Vector3
 from core.ecs.component import Transform
@@ -36,15 +41,74 @@ from ui.camera_controller import CameraController
 # Global reference to demo instance for input handling
 demo_instance = None
 
+# Combat component factories per archetype: (damage, defense, attack)
+ARCHETYPE_COMBAT_COMPONENTS = {
+    'Warrior': lambda: (
+        DamageComponent(physical_power=25, penetration=5, critical_chance=0.1),
+        DefenseComponent(physical_defense=20, armor_rating=10),
+        AttackComponent(primary_attack_type=AttackType.PHYSICAL, attack_range=1, accuracy=0.85),
+    ),
+    'Mage': lambda: (
+        DamageComponent(magical_power=30, penetration=3, critical_chance=0.15),
+        DefenseComponent(magical_defense=25, magic_resistance=15),
+        AttackComponent(primary_attack_type=AttackType.MAGICAL, attack_range=3,
+                        area_effect_radius=1.5, accuracy=0.8),
+    ),
+    'Rogue': lambda: (
+        DamageComponent(physical_power=20, penetration=8, critical_chance=0.25),
+        DefenseComponent(physical_defense=12, armor_rating=5),
+        AttackComponent(primary_attack_type=AttackType.PHYSICAL, attack_range=1, accuracy=0.9),
+    ),
+    'Paladin': lambda: (
+        DamageComponent(spiritual_power=22, physical_power=18, penetration=4, critical_chance=0.12),
+        DefenseComponent(spiritual_defense=25, spiritual_ward=12, physical_defense=18),
+        AttackComponent(primary_attack_type=AttackType.SPIRITUAL, attack_range=1, accuracy=0.85),
+    ),
+}
+
+
+class DemoMode(IntEnum):
+    """Phase 2 demonstration modes, cycled with TAB"""
+    EQUIPMENT = 0
+    COMBAT = 1
+    TURN_BASED = 2
+
+
+# Per-mode display strings, indexed by DemoMode
+MODE_TITLES = ("Equipment", "Combat", "Turn_Based")
+MODE_SUFFIX = (
+    "\n\nEquipment Mode:\nE=Show Equipment | 1-4=Select Character",
+    "\n\nCombat Mode:\nC=Combat Test | 1-4=Select Character",
+    "\n\nTurn-Based Mode:\nT=Start Battle | 1-4=Select Character",
+)
+STATUS_FOOTER = "\nTAB=Switch Mode | SPACE=Pause | ESC=Exit"
+
 
 class Phase2Demo:
     """Demonstration of Phase 2 combat systems"""
     
+    RUNTIME_UPDATE_FRAMES = 6  # Runtime line refresh interval (~10Hz at 60fps)
+    CONSOLE_DEMO_INTERVAL = 10.0  # Seconds between console-mode demo printouts
+    SIM_DT = 1.0 / 60.0  # Fixed simulation step, independent of render rate
+    MAX_SIM_STEPS = 5  # Catch-up bound per frame so slow frames cannot spiral
+    
+    # Fixed attribute layout: the per-frame update reads these every frame
+    __slots__ = (
+        'use_visual', 'world', 'grid', 'characters', 'combat_stats',
+        'running', 'paused', 'combat_system', 'battle_manager',
+        'grid_entities', 'character_entities', 'ui_text', 'mode_text',
+        'runtime_text', 'camera_controller', 'selected_character',
+        'demo_mode', 'frame_count', 'runtime', 'app',
+        '_status_dirty', '_status_cache', '_positions_dirty', '_sim_accum',
+    )
+    
     def __init__(self, use_visual: bool = True):
         self.use_visual = use_visual and URSINA_AVAILABLE
         self.world = None
         self.grid = None
         self.characters = []
+        # Columnar view of combat stats, one list entry per character slot
+        self.combat_stats = {}
         self.running = True
         self.paused = False
         
@@ -56,13 +120,22 @@ class Phase2Demo:
         self.grid_entities = []
         self.character_entities = []
         self.ui_text = None
+        self.runtime_text = None
+        self.mode_text = None
         self.camera_controller = None
         
+        # Status text is rebuilt only when displayed state changes
+        self._status_dirty = True
+        self._status_cache = ''
+        # Character entities are repositioned only when positions change
+        self._positions_dirty = True
+        
         # Demo state
         self.selected_character = 0
-        self.demo_mode = "equipment"  # "equipment", "combat", "turn_based"
+        self.demo_mode = DemoMode.EQUIPMENT
         self.frame_count = 0
-        self.demo_start_time = time.time()
+        self.runtime = 0.0  # Seconds elapsed, accumulated from frame deltas
+        self._sim_accum = 0.0  # Unsimulated time carried between frames
         
         print("Phase 2 Combat Systems Demonstration")
         print("====================================")
@@ -86,6 +159,7 @@ class Phase2Demo:
         
         # Create characters with combat capabilities
         self.characters = self._create_combat_characters()
+        self._refresh_combat_stats()
         print(f"✓ Created {len(self.characters)} combat-ready characters")
         
         # Setup combat systems
@@ -97,7 +171,7 @@ class Phase2Demo:
             self._initialize_visual()
         
         print("✓ Phase 2 demonstration initialized successfully")
-        print("\\nDemonstration Controls:")
+        print("\nDemonstration Controls:")
         print("- TAB: Switch demo mode (equipment/combat/turn-based)")
         print("- 1-4: Select character")
         print("- E: Show equipment details")
@@ -116,7 +190,9 @@ class Phase2Demo:
             Vector3(1, 0, 6), Vector3(6, 0, 6)
         ]
         
-        for i, (name, character) in enumerate(base_characters):
+        for i, demo_character in enumerate(base_characters):
+            name, character = demo_character.name, demo_character.entity
+            
             # Add combat components
             self._add_combat_components(character, name)
             
@@ -132,26 +208,40 @@ class Phase2Demo:
         
         return combat_characters
     
+    def _refresh_combat_stats(self):
+        """
+        Rebuild the columnar combat stat view from the character components.
+        
+        Components stay the source of truth; call this again whenever
+        equipment or combat components change.
+        """
+        columns = {key: [] for key in (
+            'phys_pow', 'mag_pow', 'spir_pow', 'phys_def', 'mag_def', 'spir_def', 'pos'
+        )}
+        
+        for name, character in self.characters:
+            damage = character.get_component(DamageComponent)
+            defense = character.get_component(DefenseComponent)
+            transform = character.get_component(Transform)
+            
+            columns['phys_pow'].append(damage.physical_power if damage else 0)
+            columns['mag_pow'].append(damage.magical_power if damage else 0)
+            columns['spir_pow'].append(damage.spiritual_power if damage else 0)
+            columns['phys_def'].append(defense.get_defense_value(AttackType.PHYSICAL) if defense else 0)
+            columns['mag_def'].append(defense.get_defense_value(AttackType.MAGICAL) if defense else 0)
+            columns['spir_def'].append(defense.get_defense_value(AttackType.SPIRITUAL) if defense else 0)
+            columns['pos'].append(transform.position if transform else Vector3(0, 0, 0))
+        
+        self.combat_stats = columns
+        self._status_dirty = True
+        self._positions_dirty = True
+    
     def _add_combat_components(self, character, name: str):
         """Add combat components to character"""
-        # Add damage component based on character type
-        if "Warrior" in name:
-            damage = DamageComponent(physical_power=25, penetration=5, critical_chance=0.1)
-            defense = DefenseComponent(physical_defense=20, armor_rating=10)
-            attack = AttackComponent(primary_attack_type=AttackType.PHYSICAL, attack_range=1, accuracy=0.85)
-        elif "Mage" in name:
-            damage = DamageComponent(magical_power=30, penetration=3, critical_chance=0.15)
-            defense = DefenseComponent(magical_defense=25, magic_resistance=15)
-            attack = AttackComponent(primary_attack_type=AttackType.MAGICAL, attack_range=3, 
-                                   area_effect_radius=1.5, accuracy=0.8)
-        elif "Rogue" in name:
-            damage = DamageComponent(physical_power=20, penetration=8, critical_chance=0.25)
-            defense = DefenseComponent(physical_defense=12, armor_rating=5)
-            attack = AttackComponent(primary_attack_type=AttackType.PHYSICAL, attack_range=1, accuracy=0.9)
-        else:  # Paladin
-            damage = DamageComponent(spiritual_power=22, physical_power=18, penetration=4, critical_chance=0.12)
-            defense = DefenseComponent(spiritual_defense=25, spiritual_ward=12, physical_defense=18)
-            attack = AttackComponent(primary_attack_type=AttackType.SPIRITUAL, attack_range=1, accuracy=0.85)
+        # Look up the factory by archetype; unknown archetypes fight like a Paladin
+        archetype = name.split(' ', 1)[0]
+        factory = ARCHETYPE_COMBAT_COMPONENTS.get(archetype, ARCHETYPE_COMBAT_COMPONENTS['Paladin'])
+        damage, defense, attack = factory()
         
         character.add_component(damage)
         character.add_component(defense)
@@ -205,30 +295,25 @@ class Phase2Demo:
     
     def _create_grid_visual(self):
         """Create visual representation of the grid"""
-        for x in range(self.grid.width):
-            for y in range(self.grid.height):
-                pos = Vector2Int(x, y)
-                cell = self.grid.get_cell(pos)
-                
-                if cell:
-                    cube = Entity(
-                        model='cube',
-                        color=color.dark_gray,
-                        position=(x, 0, y),
-                        scale=(0.9, 0.1, 0.9)
-                    )
-                    self.grid_entities.append(cube)
+        # Walk the grid's existing cell positions rather than probing every
+        # coordinate through get_cell
+        for grid_pos in self.grid.cells:
+            cube = Entity(
+                model='cube',
+                color=color.dark_gray,
+                position=(grid_pos.x, 0, grid_pos.y),
+                scale=(0.9, 0.1, 0.9)
+            )
+            self.grid_entities.append(cube)
     
     def _create_character_visuals(self):
         """Create visual representation of characters"""
-        colors = [color.blue, color.red, color.green, color.yellow]
-        
+        positions = self.combat_stats['pos']
         for i, (name, character) in enumerate(self.characters):
-            transform = character.get_component(Transform)
-            pos = transform.position
+            pos = positions[i]
             
             # Create character entity
-            char_color = colors[i % len(colors)]
+            char_color = _ARCHETYPE_COLORS[i % len(_ARCHETYPE_COLORS)]
             char_entity = Entity(
                 model='sphere',
                 color=char_color,
@@ -247,9 +332,25 @@ class Phase2Demo:
             )
             
             self.character_entities.append((char_entity, label))
+        
+        self._positions_dirty = False
+    
+    def _sync_entity_positions(self):
+        """Push positions from the columnar stat view onto character entities"""
+        for (char_entity, label), pos in zip(self.character_entities, self.combat_stats['pos']):
+            char_entity.position = (pos.x, pos.y + 0.5, pos.z)
+        self._positions_dirty = False
     
     def _create_ui(self):
         """Create user interface elements"""
+        self.runtime_text = Text(
+            '',
+            position=(-0.8, 0.45),
+            scale=1,
+            parent=camera.ui,
+            origin=(0, 0)
+        )
+        
         self.ui_text = Text(
             '',
             position=(-0.8, 0.4),
@@ -260,7 +361,7 @@ class Phase2Demo:
         
         # Demo mode indicator
         self.mode_text = Text(
-            f'Mode: {self.demo_mode.title()} (TAB to switch)',
+            f'Mode: {MODE_TITLES[self.demo_mode]} (TAB to switch)',
             position=(-0.8, -0.4),
             scale=0.8,
             parent=camera.ui,
@@ -272,17 +373,11 @@ class Phase2Demo:
         """Handle input for Phase 2 demo"""
         # Camera controls (from Phase 1)
         if key == 'scroll up' and self.camera_controller:
-            self.camera_controller.camera_distance = max(
-                self.camera_controller.min_distance,
-                self.camera_controller.camera_distance - self.camera_controller.zoom_speed
-            )
+            self.camera_controller.zoom_in()
             self.camera_controller.update_camera()
             return
         elif key == 'scroll down' and self.camera_controller:
-            self.camera_controller.camera_distance = min(
-                self.camera_controller.max_distance,
-                self.camera_controller.camera_distance + self.camera_controller.zoom_speed
-            )
+            self.camera_controller.zoom_out()
             self.camera_controller.update_camera()
             return
         elif key in ['left arrow', 'right arrow', 'up arrow', 'down arrow']:
@@ -298,13 +393,14 @@ class Phase2Demo:
                 self.camera_controller.update_camera()
             return
         
+        # Every demo control below changes what the status panel shows
+        self._status_dirty = True
+        
         # Demo controls
         if key == 'tab':
-            modes = ["equipment", "combat", "turn_based"]
-            current_index = modes.index(self.demo_mode)
-            self.demo_mode = modes[(current_index + 1) % len(modes)]
+            self.demo_mode = DemoMode((self.demo_mode + 1) % len(DemoMode))
             if self.mode_text:
-                self.mode_text.text = f'Mode: {self.demo_mode.title()} (TAB to switch)'
+                self.mode_text.text = f'Mode: {MODE_TITLES[self.demo_mode]} (TAB to switch)'
         
         elif key in ['1', '2', '3', '4']:
             self.selected_character = int(key) - 1
@@ -328,15 +424,21 @@ class Phase2Demo:
             self.running = False
             print("Exiting demonstration...")
     
-    def _handle_camera_mouse_input(self):
-        """Handle mouse input for camera (from Phase 1)"""
-        if not self.camera_controller:
-            return
-        
-        if held_keys['left mouse']:
-            self.camera_controller.camera_angle_y += mouse.velocity.x * 50
-            self.camera_controller.camera_angle_x = max(-80, min(80, 
-                self.camera_controller.camera_angle_x - mouse.velocity.y * 50))
+    def _handle_camera_mouse_input(self) -> bool:
+        """
+        Handle mouse input for camera (from Phase 1).
+        
+        Returns:
+            True if the camera angles changed and the camera needs updating
+        """
+        camera_controller = self.camera_controller
+        if not camera_controller or not held_keys['left mouse']:
+            return False
+        
+        velocity = mouse.velocity
+        camera_controller.camera_angle_y += velocity.x * 50
+        camera_controller.camera_angle_x = max(-80, min(80, camera_controller.camera_angle_x - velocity.y * 50))
+        return True
     
     def _show_equipment_demo(self):
         """Demonstrate equipment system"""
@@ -347,13 +449,13 @@ class Phase2Demo:
         equipment_manager = character.get_component(EquipmentManager)
         
         if equipment_manager:
-            summary = equipment_manager.get_equipment_summary()
-            print(f"\\n=== Equipment Demo: {name} ===")
-            print(f"Total Equipment Value: {summary['total_value']}")
-            print(f"Special Abilities: {', '.join(summary['special_abilities']) or 'None'}")
+            summary = equipment_manager.get_summary_view()
+            print(f"\n=== Equipment Demo: {name} ===")
+            print(f"Total Equipment Value: {summary.total_value}")
+            print(f"Special Abilities: {', '.join(summary.special_abilities) or 'None'}")
             
-            for eq_type, eq_info in summary['equipped_items'].items():
-                print(f"\\n{eq_type.title()}:")
+            for eq_type, eq_info in summary.equipped_items.items():
+                print(f"\n{eq_type.title()}:")
                 print(f"  Name: {eq_info['name']}")
                 print(f"  Tier: {eq_info['tier']} ({eq_info['tier_description']})")
                 print(f"  Condition: {eq_info['condition_modifier']:.1%}")
@@ -366,7 +468,7 @@ class Phase2Demo:
         attacker_name, attacker = self.characters[0]
         target_name, target = self.characters[1]
         
-        print(f"\\n=== Combat Demo: {attacker_name} attacks {target_name} ===")
+        print(f"\n=== Combat Demo: {attacker_name} attacks {target_name} ===")
         
         # Test all attack types
         for attack_type in AttackType:
@@ -379,7 +481,7 @@ class Phase2Demo:
     
     def _show_turn_based_demo(self):
         """Demonstrate turn-based combat"""
-        print("\\n=== Turn-Based Combat Demo ===")
+        print("\n=== Turn-Based Combat Demo ===")
         
         # Split characters into teams
         player_units = [char[1] for char in self.characters[:2]]
@@ -398,42 +500,25 @@ class Phase2Demo:
         for entry in battle_state['turn_summary']['initiative_order']:
             print(f"  Unit {entry['unit_id']}: Initiative {entry['initiative']}")
     
+    def _get_runtime_text(self) -> str:
+        """Generate the fast-changing runtime line"""
+        return f"Phase 2 Combat Demo - Runtime: {self.runtime:.1f}s | Frame: {self.frame_count}"
+    
     def _get_status_text(self) -> str:
         """Generate status text for display"""
-        runtime = time.time() - self.demo_start_time
-        
-        status = f"Phase 2 Combat Demo - Runtime: {runtime:.1f}s\\n"
-        status += f"Mode: {self.demo_mode.title()} | Frame: {self.frame_count}\\n"
-        status += f"Status: {'PAUSED' if self.paused else 'RUNNING'}\\n\\n"
+        header = (f"Mode: {MODE_TITLES[self.demo_mode]}\n"
+                  f"Status: {'PAUSED' if self.paused else 'RUNNING'}\n")
         
-        # Show selected character info
+        # Show selected character info from the columnar stat view
+        selected = ""
         if self.selected_character < len(self.characters):
-            name, character = self.characters[self.selected_character]
-            status += f"Selected: {name}\\n"
-            
-            # Show combat stats
-            damage_comp = character.get_component(DamageComponent)
-            defense_comp = character.get_component(DefenseComponent)
-            
-            if damage_comp:
-                status += f"Attack: P{damage_comp.physical_power}/M{damage_comp.magical_power}/S{damage_comp.spiritual_power}\\n"
-            
-            if defense_comp:
-                status += f"Defense: P{defense_comp.get_defense_value(AttackType.PHYSICAL)}/"
-                status += f"M{defense_comp.get_defense_value(AttackType.MAGICAL)}/"
-                status += f"S{defense_comp.get_defense_value(AttackType.SPIRITUAL)}\\n"
-        
-        # Show controls based on mode
-        if self.demo_mode == "equipment":
-            status += "\\nEquipment Mode:\\nE=Show Equipment | 1-4=Select Character"
-        elif self.demo_mode == "combat":
-            status += "\\nCombat Mode:\\nC=Combat Test | 1-4=Select Character"
-        elif self.demo_mode == "turn_based":
-            status += "\\nTurn-Based Mode:\\nT=Start Battle | 1-4=Select Character"
-        
-        status += "\\nTAB=Switch Mode | SPACE=Pause | ESC=Exit"
-        
-        return status
+            index = self.selected_character
+            stats = self.combat_stats
+            selected = (f"\nSelected: {self.characters[index][0]}"
+                        f"\nAttack: P{stats['phys_pow'][index]}/M{stats['mag_pow'][index]}/S{stats['spir_pow'][index]}"
+                        f"\nDefense: P{stats['phys_def'][index]}/M{stats['mag_def'][index]}/S{stats['spir_def'][index]}")
+        
+        return f"{header}{selected}{MODE_SUFFIX[self.demo_mode]}{STATUS_FOOTER}"
     
     def run(self):
         """Run the Phase 2 demonstration"""
@@ -450,21 +535,38 @@ class Phase2Demo:
                 return
             
             self.frame_count += 1
+            self.runtime += time.dt
             
             if not self.paused:
-                # Update world
-                self.world.update(time.dt)
+                # Step the world at a fixed rate regardless of render FPS
+                self._sim_accum += time.dt
+                steps = 0
+                while self._sim_accum >= self.SIM_DT and steps < self.MAX_SIM_STEPS:
+                    self.world.update(self.SIM_DT)
+                    self._sim_accum -= self.SIM_DT
+                    steps += 1
+                if steps == self.MAX_SIM_STEPS:
+                    # Drop the backlog rather than carry it into later frames
+                    self._sim_accum = 0.0
             
-            # Update camera
-            if self.camera_controller:
-                self._handle_camera_mouse_input()
+            if self._positions_dirty:
+                self._sync_entity_positions()
+            
+            # Update camera only when a mouse drag moved it; key and scroll
+            # input already update the camera in handle_input
+            if self._handle_camera_mouse_input():
                 self.camera_controller.update_camera()
             
-            # Update UI
-            if self.ui_text:
-                self.ui_text.text = self._get_status_text()
+            # Update UI: runtime line at a reduced rate, the rest only when dirty
+            if self.runtime_text and self.frame_count % self.RUNTIME_UPDATE_FRAMES == 0:
+                self.runtime_text.text = self._get_runtime_text()
+            
+            if self.ui_text and self._status_dirty:
+                self._status_cache = self._get_status_text()
+                self._status_dirty = False
+                self.ui_text.text = self._status_cache
         
-        print("\\nPhase 2 Combat Systems Demo")
+        print("\nPhase 2 Combat Systems Demo")
         print("============================")
         print("Controls:")
         print("  TAB - Switch demo mode")
@@ -483,23 +585,33 @@ class Phase2Demo:
         print("Running Phase 2 demo in console mode")
         print("Press Ctrl+C to exit")
         
+        scheduler = sched.scheduler(time.monotonic, time.sleep)
+        last_time = time.perf_counter()
+        
+        def tick():
+            nonlocal last_time
+            now = time.perf_counter()
+            self.runtime += now - last_time
+            last_time = now
+            
+            # Demonstrate the current system, then sleep until the next demo
+            if self.demo_mode == DemoMode.EQUIPMENT:
+                self._show_equipment_demo()
+            elif self.demo_mode == DemoMode.COMBAT:
+                self._show_combat_demo()
+            elif self.demo_mode == DemoMode.TURN_BASED:
+                self._show_turn_based_demo()
+            
+            self.frame_count += 1
+            if self.running:
+                scheduler.enter(self.CONSOLE_DEMO_INTERVAL, 1, tick)
+        
         try:
-            while self.running:
-                time.sleep(0.1)
-                
-                # Demonstrate different systems periodically
-                if self.frame_count % 100 == 0:
-                    if self.demo_mode == "equipment":
-                        self._show_equipment_demo()
-                    elif self.demo_mode == "combat":
-                        self._show_combat_demo()
-                    elif self.demo_mode == "turn_based":
-                        self._show_turn_based_demo()
-                
-                self.frame_count += 1
-                
+            scheduler.enter(0, 1, tick)
+            scheduler.run()
+            
         except KeyboardInterrupt:
-            print("\\nDemo interrupted by user")
+            print("\nDemo interrupted by user")
 
 
 def main():
@@ -516,7 +628,7 @@ def main():
         demo = Phase2Demo(use_visual=use_visual)
         demo.run()
         
-        print("\\nPhase 2 demonstration completed successfully!")
+        print("\nPhase 2 demonstration completed successfully!")
         
     except Exception as e:
         print(f"Error running demonstration: {e}")
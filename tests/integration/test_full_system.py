@@ -5,6 +5,7 @@ Tests complete system integration including ECS, stats, grid, and pathfinding.
 Validates end-to-end functionality and performance targets.
 """
 
+import math
 import pytest
 import time
 from unittest.mock import patch
@@ -199,24 +200,31 @@ class TestFullSystemIntegration:
                 blessing = Modifier(stat, ModifierType.FLAT, 2, duration=60.0)
                 modifier_manager.add_modifier(blessing)
         
+        # One pathfinder for the whole battle so repeated queries hit its cache
+        pathfinder = AStarPathfinder(grid)
+        
         # Simulate battle rounds
         for round_num in range(20):
             world.update(0.016)
             
             # Test pathfinding between entities each round
             if round_num % 5 == 0:  # Every 5th round
-                pathfinder = AStarPathfinder(grid)
-                
-                warrior_pos = grid.world_to_grid(warrior.get_component(Transform).position)
-                mage_pos = grid.world_to_grid(mage.get_component(Transform).position)
+                warrior_pos = grid.transform_to_grid(warrior.get_component(Transform))
+                mage_pos = grid.transform_to_grid(mage.get_component(Transform))
                 
-                path_result = pathfinder.find_path(warrior_pos, mage_pos)
+                # Only reachability matters here, so any feasible path will do
+                path_result = pathfinder.find_any_path(warrior_pos, mage_pos)
                 
                 # Should find path or determine it's blocked
                 assert isinstance(path_result.success, bool)
                 if path_result.success:
                     assert len(path_result.path) >= 2  # At least start and end
         
+        # Nobody moved and the grid is unchanged, so only the first query searched
+        cache_stats = pathfinder.path_cache.get_stats()
+        assert cache_stats['hits'] == 3
+        assert cache_stats['misses'] == 1
+        
         # Verify all entities maintained their state
         for entity in entities:
             assert entity.active is True
@@ -292,7 +300,14 @@ class TestFullSystemIntegration:
         stat_system = world.get_system("StatSystem")
         perf_stats = stat_system.get_performance_stats()
         
-        assert perf_stats['entities_processed'] == 50 * 60  # 50 entities * 60 frames
+        # Every entity is idle (full MP, no rage, modifiers lasting 30s+), so
+        # StatSystem runs on the first frame and then once per IDLE_SLEEP_TIME
+        # of accumulated frame time: frames 1, 17, 33 and 49
+        frames_per_wake = math.ceil(StatSystem.IDLE_SLEEP_TIME / 0.016)
+        expected_runs = 1 + (60 - 1) // frames_per_wake
+        assert expected_runs == 4
+        assert stat_system.performance_stats.frame_count == expected_runs
+        assert perf_stats['entities_processed'] == 50 * expected_runs
         assert perf_stats['performance_target_met'] is True
         
         world.shutdown()
@@ -314,9 +329,10 @@ class TestFullSystemIntegration:
             grid.set_cell_terrain(Vector2Int(x, y), TerrainType.WALL)
         
         # Add difficult terrain
+        obstacle_set = frozenset(obstacles)
         for i in range(10):
             x, y = (i * 2) % 12, (i * 3) % 12
-            if Vector2Int(x, y) not in [Vector2Int(ox, oy) for ox, oy in obstacles]:
+            if (x, y) not in obstacle_set:
                 grid.set_cell_terrain(Vector2Int(x, y), TerrainType.DIFFICULT)
         
         pathfinder = AStarPathfinder(grid)
@@ -333,12 +349,8 @@ class TestFullSystemIntegration:
             (Vector2Int(0, 5), Vector2Int(11, 6))
         ]
         
-        for start, goal in test_cases:
-            start_time = time.perf_counter()
-            result = pathfinder.find_path(start, goal)
-            query_time = time.perf_counter() - start_time
-            
-            query_times.append(query_time)
+        for result in pathfinder.find_paths(test_cases):
+            query_times.append(result.search_time)
             if result.success:
                 successful_queries += 1
         
@@ -352,6 +364,7 @@ class TestFullSystemIntegration:
     
     def test_memory_usage_integration(self):
         """Test memory usage in integrated system"""
+        import gc
         import psutil
         import os
         
@@ -369,10 +382,10 @@ class TestFullSystemIntegration:
             # Create entities
             for i in range(20):
                 entity = world.create_entity(
-                    Transform(Vector3(i, 0, cycle)),
-                    AttributeStats(),
-                    ResourceManager(),
-                    ModifierManager()
+                    world.acquire_component(Transform, Vector3(i, 0, cycle)),
+                    world.acquire_component(AttributeStats),
+                    world.acquire_component(ResourceManager),
+                    world.acquire_component(ModifierManager)
                 )
                 created_entities.append(entity.id)
             
@@ -380,9 +393,9 @@ class TestFullSystemIntegration:
             for _ in range(10):
                 world.update(0.016)
             
-            # Destroy half the entities
+            # Destroy half the entities, releasing their components for reuse
             for entity_id in created_entities[::2]:
-                world.destroy_entity(entity_id)
+                world.release_entity(entity_id)
             
             # Clean up destroyed entities
             world.entity_manager.cleanup_destroyed_entities()
@@ -391,7 +404,7 @@ class TestFullSystemIntegration:
         
         # Final cleanup
         for entity_id in created_entities:
-            world.destroy_entity(entity_id)
+            world.release_entity(entity_id)
         world.entity_manager.cleanup_destroyed_entities()
         
         # Multiple update cycles to ensure cleanup
@@ -400,6 +413,8 @@ class TestFullSystemIntegration:
         
         world.shutdown()
         
+        # Measure retained memory, not garbage still waiting for collection
+        gc.collect()
         final_memory = process.memory_info().rss
         memory_increase = final_memory - initial_memory
         
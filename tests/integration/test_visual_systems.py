@@ -77,6 +77,30 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         visualizer.clear_all_highlights()
         self.assertEqual(len(visualizer.get_highlighted_tiles()), 0)
     
+    def test_stacked_highlights_per_tile(self):
+        """Test several highlight types on one tile are tracked independently"""
+        from ui.visual.grid_visualizer import GridVisualizer, HighlightType
+        
+        visualizer = GridVisualizer(self.grid_system, self.pathfinding)
+        tile_pos = Vector2Int(2, 3)
+        other_pos = Vector2Int(7, 7)
+        
+        visualizer.highlight_tiles([tile_pos, other_pos], HighlightType.MOVEMENT)
+        visualizer.add_tile_highlight(tile_pos, HighlightType.DANGER_ZONE)
+        
+        self.assertEqual(visualizer.get_tile_highlights(tile_pos),
+                         {HighlightType.MOVEMENT, HighlightType.DANGER_ZONE})
+        self.assertEqual(visualizer.get_performance_stats()['total_highlight_instances'], 3)
+        
+        # The returned set is a copy
+        visualizer.get_tile_highlights(tile_pos).clear()
+        self.assertTrue(visualizer.is_tile_highlighted(tile_pos, HighlightType.DANGER_ZONE))
+        
+        visualizer.clear_highlights_of_type(HighlightType.MOVEMENT)
+        self.assertEqual(visualizer.get_highlighted_tiles(), {tile_pos})
+        self.assertEqual(visualizer.get_tile_highlights(other_pos), set())
+        self.assertEqual(visualizer.get_highlighted_tiles(HighlightType.DANGER_ZONE), {tile_pos})
+    
     def test_grid_visualizer_performance(self):
         """Test GridVisualizer performance meets targets"""
         from ui.visual.grid_visualizer import GridVisualizer, HighlightType
@@ -86,9 +110,8 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         # Test update performance (should be <5ms for full battlefield refresh)
         with self.profiler.measure('visual_updates'):
             # Simulate heavy highlighting workload
-            for x in range(10):
-                for y in range(10):
-                    visualizer.add_tile_highlight(Vector2Int(x, y), HighlightType.MOVEMENT)
+            xs, ys = zip(*[(x, y) for x in range(10) for y in range(10)])
+            visualizer.add_tile_highlights_bulk(xs, ys, HighlightType.MOVEMENT)
             
             # Update multiple times
             for _ in range(10):
@@ -118,6 +141,47 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         visualizer.set_selected_unit(new_unit)
         self.assertEqual(visualizer.selected_unit, new_unit)
     
+    def test_selection_overlays_cached_until_unit_moves(self):
+        """Test selection overlays are reused while static and rebuilt after a move"""
+        from ui.visual.grid_visualizer import GridVisualizer, HighlightType
+        
+        visualizer = GridVisualizer(self.grid_system, self.pathfinding)
+        unit = self.test_entities[0]
+        
+        visualizer.set_selected_unit(unit)
+        attack_tiles = visualizer.get_highlighted_tiles(HighlightType.ATTACK_RANGE)
+        cached_overlays = visualizer._overlay_cache[1]
+        
+        # Reselecting after a deselect reuses the cached tile sets
+        visualizer.set_selected_unit(None)
+        visualizer.set_selected_unit(unit)
+        self.assertIs(visualizer._overlay_cache[1], cached_overlays)
+        self.assertEqual(visualizer.get_highlighted_tiles(HighlightType.ATTACK_RANGE), attack_tiles)
+        
+        # Only the current selection is cached
+        other_unit = self.test_entities[1]
+        visualizer.set_selected_unit(other_unit)
+        self.assertEqual(visualizer._overlay_cache[0][0], other_unit.id)
+        visualizer.set_selected_unit(unit)
+        self.assertIsNot(visualizer._overlay_cache[1], cached_overlays)
+        cached_overlays = visualizer._overlay_cache[1]
+        
+        # Occupancy changes (e.g. an enemy moving) rebuild on the next update
+        self.assertTrue(self.grid_system.occupy_cell(Vector2Int(9, 9), "enemy"))
+        visualizer.last_update_time = 0.0
+        visualizer.update(0.016)
+        self.assertIsNot(visualizer._overlay_cache[1], cached_overlays)
+        cached_overlays = visualizer._overlay_cache[1]
+        
+        # Moving the unit rebuilds its overlays on the next update
+        unit.get_component(Transform).position = Vector3(5, 0, 5)
+        visualizer.last_update_time = 0.0
+        visualizer.update(0.016)
+        self.assertIsNot(visualizer._overlay_cache[1], cached_overlays)
+        moved_tiles = visualizer.get_highlighted_tiles(HighlightType.ATTACK_RANGE)
+        self.assertIn(Vector2Int(5, 8), moved_tiles)
+        self.assertNotIn(Vector2Int(5, 5), moved_tiles)
+    
     def test_effect_area_highlighting(self):
         """Test area effect highlighting"""
         from ui.visual.grid_visualizer import GridVisualizer, HighlightType
@@ -138,6 +202,21 @@ class TestVisualSystemsIntegration(unittest.TestCase):
             distance = abs(tile_pos.x - center.x) + abs(tile_pos.y - center.y)
             self.assertLessEqual(distance, radius)
     
+    def test_effect_area_clipped_to_grid(self):
+        """Test area effects at the grid edge cover exactly the in-bounds tiles"""
+        from ui.visual.grid_visualizer import GridVisualizer, HighlightType
+        
+        visualizer = GridVisualizer(self.grid_system, self.pathfinding)
+        center = Vector2Int(1, 9)
+        radius = 3
+        
+        visualizer.show_effect_area(center, radius)
+        
+        expected = {Vector2Int(x, y) for x in range(10) for y in range(10)
+                    if abs(x - center.x) + abs(y - center.y) <= radius}
+        self.assertEqual(visualizer.get_highlighted_tiles(HighlightType.EFFECT_AREA), expected)
+        self.assertEqual(visualizer.dirty_tiles, expected)
+    
     def test_movement_path_visualization(self):
         """Test movement path highlighting"""
         from ui.visual.grid_visualizer import GridVisualizer, HighlightType
@@ -156,6 +235,12 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         # Verify only path tiles are highlighted with movement_path
         path_highlights = visualizer.get_highlighted_tiles(HighlightType.MOVEMENT_PATH)
         self.assertEqual(len(path_highlights), len(path))
+        
+        # A new path replaces the old one, and off-grid steps are skipped
+        new_path = [Vector2Int(0, 0), Vector2Int(0, 1), Vector2Int(-1, 1)]
+        visualizer.show_movement_path(new_path)
+        self.assertEqual(visualizer.get_highlighted_tiles(HighlightType.MOVEMENT_PATH),
+                         set(new_path[:2]))
     
     def test_visual_data_generation(self):
         """Test visual data generation for rendering"""
@@ -184,6 +269,48 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         all_visual_data = visualizer.get_all_visual_data()
         self.assertEqual(len(all_visual_data), len(test_tiles))
     
+    def test_visual_data_priority_and_pulse(self):
+        """Test stacked highlights render the highest priority style with its pulse"""
+        from ui.visual.grid_visualizer import GridVisualizer, HighlightType
+        
+        visualizer = GridVisualizer(self.grid_system, self.pathfinding)
+        tile_pos = Vector2Int(4, 4)
+        visualizer.add_tile_highlight(tile_pos, HighlightType.MOVEMENT)
+        visualizer.add_tile_highlight(tile_pos, HighlightType.SELECTION)
+        visualizer.pulse_animations[HighlightType.SELECTION] = 0.5
+        
+        selection_style = visualizer.highlight_styles[HighlightType.SELECTION]
+        expected_intensity = selection_style.intensity
+        if selection_style.pulse_speed > 0:
+            expected_intensity *= 0.5
+        
+        visual_data = visualizer.get_visual_data_for_tile(tile_pos)
+        self.assertEqual(visual_data['color'], selection_style.color)
+        self.assertAlmostEqual(visual_data['intensity'], expected_intensity)
+        self.assertEqual(visualizer.get_all_visual_data(), [visual_data])
+        
+        # Stacked types are reported from one shared immutable tuple per mask
+        self.assertEqual(set(visual_data['highlight_types']),
+                         {HighlightType.MOVEMENT, HighlightType.SELECTION})
+        self.assertIs(visualizer.get_visual_data_for_tile(tile_pos)['highlight_types'],
+                      visual_data['highlight_types'])
+    
+    def test_update_skips_pulse_when_idle(self):
+        """Test updates do no pulse work until something is highlighted"""
+        from ui.visual.grid_visualizer import GridVisualizer, HighlightType, HighlightStyle
+        
+        visualizer = GridVisualizer(self.grid_system, self.pathfinding)
+        visualizer.update(0.016)
+        self.assertEqual(visualizer.pulse_animations, {})
+        
+        # Restyled types pulse once something is on the grid
+        visualizer.set_highlight_style(HighlightType.MOVEMENT,
+                                       HighlightStyle(color=(0.0, 1.0, 0.0, 0.6), pulse_speed=1.0))
+        visualizer.add_tile_highlight(Vector2Int(1, 1), HighlightType.MOVEMENT)
+        visualizer.last_update_time = 0.0  # Bypass the frame throttle
+        visualizer.update(0.016)
+        self.assertIn(HighlightType.MOVEMENT, visualizer.pulse_animations)
+    
     @patch('ui.visual.tile_highlighter.URSINA_AVAILABLE', False)
     def test_tile_highlighter_without_ursina(self):
         """Test that TileHighlighter fails gracefully without Ursina"""
@@ -221,6 +348,12 @@ class TestVisualSystemsIntegration(unittest.TestCase):
                 current_time = time.time()
                 animator._process_animation_queue(current_time + 1.0)  # Future time
                 self.assertEqual(len(animator.animation_queue), 0)  # Should be processed
+                
+                # A delayed animation waits without holding back ones already due
+                animator.queue_movement_animation(test_unit, target_pos, duration=1.0, delay=5.0)
+                animator.queue_movement_animation(test_unit, target_pos, duration=1.0)
+                animator._process_animation_queue(time.time() + 1.0)
+                self.assertEqual(len(animator.animation_queue), 1)
     
     def test_interface_state_management(self):
         """Test interface state management without Ursina"""
@@ -281,8 +414,9 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         
         # Test profiled operations
         with self.profiler.measure('test_operation'):
-            for i in range(100):
-                visualizer.add_tile_highlight(Vector2Int(i % 10, i // 10), HighlightType.MOVEMENT)
+            visualizer.add_tile_highlights_bulk([i % 10 for i in range(100)],
+                                                [i // 10 for i in range(100)],
+                                                HighlightType.MOVEMENT)
         
         # Verify profiling worked
         stats = self.profiler.get_stats('test_operation')
@@ -290,6 +424,21 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         self.assertEqual(stats.total_calls, 1)
         self.assertGreater(stats.total_time, 0)
         
+        # Durations are kept as integer nanoseconds and reported in seconds
+        metric = self.profiler.measurements['test_operation'][0]
+        self.assertIsInstance(metric.duration_ns, int)
+        self.assertEqual(stats.total_time, metric.duration_ns / 1e9)
+        
+        self.profiler.record_measurement('test_operation', 0.0015)
+        self.assertEqual(self.profiler.measurements['test_operation'][-1].duration_ns, 1_500_000)
+        
+        # Only the most recent max_samples measurements are kept
+        bounded = PerformanceProfiler(max_samples=5)
+        for _ in range(8):
+            with bounded.measure('bounded_operation'):
+                pass
+        self.assertEqual(bounded.get_stats('bounded_operation').total_calls, 5)
+        
         # Test performance report
         report = self.profiler.get_performance_report()
         self.assertIn('measurement_count', report)
@@ -301,10 +450,11 @@ class TestVisualSystemsIntegration(unittest.TestCase):
         
         visualizer = GridVisualizer(self.grid_system, self.pathfinding)
         
-        # Create many highlights to test memory usage
-        for x in range(50):
-            for y in range(50):
-                visualizer.add_tile_highlight(Vector2Int(x, y), HighlightType.MOVEMENT)
+        # Create many highlights to test memory usage; tiles outside the
+        # 10x10 grid are skipped
+        xs, ys = zip(*[(x, y) for x in range(50) for y in range(50)])
+        visualizer.add_tile_highlights_bulk(xs, ys, HighlightType.MOVEMENT)
+        self.assertEqual(len(visualizer.get_highlighted_tiles()), 100)
         
         # Test performance stats
         stats = visualizer.get_performance_stats()
@@ -418,12 +568,12 @@ class TestPerformanceTargets(unittest.TestCase):
         
         visualizer = GridVisualizer(self.grid_system, self.pathfinding)
         
-        # Create full battlefield of highlights
-        for x in range(10):
-            for y in range(10):
-                highlight_type = [HighlightType.MOVEMENT, HighlightType.ATTACK_RANGE, 
-                                HighlightType.EFFECT_AREA][x % 3]
-                visualizer.add_tile_highlight(Vector2Int(x, y), highlight_type)
+        # Create full battlefield of highlights, one column type per x % 3
+        highlight_types = [HighlightType.MOVEMENT, HighlightType.ATTACK_RANGE,
+                           HighlightType.EFFECT_AREA]
+        for offset, highlight_type in enumerate(highlight_types):
+            xs, ys = zip(*[(x, y) for x in range(offset, 10, 3) for y in range(10)])
+            visualizer.add_tile_highlights_bulk(xs, ys, highlight_type)
         
         # Measure update performance
         with self.profiler.measure('visual_updates'):
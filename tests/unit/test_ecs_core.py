@@ -151,6 +151,19 @@ class TestEntityManager:
         assert not entity.active
         assert entity_id in manager._destroyed_entities
     
+    def test_entity_count_tracking(self):
+        """Test active entity count follows creation and destruction"""
+        manager = EntityManager()
+        entities = [manager.create_entity() for _ in range(3)]
+        assert manager.entity_count == 3
+        
+        manager.destroy_entity(entities[0].id)
+        manager.destroy_entity(entities[0].id)  # Repeat destroy must not double count
+        assert manager.entity_count == 2
+        
+        manager.cleanup_destroyed_entities()
+        assert manager.get_entity_count() == 2
+    
     def test_component_queries(self):
         """Test querying entities by components"""
         manager = EntityManager()
@@ -171,6 +184,46 @@ class TestEntityManager:
         assert len(both_components) == 1
         assert entity3 in both_components
     
+    def test_batch_entity_creation(self):
+        """Test batch creation registers every entity with one cache invalidation"""
+        manager = EntityManager()
+        invalidations = manager._cache_invalidation_counter
+        
+        entities = manager.create_entities([
+            (MockTestComponent(1),),
+            (MockTestComponent(2), Transform()),
+            (),
+        ])
+        
+        assert len(entities) == 3
+        assert manager.entity_count == 3
+        assert entities[1].get_component(MockTestComponent).value == 2
+        assert manager._cache_invalidation_counter == invalidations + 1
+        
+        both_components = manager.get_entities_with_components(MockTestComponent, Transform)
+        assert both_components == [entities[1]]
+    
+    def test_signature_query_index(self):
+        """Test signature queries follow component changes and destruction"""
+        manager = EntityManager()
+        entity1 = manager.create_entity(MockTestComponent(1))
+        entity2 = manager.create_entity(MockTestComponent(2), Transform())
+        
+        assert manager.query(MockTestComponent) == [entity1, entity2]
+        assert manager.query(MockTestComponent, Transform) == [entity2]
+        assert manager.query(MockTestComponent) is manager.query(MockTestComponent)
+        
+        # Components added or removed after registration update the index
+        entity1.add_component(Transform())
+        assert manager.query(Transform, MockTestComponent) == [entity1, entity2]
+        entity2.remove_component(Transform)
+        assert manager.query(Transform) == [entity1]
+        assert manager.get_entities_with_component(Transform) == [entity1]
+        
+        manager.destroy_entity(entity1.id)
+        assert manager.query(MockTestComponent) == [entity2]
+        assert manager.query() == [entity2]
+    
     def test_cleanup_destroyed_entities(self):
         """Test cleanup of destroyed entities"""
         manager = EntityManager()
@@ -182,6 +235,38 @@ class TestEntityManager:
         
         assert entity_id not in manager._entities
         assert len(manager._destroyed_entities) == 0
+    
+    def test_component_pooling_is_opt_in(self):
+        """Test only released components are reused, and entities never are"""
+        manager = EntityManager()
+        transform = Transform(Vector3(1, 2, 3))
+        entity = manager.create_entity(transform)
+        
+        # Plain destruction leaves held handles and components untouched
+        manager.destroy_entity(entity.id)
+        manager.cleanup_destroyed_entities()
+        assert manager.acquire_component(Transform) is not transform
+        assert transform.position == Vector3(1, 2, 3)
+        assert manager.create_entity() is not entity
+        assert not entity.active
+        
+        # Released components are pooled only once cleanup has run
+        released = Transform(Vector3(1, 2, 3))
+        entity = manager.create_entity(released)
+        manager.release_entity(entity.id)
+        assert manager.acquire_component(Transform) is not released
+        manager.cleanup_destroyed_entities()
+        
+        reused_transform = manager.acquire_component(Transform, Vector3(4, 5, 6))
+        assert reused_transform is released
+        assert reused_transform.position == Vector3(4, 5, 6)
+        assert reused_transform.entity_id is None
+        
+        # Components still on an entity cannot be released
+        attached = Transform()
+        manager.create_entity(attached)
+        with pytest.raises(ValueError):
+            manager.release_component(attached)
 
 
 class TestSystemManagement:
@@ -225,6 +310,23 @@ class TestSystemManagement:
         assert entity3 in system.updated_entities
         assert entity2 not in system.updated_entities
     
+    def test_reduced_rate_system_update(self):
+        """Test systems updating every N frames receive accumulated time"""
+        from core.events.event_bus import EventBus
+        manager = SystemManager(EventBus())
+        system = MockTestSystem()
+        system.update_every_n_frames = 2
+        manager.add_system(system)
+        
+        received = []
+        system.update = lambda delta_time, entities: received.append(delta_time)
+        
+        for _ in range(4):
+            manager.update(0.016, [])
+        
+        assert received == pytest.approx([0.032, 0.032])
+        assert system.performance_stats.frame_count == 2
+    
     def test_system_priority(self):
         """Test system execution order by priority"""
         from core.events.event_bus import EventBus
@@ -245,6 +347,84 @@ class TestSystemManagement:
         # Systems should be sorted by priority (lower number = higher priority)
         assert manager._systems[0].name == "HighPriority"
         assert manager._systems[1].name == "LowPriority"
+        
+        # Public view follows the same order and tracks removals
+        assert [s.name for s in manager.systems] == ["HighPriority", "LowPriority"]
+        manager.remove_system("HighPriority")
+        assert manager.systems == (system1,)
+    
+    def test_system_batches_from_component_access(self):
+        """Test systems with disjoint component access share a batch and run via the executor"""
+        from concurrent.futures import ThreadPoolExecutor
+        from core.events.event_bus import EventBus
+        
+        def declared_system(name, priority, reads, writes):
+            system = MockTestSystem()
+            system.name = name
+            system.priority = priority
+            system.get_read_components = lambda: reads
+            system.get_write_components = lambda: writes
+            return system
+        
+        manager = SystemManager(EventBus())
+        stats = declared_system("Stats", 1, {MockTestComponent}, {MockTestComponent})
+        movement = declared_system("Movement", 2, {Transform}, {Transform})
+        reader = declared_system("Reader", 3, {Transform}, set())
+        undeclared = MockTestSystem()
+        undeclared.priority = 4
+        for system in (stats, movement, reader, undeclared):
+            manager.add_system(system)
+        
+        # Reader needs Movement's writes, undeclared systems run alone
+        assert manager.batches == ((stats, movement), (reader,), (undeclared,))
+        
+        entity = Entity()
+        entity.add_component(MockTestComponent(1))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            manager.executor = executor
+            manager.update(0.016, [entity])
+        
+        assert stats.updated_entities == [entity]
+        assert undeclared.updated_entities == [entity]
+        assert movement.performance_stats.frame_count == 1
+    
+    def test_system_sleep_until_deadline(self):
+        """Test systems returning a sleep time are skipped until it passes or entities change"""
+        from core.events.event_bus import EventBus
+        
+        class SleepySystem(MockTestSystem):
+            def __init__(self):
+                super().__init__()
+                self.deltas = []
+            
+            def update(self, delta_time, entities):
+                super().update(delta_time, entities)
+                self.deltas.append(delta_time)
+                return 0.05
+        
+        manager = SystemManager(EventBus())
+        system = SleepySystem()
+        manager.add_system(system)
+        
+        entity = Entity()
+        entity.add_component(MockTestComponent(1))
+        entities = [entity]
+        for _ in range(4):
+            manager.update(0.02, entities)
+        
+        # Ran once, slept two frames, then received the time it skipped
+        assert system.deltas == [0.02, pytest.approx(0.06)]
+        
+        # A new matching entity wakes it early
+        other = Entity()
+        other.add_component(MockTestComponent(2))
+        entities.append(other)
+        manager.update(0.02, list(entities))
+        assert system.updated_entities == entities
+        
+        system.wake()
+        manager.update(0.02, list(entities))
+        assert len(system.deltas) == 4
 
 
 class TestWorld:
@@ -13,9 +13,10 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from core.ecs.component import Transform
 from core.math.vector import Vector3, Vector2Int
 from core.math.grid import TacticalGrid, GridCell, TerrainType
-from core.math.pathfinding import AStarPathfinder, PathfindingResult
+from core.math.pathfinding import AStarPathfinder, JumpPointSearch, PathfindingResult, octile_distance
 
 
 class TestVector3:
@@ -155,6 +156,17 @@ class TestTacticalGrid:
         invalid_cell = grid.get_cell(Vector2Int(5, 5))
         assert invalid_cell is None
     
+    def test_grid_cell_access_by_xy(self):
+        """Test integer-indexed cell access matches Vector2Int access"""
+        grid = TacticalGrid(4, 3)
+        
+        for x in range(4):
+            for y in range(3):
+                assert grid.get_cell_xy(x, y) is grid.get_cell(Vector2Int(x, y))
+        
+        assert grid.get_cell_xy(4, 0) is None
+        assert grid.get_cell_xy(0, -1) is None
+    
     def test_height_modifications(self):
         """Test setting cell heights"""
         grid = TacticalGrid(3, 3)
@@ -174,6 +186,49 @@ class TestTacticalGrid:
         assert cell.terrain_type == TerrainType.WALL
         assert cell.passable is False
     
+    def test_height_map_reproducible(self):
+        """Test height generation is seeded locally and reproducible"""
+        import random
+        random.seed(7)
+        expected_next = random.random()
+        random.seed(7)
+        
+        grid_a = TacticalGrid(6, 4)
+        grid_a.generate_height_map(seed=42, roughness=0.5)
+        grid_b = TacticalGrid(6, 4)
+        grid_b.generate_height_map(rng=random.Random(42), roughness=0.5)
+        
+        heights_a = [cell.height for cell in grid_a.cells.values()]
+        assert heights_a == [cell.height for cell in grid_b.cells.values()]
+        assert any(height != 0.0 for height in heights_a)
+        
+        # The global random module is left untouched
+        assert random.random() == expected_next
+    
+    def test_bulk_cell_modifications(self):
+        """Test setting terrain and height on several cells at once"""
+        grid = TacticalGrid(3, 3)
+        positions = [Vector2Int(0, 0), Vector2Int(2, 1), Vector2Int(5, 5)]
+        version = grid.version
+        
+        assert grid.set_cells_terrain(positions, TerrainType.WALL) == 2
+        assert grid.version == version + 1
+        assert grid.get_cell(Vector2Int(2, 1)).passable is False
+        
+        assert grid.set_cells_height(positions, 1.5) == 2
+        assert grid.get_cell(Vector2Int(0, 0)).height == 1.5
+        
+        version = grid.version
+        assert grid.set_cells_terrain(positions, TerrainType.ELEVATED, height=2.0) == 2
+        assert grid.version == version + 1
+        assert grid.get_cell(Vector2Int(2, 1)).terrain_type == TerrainType.ELEVATED
+        assert grid.get_cell(Vector2Int(2, 1)).height == 2.0
+        
+        # Nothing valid to change leaves cached pathfinding data alone
+        version = grid.version
+        assert grid.set_cells_terrain([Vector2Int(9, 9)], TerrainType.NORMAL) == 0
+        assert grid.version == version
+    
     def test_coordinate_conversion(self):
         """Test world-grid coordinate conversion"""
         grid = TacticalGrid(10, 10, cell_size=2.0)
@@ -188,6 +243,38 @@ class TestTacticalGrid:
         assert back_to_world.x == 5.0  # (2 + 0.5) * 2 = 5
         assert back_to_world.z == 7.0  # (3 + 0.5) * 2 = 7
     
+    def test_positions_by_flat_index(self):
+        """Test the shared position table matches flat indices and pathfinding reuses it"""
+        grid = TacticalGrid(6, 4)
+        positions = grid.get_positions()
+        
+        assert len(positions) == 24
+        assert positions[3 * 4 + 2] == Vector2Int(3, 2)
+        assert grid.get_cell(positions[5]).grid_pos is positions[5]
+        neighbors = grid.get_neighbors(Vector2Int(2, 2), include_diagonals=True)
+        assert len(neighbors) == 8
+        assert all(pos is positions[pos.x * 4 + pos.y] for pos in neighbors)
+        
+        grid.set_cell_height(Vector2Int(2, 2), 1.0)  # Non-uniform: A* kernel
+        path = AStarPathfinder(grid).find_path(Vector2Int(0, 0), Vector2Int(5, 3)).path
+        assert all(pos is positions[pos.x * 4 + pos.y] for pos in path)
+    
+    def test_transform_to_grid_cached(self):
+        """Test Transform grid coordinates are cached until the position changes"""
+        grid = TacticalGrid(10, 10, cell_size=2.0)
+        transform = Transform(Vector3(5.0, 0.0, 7.0))
+        
+        grid_pos = grid.transform_to_grid(transform)
+        assert grid_pos == grid.world_to_grid(transform.position)
+        assert grid.transform_to_grid(transform) is grid_pos
+        
+        # Replacing the position invalidates the cached cell
+        transform.position = Vector3(9.0, 0.0, 1.0)
+        assert grid.transform_to_grid(transform) == Vector2Int(4, 0)
+        
+        # A grid with a different cell size does not reuse it
+        assert TacticalGrid(10, 10).transform_to_grid(transform) == Vector2Int(9, 1)
+    
     def test_neighbor_calculations(self):
         """Test getting neighboring cells"""
         grid = TacticalGrid(5, 5)
@@ -249,6 +336,13 @@ class TestTacticalGrid:
         # Should include center plus all cells within Manhattan distance 2
         assert len(cells_in_range) > 5  # At minimum center + 4 cardinals
         assert center in cells_in_range
+        
+        # Near a corner the diamond is clipped to the grid, with no duplicates
+        corner = Vector2Int(1, 8)
+        clipped = grid.get_cells_in_range(corner, range_distance=3)
+        expected = [Vector2Int(x, y) for x in range(10) for y in range(10)
+                    if abs(x - 1) + abs(y - 8) <= 3]
+        assert clipped == expected
     
     def test_procedural_height_generation(self):
         """Test procedural height map generation"""
@@ -262,6 +356,33 @@ class TestTacticalGrid:
         assert not all(h == 0.0 for h in heights)  # Should have some variation
         assert max(heights) > min(heights)  # Should have height differences
 
+    def test_edge_table_invalidation(self):
+        """Test cached pathfinding edges are rebuilt after grid mutation"""
+        grid = TacticalGrid(3, 3)
+        center = grid.cell_index(Vector2Int(1, 1))
+
+        assert len(grid.get_edges(center)) == 8
+        version = grid.version
+
+        grid.set_cell_terrain(Vector2Int(0, 0), TerrainType.WALL)
+        grid.occupy_cell(Vector2Int(2, 2), "unit")
+
+        assert grid.version > version
+        assert len(grid.get_edges(center)) == 6
+    
+    def test_cell_changes_update_pathfinding_data_locally(self):
+        """Test single-cell changes keep unaffected edges and patch walkability"""
+        grid = TacticalGrid(6, 6)
+        edge_table = grid.get_edge_table()
+        far_edges = edge_table[grid.cell_index(Vector2Int(5, 5))]
+        
+        grid.set_cell_terrain(Vector2Int(1, 1), TerrainType.WALL)
+        
+        assert edge_table[grid.cell_index(Vector2Int(5, 5))] is far_edges
+        assert edge_table[grid.cell_index(Vector2Int(0, 0))] is None
+        assert grid.get_walkable()[(1 + 1) * (grid.height + 2) + 1 + 1] == 0
+        assert len(grid.get_edge_table()[grid.cell_index(Vector2Int(0, 0))]) == 2
+
 
 class TestAStarPathfinding:
     """Test A* pathfinding algorithm"""
@@ -289,6 +410,19 @@ class TestAStarPathfinding:
         assert result.path[0] == start
         assert result.path[-1] == goal
     
+    def test_octile_heuristic_matches_open_grid_cost(self):
+        """Test octile heuristic equals the true cost on a flat open grid"""
+        grid = TacticalGrid(8, 8)
+        pathfinder = AStarPathfinder(grid)
+        start = Vector2Int(0, 0)
+        
+        for goal in (Vector2Int(7, 3), Vector2Int(2, 6), Vector2Int(5, 5)):
+            result = pathfinder.find_path(start, goal)
+            dx, dy = goal.x - start.x, goal.y - start.y
+            
+            # Exact on open ground, so the heuristic is tight and admissible
+            assert result.cost == pytest.approx(octile_distance(dx, dy))
+    
     def test_pathfinding_with_obstacles(self):
         """Test pathfinding around obstacles"""
         grid = TacticalGrid(5, 5)
@@ -411,6 +545,140 @@ class TestAStarPathfinding:
         assert cache_size_after_first == 1
         assert cache_size_after_second == 1  # No new cache entry
         assert result1.path == result2.path
+
+    def test_pathfinding_cache_invalidated_by_grid_changes(self):
+        """Test cached paths are dropped when the grid is mutated"""
+        grid = TacticalGrid(5, 5)
+        pathfinder = AStarPathfinder(grid)
+
+        start = Vector2Int(0, 0)
+        goal = Vector2Int(2, 0)
+
+        first = pathfinder.find_path(start, goal)
+        assert Vector2Int(1, 0) in first.path
+
+        # Block the straight route; the cached path must not be returned
+        grid.set_cell_terrain(Vector2Int(1, 0), TerrainType.WALL)
+        second = pathfinder.find_path(start, goal)
+
+        assert second.success is True
+        assert Vector2Int(1, 0) not in second.path
+        assert len(pathfinder.path_cache) == 1
+    
+    def test_batched_path_queries(self):
+        """Test find_paths answers each pair like find_path, in order"""
+        grid = TacticalGrid(8, 8)
+        grid.set_cell_terrain(Vector2Int(3, 3), TerrainType.WALL)
+        pairs = [
+            (Vector2Int(0, 0), Vector2Int(7, 7)),
+            (Vector2Int(7, 0), Vector2Int(7, 7)),
+            (Vector2Int(2, 5), Vector2Int(3, 3)),  # Goal is a wall
+        ]
+        
+        results = AStarPathfinder(grid).find_paths(pairs)
+        expected = [AStarPathfinder(grid).find_path(start, goal) for start, goal in pairs]
+        
+        assert [r.path for r in results] == [r.path for r in expected]
+        assert [r.cost for r in results] == [r.cost for r in expected]
+        assert results[2].success is False
+    
+    def test_heuristic_tables_per_goal(self):
+        """Test filled heuristic tables are kept per goal and match the octile estimate"""
+        grid = TacticalGrid(6, 6)
+        grid.generate_height_map(seed=7)
+        pathfinder = AStarPathfinder(grid)
+        
+        goal_a = Vector2Int(5, 5)
+        goal_b = Vector2Int(0, 5)
+        pathfinder.find_path(Vector2Int(0, 0), goal_a)
+        pathfinder.find_path(Vector2Int(0, 0), goal_b)
+        assert len(pathfinder._heuristic_tables) == 2
+        
+        for x in range(6):
+            for y in range(6):
+                pos = Vector2Int(x, y)
+                h = pathfinder._index_heuristic(goal_a)(x * grid.height + y)
+                assert h == pytest.approx(pathfinder._heuristic(pos, goal_a))
+        
+        # Tables belong to one grid version
+        grid.set_cell_height(Vector2Int(2, 2), 3.0)
+        pathfinder.find_path(Vector2Int(0, 0), goal_a)
+        assert len(pathfinder._heuristic_tables) == 1
+    
+    def test_search_buffers_reused_between_queries(self):
+        """Test large-grid searches reusing kernel buffers match fresh searches"""
+        grid = TacticalGrid(20, 20)  # Above SMALL_GRID_CELLS
+        grid.generate_height_map(seed=11)
+        for y in range(15):
+            grid.set_cell_terrain(Vector2Int(10, y), TerrainType.WALL)
+        
+        pathfinder = AStarPathfinder(grid)
+        assert pathfinder._search_buffers is not None
+        
+        queries = [(Vector2Int(0, 0), Vector2Int(19, 0)), (Vector2Int(2, 3), Vector2Int(4, 5)),
+                   (Vector2Int(19, 19), Vector2Int(0, 18)), (Vector2Int(0, 0), Vector2Int(19, 0))]
+        for start, goal in queries:
+            # max_cost bypasses the path cache so every query searches
+            result = pathfinder.find_path(start, goal, max_cost=1000.0)
+            fresh = AStarPathfinder(grid).find_path(start, goal, max_cost=1000.0)
+            assert result.path == fresh.path
+            assert result.cost == pytest.approx(fresh.cost)
+    
+    def test_jump_point_search_matches_astar(self):
+        """Test JPS is used on uniform-cost grids and finds A*-optimal paths"""
+        grid = TacticalGrid(12, 12)
+        for y in range(10):
+            grid.set_cell_terrain(Vector2Int(4, y), TerrainType.WALL)
+        for y in range(2, 12):
+            grid.set_cell_terrain(Vector2Int(8, y), TerrainType.WALL)
+        assert grid.get_uniform_step_cost() == 1.0
+        
+        pathfinder = AStarPathfinder(grid)
+        jps = JumpPointSearch(grid)
+        start, goal = Vector2Int(0, 0), Vector2Int(11, 11)
+        
+        result = pathfinder.find_path(start, goal)
+        assert pathfinder._jump_point_search is not None
+        assert jps.find_path(start, goal).cost == pytest.approx(result.cost)
+        
+        # Custom costs still run A* cell by cell and agree on the optimum
+        reference = pathfinder.find_path(start, goal, movement_cost_func=grid.get_movement_cost)
+        assert result.cost == pytest.approx(reference.cost)
+        assert result.path[0] == start and result.path[-1] == goal
+        for a, b in zip(result.path, result.path[1:]):
+            assert grid.get_movement_cost(a, b) != float('inf')
+        
+        # Height costs make the grid non-uniform
+        grid.set_cell_height(Vector2Int(1, 1), 1.0)
+        assert grid.get_uniform_step_cost() is None
+    
+    def test_find_any_path_feasible(self):
+        """Test greedy search returns a valid, costed path and is cached apart"""
+        grid = TacticalGrid(12, 12)
+        grid.generate_height_map(seed=5)
+        for y in range(10):
+            grid.set_cell_terrain(Vector2Int(6, y), TerrainType.WALL)
+        
+        pathfinder = AStarPathfinder(grid)
+        start, goal = Vector2Int(0, 0), Vector2Int(11, 0)
+        
+        result = pathfinder.find_any_path(start, goal)
+        assert result.success is True
+        assert result.path[0] == start and result.path[-1] == goal
+        for a, b in zip(result.path, result.path[1:]):
+            assert grid.get_movement_cost(a, b) != float('inf')
+        assert result.cost == pytest.approx(sum(grid.get_movement_cost(a, b)
+                                                for a, b in zip(result.path, result.path[1:])))
+        
+        # The optimal query is not answered from the greedy cache entry
+        optimal = pathfinder.find_path(start, goal)
+        assert optimal.cost <= result.cost + 1e-9
+        assert pathfinder.find_any_path(start, goal) is result
+        
+        # Blocked goals still fail
+        grid.set_cell_terrain(Vector2Int(6, 10), TerrainType.WALL)
+        grid.set_cell_terrain(Vector2Int(6, 11), TerrainType.WALL)
+        assert pathfinder.find_any_path(start, goal).success is False
     
     def test_pathfinding_stress(self):
         """Test pathfinding under stress conditions"""
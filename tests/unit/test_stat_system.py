@@ -90,7 +90,46 @@ class TestAttributeStats:
         
         # Cache should be faster (though this might be negligible for simple stats)
         assert second_calc_time <= first_calc_time * 2  # Allow some variance
+
+    def test_direct_attribute_assignment_invalidates_cache(self):
+        """Test assigning an attribute directly recalculates derived stats on next read"""
+        stats = AttributeStats(strength=10, fortitude=10)
+        derived = stats.derived_stats
+        assert stats.derived_stats is derived  # Cached while unchanged
+        
+        stats.fortitude = 15
+        assert stats.derived_stats['hp'] == 15 * 10 + 10 * 2
+        
+        # Non-attribute fields leave the cache alone
+        refreshed = stats.derived_stats
+        stats.entity_id = "entity"
+        assert stats.derived_stats is refreshed
     
+    def test_derived_stats_shared_and_read_only(self):
+        """Test cached derived stats are shared between reads and cannot be mutated"""
+        stats = AttributeStats(strength=15, fortitude=12)
+
+        derived = stats.derived_stats
+        assert stats.derived_stats is derived
+        assert derived.hp == derived['hp'] == 12 * 10 + 15 * 2
+
+        with pytest.raises(TypeError):
+            derived['hp'] = 1
+        with pytest.raises(TypeError):
+            derived.update(hp=1)
+        with pytest.raises(AttributeError):
+            derived.not_a_stat
+
+        # A copy is a plain, writable dict
+        copied = derived.copy()
+        copied['hp'] = 1
+        assert stats.derived_stats['hp'] == 150
+
+        # Recalculation produces a new mapping
+        stats.modify_attribute('strength', 20)
+        assert stats.derived_stats is not derived
+        assert stats.derived_stats.hp == 12 * 10 + 20 * 2
+
     def test_attribute_modification(self):
         """Test modifying attributes and cache invalidation"""
         stats = AttributeStats(strength=10)
@@ -141,6 +180,23 @@ class TestResourceManager:
         assert resources.rage.current_value == 0   # Starts empty
         assert resources.kwan.current_value == 50  # Starts at base
     
+    def test_resource_history_bounded(self):
+        """Test resource history keeps the most recent updates as flat rows"""
+        resources = ResourceManager(max_mp=100)
+        resources.mp.subtract(40)
+        
+        for _ in range(resources.history_max_length + 20):
+            resources.update(0.016)
+        
+        assert len(resources.resource_history) == resources.history_max_length
+        
+        latest = resources.get_resource_history()[-1]
+        assert latest['mp'] == {'current_value': resources.mp.current_value, 'max_value': 100}
+        assert latest['kwan']['current_value'] == resources.kwan.current_value
+        
+        resources.reset()
+        assert len(resources.resource_history) == 0
+    
     def test_mp_regeneration(self):
         """Test MP regeneration over time"""
         resources = ResourceManager(max_mp=100)
@@ -223,6 +279,10 @@ class TestModifierSystem:
         assert flat_mod.stat_name == "strength"
         assert flat_mod.value == 5
         assert not flat_mod.is_expired
+        
+        # Stat names built at runtime are interned
+        runtime_name = "".join(["str", "ength"])
+        assert Modifier(runtime_name, ModifierType.FLAT, 1).stat_name is flat_mod.stat_name
     
     def test_modifier_stacking_unlimited(self):
         """Test unlimited stacking of modifiers"""
@@ -238,6 +298,76 @@ class TestModifierSystem:
         final_value = manager.calculate_final_stat(10, "strength")
         assert final_value == 18  # 10 + 5 + 3
     
+    def test_clear_all_modifiers(self):
+        """Test clearing every modifier restores base stats"""
+        manager = ModifierManager()
+        manager.add_modifier(Modifier("strength", ModifierType.FLAT, 5))
+        manager.add_modifier(Modifier("wisdom", ModifierType.FLAT, 2))
+        assert manager.calculate_final_stat(10, "strength") == 15
+        
+        assert manager.clear_all_modifiers() == 2
+        assert manager.calculate_final_stat(10, "strength") == 10
+    
+    def test_modifier_restart(self):
+        """Test restarting a modifier reactivates it with a fresh duration"""
+        modifier = Modifier("strength", ModifierType.FLAT, 5, duration=10.0)
+        modifier_id = modifier.modifier_id
+        modifier.active = False
+        modifier.expires_at = 0.0
+        
+        modifier.restart()
+        
+        assert modifier.active
+        assert modifier.modifier_id == modifier_id
+        assert modifier.remaining_duration > 9.0
+    
+    def test_add_modifiers_bulk(self):
+        """Test bulk adding applies stacking rules in order"""
+        manager = ModifierManager()
+        added = manager.add_modifiers_bulk((
+            Modifier("strength", ModifierType.FLAT, 5),
+            Modifier("strength", ModifierType.FLAT, 3, stacking_rule=StackingRule.HIGHEST),
+            Modifier("wisdom", ModifierType.FLAT, 2),
+        ))
+        
+        # The lower HIGHEST modifier is rejected, as with add_modifier
+        assert added == 2
+        assert manager.calculate_final_stat(10, "strength") == 15
+        assert manager.calculate_final_stat(10, "wisdom") == 12
+    
+    def test_get_modifiers_for_stats(self):
+        """Test collecting modifiers for several stats in one call"""
+        manager = ModifierManager()
+        manager.add_modifier(Modifier("strength", ModifierType.FLAT, 5))
+        manager.add_modifier(Modifier("wisdom", ModifierType.FLAT, 2))
+        manager.add_modifier(Modifier("speed", ModifierType.FLAT, 1))
+        
+        mods = manager.get_modifiers_for_stats(("strength", "wisdom"))
+        assert sorted(m.stat_name for m in mods) == ["strength", "wisdom"]
+        assert manager.get_modifiers_for_stats(()) == []
+        assert manager.count_modifiers_for_stats(("strength", "wisdom")) == 2
+    
+    def test_modifier_stat_index(self):
+        """Test per-stat modifier lookups follow removal, clearing and deserialization"""
+        manager = ModifierManager()
+        strong = Modifier("strength", ModifierType.FLAT, 5)
+        manager.add_modifier(strong)
+        manager.add_modifier(Modifier("strength", ModifierType.PERCENTAGE, 0.1))
+        manager.add_modifier(Modifier("wisdom", ModifierType.FLAT, 2))
+        
+        assert len(manager.get_modifiers_for_stat("strength")) == 2
+        assert manager.get_modifiers_for_stat("speed") == []
+        
+        manager.remove_modifier(strong.modifier_id)
+        assert [m.modifier_type for m in manager.get_modifiers_for_stat("strength")] == [ModifierType.PERCENTAGE]
+        
+        restored = ModifierManager.from_dict(manager.to_dict())
+        assert len(restored.get_modifiers_for_stat("strength")) == 1
+        assert restored.calculate_final_stat(10, "wisdom") == 12
+        
+        manager.clear_all_modifiers()
+        assert manager.get_modifiers_for_stat("wisdom") == []
+    
     def test_modifier_stacking_replace(self):
         """Test replace stacking rule"""
         manager = ModifierManager()
@@ -286,6 +416,27 @@ class TestModifierSystem:
         # Should be expired and not apply
         assert manager.calculate_final_stat(10, "strength") == 10
     
+    def test_compiled_stat_cache(self):
+        """Test compiled stat calculations are reused until modifiers change or expire"""
+        manager = ModifierManager()
+        manager.add_modifier(Modifier("strength", ModifierType.FLAT, 3))
+        manager.add_modifier(Modifier("strength", ModifierType.PERCENTAGE, 0.5))
+        
+        assert manager.calculate_final_stat(10, "strength") == 19
+        calculations = manager.calculation_count
+        assert manager.calculate_final_stat(20, "strength") == 34  # Same compiled function
+        assert manager.calculation_count == calculations
+        
+        manager.add_modifier(Modifier("strength", ModifierType.MULTIPLICATIVE, 2.0))
+        assert manager.calculate_final_stat(10, "strength") == 39
+        assert manager.calculation_count == calculations + 1
+        
+        # Expiry is honoured even before update() deactivates the modifier
+        manager.add_modifier(Modifier("wisdom", ModifierType.FLAT, 5, duration=0.001))
+        assert manager.calculate_final_stat(10, "wisdom") == 15
+        time.sleep(0.002)
+        assert manager.calculate_final_stat(10, "wisdom") == 10
+    
     def test_complex_modifier_calculation(self):
         """Test complex modifier calculations with different types"""
         manager = ModifierManager()
@@ -356,6 +507,58 @@ class TestStatSystemIntegration:
         assert resources is not None
         assert resources.mp.max_value > 0  # Should be updated from derived stats
     
+    def test_modified_stats_recalculated_on_change(self):
+        """Test StatSystem keeps modified stats and recalculates only when modifiers change"""
+        world = World()
+        stat_system = StatSystem()
+        world.add_system(stat_system)
+        world.initialize()
+        
+        entity = world.create_entity(
+            AttributeStats(strength=15, fortitude=12),
+            ModifierManager()
+        )
+        modifiers = entity.get_component(ModifierManager)
+        base_hp = entity.get_component(AttributeStats).derived_stats['hp']
+        
+        world.update(0.016)
+        assert stat_system.get_modified_stats(entity)['hp'] == base_hp
+        
+        # Unchanged inputs: no new modifier calculations
+        calculations = modifiers.calculation_count
+        world.update(0.016)
+        assert modifiers.calculation_count == calculations
+        
+        modifiers.add_modifier(Modifier("hp", ModifierType.FLAT, 25))
+        world.update(0.016)
+        assert stat_system.get_modified_stats(entity)['hp'] == base_hp + 25
+        
+        # Rows are dropped once the entity is no longer processed
+        world.destroy_entity(entity.id)
+        world.update(0.016)
+        world.update(0.016)
+        assert stat_system.get_modified_stats(entity) == {}
+    
+    def test_stat_system_sleeps_while_idle(self):
+        """Test StatSystem requests sleep only when nothing changes on its own"""
+        stat_system = StatSystem()
+        entity = Entity()
+        entity.add_component(AttributeStats())
+        entity.add_component(ResourceManager())
+        entity.add_component(ModifierManager())
+        
+        # Full MP, no rage, permanent modifiers only
+        assert stat_system.update(0.016, [entity]) == StatSystem.IDLE_SLEEP_TIME
+        
+        # Pending expiry shortens the sleep
+        modifiers = entity.get_component(ModifierManager)
+        modifiers.add_modifier(Modifier("strength", ModifierType.FLAT, 2, duration=0.1))
+        assert stat_system.update(0.016, [entity]) <= 0.1
+        
+        # Regenerating MP needs every frame
+        entity.get_component(ResourceManager).mp.subtract(10)
+        assert stat_system.update(0.016, [entity]) is None
+    
     def test_stat_system_performance(self):
         """Test StatSystem performance with many entities"""
         world = World()